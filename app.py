@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import copy
 import json
 import time
 from datetime import datetime
@@ -12,12 +13,13 @@ st.set_page_config(
 )
 
 from modules.schemas import ExtractedData, Education, Experience
-from backend.ocr_engine import extract_text_from_file
-from backend.nlp_extractor import extract_from_text
-from backend.fraud_detector import detect_fraud
-from backend.health_scorer import calculate_health_score
+from backend.progressive import start_progressive_extraction, merge_user_edits
+from backend.incremental import IncrementalExtractor
+from backend.pipeline import get_pipeline
 from backend.submission_sim import submit_to_deet, generate_deet_payload
 from backend.voice_handler import VoiceInputSimulator, get_voice_handler
+from backend.metrics import get_metrics
+from backend.extraction_cache import get_extraction_cache
 from modules.evaluation import run_evaluation, get_evaluation_results
 
 COLORS = {
@@ -81,6 +83,14 @@ def init_session_state():
         st.session_state.fraud_report = None
     if 'raw_text' not in st.session_state:
         st.session_state.raw_text = ""
+    if 'progressive_job' not in st.session_state:
+        st.session_state.progressive_job = None
+    if 'progressive_baseline' not in st.session_state:
+        st.session_state.progressive_baseline = None
+    if 'progressive_pages' not in st.session_state:
+        st.session_state.progressive_pages = 0
+    if 'incremental_extractor' not in st.session_state:
+        st.session_state.incremental_extractor = IncrementalExtractor()
 
 
 def header():
@@ -94,6 +104,54 @@ def header():
         st.markdown(f"**Session:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
 
+def apply_progressive_snapshot(snapshot):
+    baseline = st.session_state.progressive_baseline
+    current = st.session_state.extracted_data
+    extracted = snapshot.extracted
+    if baseline is not None and current is not None:
+        extracted = merge_user_edits(snapshot.extracted, baseline, current)
+    
+    st.session_state.progressive_baseline = copy.deepcopy(snapshot.extracted)
+    st.session_state.progressive_pages = snapshot.pages_done
+    st.session_state.raw_text = snapshot.raw_text
+    st.session_state.extracted_data = extracted
+    st.session_state.health_score = snapshot.health
+    st.session_state.fraud_report = snapshot.fraud
+    st.session_state.processed = True
+
+
+def apply_pipeline_result(result):
+    st.session_state.raw_text = result.raw_text
+    st.session_state.extracted_data = result.extracted
+    st.session_state.health_score = result.health
+    st.session_state.fraud_report = result.fraud
+    st.session_state.processed = True
+
+
+def progressive_status():
+    job = st.session_state.progressive_job
+    if job is None:
+        return
+    
+    snapshot = job.snapshot()
+    
+    if snapshot.done:
+        apply_progressive_snapshot(snapshot)
+        st.session_state.progressive_job = None
+        if snapshot.error:
+            st.error(f"Error processing remaining pages: {snapshot.error}")
+        else:
+            st.success(f"Resume processed successfully! ({snapshot.pages_done} pages)")
+        return
+    
+    if snapshot.pages_done != st.session_state.progressive_pages:
+        apply_progressive_snapshot(snapshot)
+    
+    st.info(f"Processed {snapshot.pages_done} page(s). Remaining pages are still being read; fields you haven't edited will update automatically.")
+    time.sleep(1)
+    st.rerun()
+
+
 def upload_section():
     st.markdown("### 1. Upload Resume")
     
@@ -119,77 +177,54 @@ def upload_section():
                                         ["basic", "detailed", "minimal"])
             
             if st.button("Load Sample"):
+                st.session_state.progressive_job = None
                 sample_text = VoiceInputSimulator.get_sample_text(sample_level)
-                st.session_state.raw_text = sample_text
-                st.session_state.extracted_data = extract_from_text(sample_text)
-                st.session_state.processed = True
+                apply_pipeline_result(get_pipeline().run_text(sample_text))
                 st.success("Voice input processed!")
                 st.rerun()
     
     if uploaded_file is not None:
+        progressive = st.checkbox(
+            "Show first page while remaining pages process",
+            value=True,
+            help="Fills the form from page 1 right away and updates it as later pages finish"
+        )
+        
         if st.button("Process Resume", type="primary"):
-            with st.spinner("Extracting text from resume..."):
-                try:
-                    raw_text = extract_text_from_file(uploaded_file)
-                    st.session_state.raw_text = raw_text
-                    
-                    with st.spinner("Analyzing resume with AI..."):
-                        extracted = extract_from_text(raw_text)
-                        st.session_state.extracted_data = extracted
-                        
-                        health = calculate_health_score(
-                            extracted.email,
-                            extracted.phone,
-                            len(extracted.education),
-                            len(extracted.experience),
-                            extracted.skills,
-                            extracted.location
-                        )
-                        st.session_state.health_score = health
-                        
-                        fraud = detect_fraud(
-                            extracted.phone,
-                            extracted.email,
-                            extracted.skills,
-                            len(extracted.experience),
-                            raw_text
-                        )
-                        st.session_state.fraud_report = fraud
-                        
-                        st.session_state.processed = True
-                    st.success("Resume processed successfully!")
-                    st.rerun()
+            st.session_state.progressive_job = None
+            if progressive:
+                with st.spinner("Extracting text from first page..."):
+                    try:
+                        job = start_progressive_extraction(uploaded_file)
+                        st.session_state.progressive_job = job
+                        st.session_state.progressive_baseline = None
+                        apply_progressive_snapshot(job.snapshot())
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error processing resume: {str(e)}")
+                        st.info("Try using manual text input below")
+            else:
+                with st.spinner("Extracting and analyzing resume..."):
+                    try:
+                        result = get_pipeline().run_file(uploaded_file.getvalue(), uploaded_file.name)
+                        apply_pipeline_result(result)
+                        st.success("Resume processed successfully!")
+                        st.rerun()
                     
-                except Exception as e:
-                    st.error(f"Error processing resume: {str(e)}")
-                    st.info("Try using manual text input below")
+                    except Exception as e:
+                        st.error(f"Error processing resume: {str(e)}")
+                        st.info("Try using manual text input below")
     
     with st.expander("Manual Text Input (Fallback)"):
         manual_text = st.text_area("Paste resume text here:", height=150)
         if st.button("Process Text Input"):
             if manual_text:
+                st.session_state.progressive_job = None
                 st.session_state.raw_text = manual_text
-                extracted = extract_from_text(manual_text)
-                st.session_state.extracted_data = extracted
-                
-                health = calculate_health_score(
-                    extracted.email,
-                    extracted.phone,
-                    len(extracted.education),
-                    len(extracted.experience),
-                    extracted.skills,
-                    extracted.location
-                )
-                st.session_state.health_score = health
-                
-                fraud = detect_fraud(
-                    extracted.phone,
-                    extracted.email,
-                    extracted.skills,
-                    len(extracted.experience),
-                    manual_text
-                )
-                st.session_state.fraud_report = fraud
+                update = st.session_state.incremental_extractor.update(manual_text)
+                st.session_state.extracted_data = update.extracted
+                st.session_state.health_score = update.health
+                st.session_state.fraud_report = update.fraud
                 
                 st.session_state.processed = True
                 st.success("Text processed successfully!")
@@ -319,6 +354,9 @@ def analysis_section():
                 st.write(f"{severity_icon} {flag.message}")
         else:
             st.success("No fraud indicators detected ✓")
+        
+        if fraud.skipped_rules:
+            st.caption(f"Risk already High; skipped checks: {', '.join(fraud.skipped_rules)}")
 
 
 def submission_section():
@@ -401,6 +439,49 @@ def evaluation_section():
         st.dataframe(results_df, use_container_width=True)
 
 
+def diagnostics_panel():
+    metrics = get_metrics()
+    
+    with st.sidebar.expander("Diagnostics", expanded=False):
+        metrics.enabled = st.checkbox("Collect stage timings", value=metrics.enabled)
+        
+        stats = metrics.stage_stats()
+        if stats:
+            st.dataframe(pd.DataFrame([
+                {
+                    "Stage": s.stage,
+                    "Count": s.count,
+                    "p50 ms": s.p50_ms,
+                    "p95 ms": s.p95_ms,
+                    "p99 ms": s.p99_ms,
+                    "Max ms": s.max_ms
+                }
+                for s in stats
+            ]), use_container_width=True, hide_index=True)
+        else:
+            st.caption("No timings recorded yet.")
+        
+        counters = metrics.counters()
+        if counters:
+            st.table(pd.DataFrame([{"Counter": name, "Value": value} for name, value in counters.items()]))
+        
+        cache = get_extraction_cache().stats()
+        st.caption(f"Extraction cache: {cache['entries']} entries, {cache['hit_rate'] * 100:.0f}% hit rate")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "Prometheus",
+                metrics.to_prometheus(),
+                file_name="deet_metrics.prom",
+                mime="text/plain"
+            )
+        with col2:
+            if st.button("Reset"):
+                metrics.reset()
+                st.rerun()
+
+
 def main():
     init_session_state()
     
@@ -425,6 +506,10 @@ def main():
     with tab5:
         evaluation_section()
     
+    progressive_status()
+    
+    diagnostics_panel()
+    
     st.markdown("---")
     st.markdown("""
     <div style='text-align: center; color: #666;'>
@@ -1,6 +1,15 @@
-from .ocr_engine import OCREngine, extract_text_from_file
-from .nlp_extractor import NLPExtractor, extract_from_text
-from .fraud_detector import FraudDetector, detect_fraud
-from .health_scorer import HealthScorer, calculate_health_score
+from .ocr_engine import OCREngine, get_ocr_engine, extract_text_from_file, extract_document_from_file, field_confidence
+from .ocr_cache import OCRCache, get_ocr_cache
+from .nlp_extractor import NLPExtractor, LazyExtractedData, BatchExtractor, get_extractor, extract_from_text, extract_lazy, extract_many, extract_stream
+from .fraud_detector import FraudDetector, get_fraud_detector, detect_fraud
+from .duplicate_index import DuplicateIndex, get_duplicate_index
+from .keyword_scanner import KeywordScanner, get_keyword_scanner
+from .health_scorer import HealthScorer, get_health_scorer, calculate_health_score
+from .batch_scoring import BatchScorer, get_batch_scorer, score_frame
 from .voice_handler import VoiceHandler, VoiceInputSimulator, get_voice_handler, process_voice_text
-from .submission_sim import DEETSubmissionSimulator, submit_to_deet, generate_deet_payload
+from .submission_sim import DEETSubmissionSimulator, get_submission_simulator, submit_to_deet, generate_deet_payload
+from .ner import SpacyNER, get_ner
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .sections import SectionIndex, build_section_index
+from .incremental import IncrementalExtractor
+from .pipeline import ResumePipeline, get_pipeline, run_pipeline
@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class KeywordAutomaton:
+    def __init__(self, patterns: Iterable[str], word_boundary: bool = False):
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        self.word_boundary = word_boundary
+        
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        
+        for index, pattern in enumerate(self.patterns):
+            self._insert(pattern, index)
+        self._link()
+    
+    def __len__(self) -> int:
+        return len(self.patterns)
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            
+            if out[state]:
+                end = i + 1
+                for index in out[state]:
+                    start = end - len(patterns[index])
+                    if self.word_boundary and not self._is_word_bounded(text, start, end):
+                        continue
+                    yield start, end, patterns[index]
+    
+    def find_all(self, text: str) -> Set[str]:
+        if self.word_boundary:
+            return {pattern for _, _, pattern in self.iter_matches(text)}
+        
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        found: Set[int] = set()
+        
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        
+        return {self.patterns[index] for index in found}
+    
+    def _insert(self, pattern: str, index: int):
+        state = 0
+        for ch in pattern:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][ch] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(index)
+    
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(ch, 0)
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+    
+    def _is_word_bounded(self, text: str, start: int, end: int) -> bool:
+        if start > 0 and text[start - 1].isalnum() and text[start].isalnum():
+            return False
+        if end < len(text) and text[end].isalnum() and text[end - 1].isalnum():
+            return False
+        return True
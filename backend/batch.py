@@ -0,0 +1,289 @@
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from modules.config import BATCH_WORKERS, BATCH_FILE_EXTENSIONS, BATCH_FLUSH_RECORDS, BATCH_FLUSH_SECONDS
+from modules.schemas import BatchReport
+from backend.pipeline import ResumePipeline, result_to_dict
+
+_worker_pipeline: Optional[ResumePipeline] = None
+
+
+def _init_worker(ocr_workers: Optional[int] = None):
+    global _worker_pipeline
+    from backend.ocr_engine import OCREngine, default_ocr_cache
+    
+    if ocr_workers == 1:
+        os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    _worker_pipeline = ResumePipeline(
+        ocr_engine=OCREngine(max_workers=ocr_workers, cache=default_ocr_cache()),
+        use_cache=False
+    )
+
+
+def _process_path(path: str, relative_path: str) -> Dict[str, Any]:
+    if _worker_pipeline is None:
+        _init_worker()
+    
+    try:
+        with open(path, 'rb') as f:
+            file_bytes = f.read()
+        record = result_to_dict(_worker_pipeline.run_file(file_bytes, os.path.basename(path)))
+        return {"path": relative_path, "ok": True, **record}
+    except Exception as e:
+        return {"path": relative_path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+def find_resumes(root: str, extensions: Iterable[str] = BATCH_FILE_EXTENSIONS) -> List[str]:
+    suffixes = tuple(f".{ext.lower().lstrip('.')}" for ext in extensions)
+    found = []
+    for directory, dirs, files in os.walk(root):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(suffixes):
+                found.append(os.path.relpath(os.path.join(directory, name), root))
+    return found
+
+
+class Checkpoint:
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, str] = {}
+        
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').rsplit('\t', 1)
+                    if len(parts) == 2:
+                        self.entries[parts[0]] = parts[1]
+    
+    def is_done(self, key: str, retry_failed: bool = False) -> bool:
+        status = self.entries.get(key)
+        return status == 'ok' or (status == 'failed' and not retry_failed)
+    
+    def record(self, items: List[Tuple[str, str]]):
+        if not items:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for key, status in items:
+                f.write(f"{key}\t{status}\n")
+                self.entries[key] = status
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BatchIngestion:
+    def __init__(
+        self,
+        input_dir: str,
+        output_path: str,
+        checkpoint_path: Optional[str] = None,
+        workers: Optional[int] = None,
+        extensions: Iterable[str] = BATCH_FILE_EXTENSIONS,
+        retry_failed: bool = False,
+        flush_records: int = BATCH_FLUSH_RECORDS,
+        flush_seconds: float = BATCH_FLUSH_SECONDS,
+        progress: bool = True
+    ):
+        self.input_dir = input_dir
+        self.output_path = output_path
+        self.checkpoint = Checkpoint(checkpoint_path or f"{output_path}.checkpoint")
+        self.workers = max(1, workers if workers is not None else BATCH_WORKERS)
+        self.extensions = list(extensions)
+        self.retry_failed = retry_failed
+        self.flush_records = max(1, flush_records)
+        self.flush_seconds = flush_seconds
+        self.progress = progress
+        self.report = BatchReport(workers=self.workers)
+        
+        self._buffer: List[Tuple[str, Dict[str, Any]]] = []
+        self._last_flush = 0.0
+        self._started = 0.0
+        self._last_progress = 0.0
+        self._pending_total = 0
+        self._progress_width = 0
+    
+    def file_key(self, relative_path: str) -> str:
+        stat = os.stat(os.path.join(self.input_dir, relative_path))
+        return f"{relative_path}|{stat.st_size}|{stat.st_mtime_ns}"
+    
+    def pending_files(self) -> List[Tuple[str, str]]:
+        pending = []
+        for relative_path in find_resumes(self.input_dir, self.extensions):
+            key = self.file_key(relative_path)
+            if self.checkpoint.is_done(key, self.retry_failed):
+                self.report.skipped += 1
+            else:
+                pending.append((relative_path, key))
+        return pending
+    
+    def run(self) -> BatchReport:
+        self.report = BatchReport(workers=self.workers)
+        pending = self.pending_files()
+        self._pending_total = len(pending)
+        self._started = self._last_flush = time.perf_counter()
+        
+        try:
+            if self.workers == 1 or len(pending) <= 1:
+                self.report.workers = 1
+                _init_worker()
+                for relative_path, key in pending:
+                    self._add(key, _process_path(os.path.join(self.input_dir, relative_path), relative_path))
+            else:
+                self._run_pool(pending)
+        finally:
+            self._flush()
+            if self.progress:
+                self._print_progress(final=True)
+        
+        return self.report
+    
+    def _run_pool(self, pending: List[Tuple[str, str]]):
+        queue = deque(pending)
+        suspects: deque = deque()
+        isolated = set()
+        max_in_flight = self.workers * 2
+        pool = self._new_pool()
+        in_flight: Dict[Future, Tuple[str, str, ProcessPoolExecutor]] = {}
+        
+        try:
+            while queue or suspects or in_flight:
+                if suspects:
+                    if not in_flight:
+                        relative_path, key = suspects.popleft()
+                        isolated.add(key)
+                        future = pool.submit(_process_path, os.path.join(self.input_dir, relative_path), relative_path)
+                        in_flight[future] = (relative_path, key, pool)
+                else:
+                    while queue and len(in_flight) < max_in_flight:
+                        relative_path, key = queue.popleft()
+                        future = pool.submit(_process_path, os.path.join(self.input_dir, relative_path), relative_path)
+                        in_flight[future] = (relative_path, key, pool)
+                
+                done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    relative_path, key, future_pool = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                    except BrokenProcessPool:
+                        if future_pool is pool:
+                            pool.shutdown(wait=False, cancel_futures=True)
+                            pool = self._new_pool()
+                        if key not in isolated:
+                            suspects.append((relative_path, key))
+                            continue
+                        record = {"path": relative_path, "ok": False, "error": "BrokenProcessPool: worker crashed"}
+                    except Exception as e:
+                        record = {"path": relative_path, "ok": False, "error": f"{type(e).__name__}: {e}"}
+                    self._add(key, record)
+                
+                if not done:
+                    self._maybe_flush()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+    
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(1,))
+    
+    def _add(self, key: str, record: Dict[str, Any]):
+        self.report.total += 1
+        if record.get("ok"):
+            self.report.succeeded += 1
+        else:
+            self.report.failed += 1
+        
+        self.report.elapsed_seconds = time.perf_counter() - self._started
+        if self.report.elapsed_seconds > 0:
+            self.report.resumes_per_second = self.report.total / self.report.elapsed_seconds
+        
+        self._buffer.append((key, record))
+        self._maybe_flush()
+    
+    def _maybe_flush(self):
+        now = time.perf_counter()
+        if len(self._buffer) >= self.flush_records or now - self._last_flush >= self.flush_seconds:
+            self._flush()
+        if self.progress and now - self._last_progress >= 1.0:
+            self._last_progress = now
+            self._print_progress()
+    
+    def _flush(self):
+        self._last_flush = time.perf_counter()
+        if not self._buffer:
+            return
+        
+        buffer, self._buffer = self._buffer, []
+        with gzip.open(self.output_path, 'at', encoding='utf-8') as f:
+            for _, record in buffer:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        
+        self.checkpoint.record([(key, 'ok' if record.get("ok") else 'failed') for key, record in buffer])
+    
+    def _print_progress(self, final: bool = False):
+        report = self.report
+        remaining = self._pending_total - report.total
+        rate = report.resumes_per_second
+        eta = remaining / rate if rate > 0 else 0.0
+        minutes, seconds = divmod(int(eta), 60)
+        hours, minutes = divmod(minutes, 60)
+        
+        line = (
+            f"{report.total}/{self._pending_total} files | {rate:.2f} files/s | "
+            f"ETA {hours:d}:{minutes:02d}:{seconds:02d} | failed {report.failed} | skipped {report.skipped}"
+        )
+        self._progress_width = max(self._progress_width, len(line))
+        sys.stderr.write(f"\r{line.ljust(self._progress_width)}" + ("\n" if final else ""))
+        sys.stderr.flush()
+
+
+def read_results(path: str) -> Iterable[Dict[str, Any]]:
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract a directory of resumes to gzip'd JSONL")
+    parser.add_argument("input_dir")
+    parser.add_argument("-o", "--output", required=True, help="Output path, e.g. results.jsonl.gz")
+    parser.add_argument("--checkpoint", help="Checkpoint path (defaults to <output>.checkpoint)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument("--extensions", nargs="+", default=BATCH_FILE_EXTENSIONS)
+    parser.add_argument("--retry-failed", action="store_true", help="Reprocess files that failed in an earlier run")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args()
+    
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"Not a directory: {args.input_dir}")
+    
+    ingestion = BatchIngestion(
+        args.input_dir,
+        args.output,
+        checkpoint_path=args.checkpoint,
+        workers=args.workers,
+        extensions=args.extensions,
+        retry_failed=args.retry_failed,
+        progress=not args.quiet
+    )
+    
+    try:
+        report = ingestion.run()
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted; finished files are checkpointed. Re-run the same command to resume.\n")
+        sys.exit(130)
+    
+    print(
+        f"Processed {report.total} files ({report.succeeded} ok, {report.failed} failed, "
+        f"{report.skipped} skipped) in {report.elapsed_seconds:.1f}s with {report.workers} workers"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from modules.config import (
+    FRAUD_CHECK_SCORES, FRAUD_MAX_SKILLS, FRAUD_MIN_WORKING_AGE, FRAUD_RISK_MODERATE, FRAUD_RISK_HIGH,
+    HEALTH_WEIGHTS, HEALTH_TARGET_SKILLS, HEALTH_POINTS_PER_SKILL,
+    SCORING_CHUNK_ROWS, SCORING_PHONE_WIDTH, SCORING_EMAIL_WIDTH
+)
+from modules.schemas import FraudFlag, FraudReport, HealthScore, KeywordHit
+from backend.fraud_detector import FraudDetector, NON_DIGIT_REGEX, PHONE_PREFIXES, EMAIL_PATTERN
+from backend.health_scorer import HealthScorer, get_health_scorer
+from backend.keyword_scanner import KeywordScanner, get_keyword_scanner
+from backend.metrics import timed
+
+FRAME_COLUMNS = ('phone', 'email', 'skills_count', 'education_count', 'experience_count', 'location', 'text', 'age')
+RISK_LABELS = np.array(['Low', 'Moderate', 'High'], dtype=object)
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+PREFIX_CODES = [ord(prefix) for prefix in PHONE_PREFIXES]
+
+
+def _text_values(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame.columns:
+        return np.full(len(frame), '', dtype=object)
+    values = frame[name].to_numpy(dtype=object, na_value='')
+    if pd.api.types.infer_dtype(values, skipna=False) not in ('string', 'empty'):
+        values = np.array([value if isinstance(value, str) else str(value) for value in values], dtype=object)
+    return values
+
+
+def _number_values(frame: pd.DataFrame, name: str) -> np.ndarray:
+    if name not in frame.columns:
+        return np.zeros(len(frame), dtype=np.int64)
+    return pd.to_numeric(frame[name], errors='coerce').fillna(0).to_numpy()
+
+
+def _skills_counts(frame: pd.DataFrame) -> np.ndarray:
+    if 'skills_count' not in frame.columns and 'skills' in frame.columns:
+        return frame['skills'].map(lambda skills: len(skills) if isinstance(skills, (list, tuple)) else 0).to_numpy(np.int64)
+    return _number_values(frame, 'skills_count').astype(np.int64)
+
+
+def prepare_columns(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    columns = {name: _text_values(frame, name) for name in ('phone', 'email', 'location', 'text')}
+    columns.update({name: _number_values(frame, name) for name in ('education_count', 'experience_count', 'age')})
+    columns['skills_count'] = _skills_counts(frame)
+    return columns
+
+
+def _code_points(values: np.ndarray, max_width: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    width = int(min(max_width, lengths.max(initial=1)))
+    fits = lengths <= width
+    codes = np.array(np.where(fits, values, ''), dtype=f'U{width}').view(np.uint32).reshape(len(values), width)
+    ascii_only = fits & (codes < 128).all(axis=1) & (codes != ord('\n')).all(axis=1)
+    return codes, lengths, ascii_only
+
+
+def _phone_chunk(phones: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    codes, _, ascii_only = _code_points(phones, SCORING_PHONE_WIDTH)
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    first_digit = codes[np.arange(len(phones)), is_digit.argmax(axis=1)]
+    length_invalid = is_digit.sum(axis=1) != 10
+    prefix_invalid = ~np.isin(first_digit, PREFIX_CODES)
+    
+    for i in np.flatnonzero(~ascii_only).tolist():
+        digits = NON_DIGIT_REGEX.sub('', phones[i])
+        length_invalid[i] = len(digits) != 10
+        prefix_invalid[i] = not digits.startswith(PHONE_PREFIXES)
+    return length_invalid, prefix_invalid
+
+
+def _email_chunk(emails: np.ndarray) -> Tuple[np.ndarray]:
+    codes, lengths, ascii_only = _code_points(emails, SCORING_EMAIL_WIDTH)
+    positions = np.arange(codes.shape[1])
+    letter = ((codes >= ord('A')) & (codes <= ord('Z'))) | ((codes >= ord('a')) & (codes <= ord('z')))
+    domain_char = letter | ((codes >= ord('0')) & (codes <= ord('9'))) | (codes == ord('.')) | (codes == ord('-'))
+    local_char = domain_char | (codes == ord('_')) | (codes == ord('%')) | (codes == ord('+'))
+    at = codes == ord('@')
+    dot = codes == ord('.')
+    
+    at_position = at.argmax(axis=1)
+    last_dot = codes.shape[1] - 1 - dot[:, ::-1].argmax(axis=1)
+    allowed = np.where(
+        positions < at_position[:, None],
+        local_char,
+        np.where(positions > last_dot[:, None], letter, domain_char)
+    )
+    valid = (
+        (at.sum(axis=1) == 1) & (at_position > 0) & dot.any(axis=1)
+        & (last_dot > at_position + 1) & (lengths - last_dot >= 3)
+        & (allowed | at | (positions >= lengths[:, None])).all(axis=1)
+    )
+    
+    for i in np.flatnonzero(~ascii_only).tolist():
+        valid[i] = EMAIL_REGEX.match(emails[i]) is not None
+    return (~valid,)
+
+
+def _in_chunks(check, values: np.ndarray, rows: int = SCORING_CHUNK_ROWS) -> Tuple[np.ndarray, ...]:
+    parts = [check(values[start:start + rows]) for start in range(0, max(len(values), 1), rows)]
+    return tuple(np.concatenate(column)[:len(values)] for column in zip(*parts))
+
+
+class BatchScorer:
+    def __init__(
+        self,
+        keyword_scanner: Optional[KeywordScanner] = None,
+        health_scorer: Optional[HealthScorer] = None
+    ):
+        self.keyword_scanner = keyword_scanner or get_keyword_scanner()
+        self.health_scorer = health_scorer or get_health_scorer()
+    
+    def health(self, frame: pd.DataFrame, with_suggestions: bool = True) -> pd.DataFrame:
+        return self._health(prepare_columns(frame), frame.index, with_suggestions)
+    
+    @timed('batch_scoring.health')
+    def _health(self, columns: Dict[str, np.ndarray], index: pd.Index, with_suggestions: bool) -> pd.DataFrame:
+        email_present = columns['email'] != ''
+        phone_present = columns['phone'] != ''
+        education_detected = columns['education_count'] > 0
+        experience_detected = columns['experience_count'] > 0
+        address_detected = columns['location'] != ''
+        skills_count = columns['skills_count']
+        
+        skills_points = np.where(
+            skills_count >= HEALTH_TARGET_SKILLS,
+            HEALTH_WEIGHTS['skills'],
+            np.where(skills_count > 0, skills_count * HEALTH_POINTS_PER_SKILL, 0)
+        )
+        score = (
+            email_present * HEALTH_WEIGHTS['email']
+            + phone_present * HEALTH_WEIGHTS['phone']
+            + education_detected * HEALTH_WEIGHTS['education']
+            + experience_detected * HEALTH_WEIGHTS['experience']
+            + address_detected * HEALTH_WEIGHTS['location']
+            + skills_points
+        ).astype(np.int64)
+        
+        result = pd.DataFrame({
+            'health_score': score,
+            'email_present': email_present,
+            'phone_present': phone_present,
+            'education_detected': education_detected,
+            'experience_detected': experience_detected,
+            'skills_count': skills_count,
+            'address_detected': address_detected,
+        }, index=index)
+        
+        if with_suggestions:
+            result['suggestions'] = self._suggestions(
+                email_present, phone_present, education_detected, experience_detected, skills_count, address_detected
+            )
+        return result
+    
+    def _suggestions(self, email, phone, education, experience, skills_count, location) -> List[List[str]]:
+        skills_key = np.clip(skills_count, 0, HEALTH_TARGET_SKILLS)
+        codes = (
+            (email.astype(np.int64) << 0) | (phone.astype(np.int64) << 1) | (education.astype(np.int64) << 2)
+            | (experience.astype(np.int64) << 3) | (location.astype(np.int64) << 4)
+        ) * (HEALTH_TARGET_SKILLS + 1) + skills_key
+        
+        suggestions: Dict[int, List[str]] = {}
+        for code in np.unique(codes).tolist():
+            flags, skills = divmod(code, HEALTH_TARGET_SKILLS + 1)
+            suggestions[code] = self.health_scorer.calculate(
+                'x' if flags & 1 else '',
+                'x' if flags & 2 else '',
+                1 if flags & 4 else 0,
+                1 if flags & 8 else 0,
+                [''] * skills,
+                'x' if flags & 16 else ''
+            ).suggestions
+        
+        return [list(suggestions[code]) for code in codes.tolist()]
+    
+    def fraud(self, frame: pd.DataFrame, with_flags: bool = True) -> pd.DataFrame:
+        return self._fraud(prepare_columns(frame), frame.index, with_flags)
+    
+    @timed('batch_scoring.fraud')
+    def _fraud(self, columns: Dict[str, np.ndarray], index: pd.Index, with_flags: bool) -> pd.DataFrame:
+        phones, emails, texts = columns['phone'], columns['email'], columns['text']
+        skills_count, experience, age = columns['skills_count'], columns['experience_count'], columns['age']
+        
+        phone_present = phones != ''
+        phone_length, phone_prefix = _in_chunks(_phone_chunk, phones)
+        phone_length &= phone_present
+        phone_prefix &= phone_present & ~phone_length
+        email_invalid = (emails != '') & _in_chunks(_email_chunk, emails)[0]
+        excessive_skills = skills_count > FRAUD_MAX_SKILLS
+        age_mismatch = (age > 0) & (experience > 0) & (experience > age - FRAUD_MIN_WORKING_AGE)
+        
+        scan = self.keyword_scanner.scan
+        keyword_hits: Dict[int, List[KeywordHit]] = {}
+        for i in np.flatnonzero(texts != '').tolist():
+            hits = scan(texts[i])
+            if hits:
+                keyword_hits[i] = hits
+        keyword_scores = np.zeros(len(texts), dtype=np.int64)
+        keyword_counts = np.zeros(len(texts), dtype=np.int64)
+        for i, hits in keyword_hits.items():
+            keyword_scores[i] = sum(hit.score for hit in hits)
+            keyword_counts[i] = len(hits)
+        
+        total = (
+            phone_length * FRAUD_CHECK_SCORES['phone_length']
+            + phone_prefix * FRAUD_CHECK_SCORES['phone_prefix']
+            + email_invalid * FRAUD_CHECK_SCORES['email_invalid']
+            + excessive_skills * FRAUD_CHECK_SCORES['excessive_skills']
+            + age_mismatch * FRAUD_CHECK_SCORES['experience_age_mismatch']
+            + keyword_scores
+        )
+        score = np.minimum(total, 100).astype(np.int64)
+        labels = RISK_LABELS[(score >= FRAUD_RISK_MODERATE).astype(np.int64) + (score >= FRAUD_RISK_HIGH)]
+        
+        result = pd.DataFrame({
+            'fraud_risk_score': score,
+            'risk_label': labels,
+            'phone_invalid': phone_length | phone_prefix,
+            'email_invalid': email_invalid,
+            'excessive_skills': excessive_skills,
+            'experience_age_mismatch': age_mismatch,
+            'keyword_hits': keyword_counts,
+        }, index=index)
+        
+        if with_flags:
+            result['fraud_flags'] = self._flags(
+                columns, (phone_length, phone_prefix, email_invalid, excessive_skills, age_mismatch), keyword_hits
+            )
+        return result
+    
+    def _flags(self, columns: Dict[str, np.ndarray], masks, keyword_hits: Dict[int, List[KeywordHit]]) -> List[List[FraudFlag]]:
+        phone_length, phone_prefix, email_invalid, excessive_skills, age_mismatch = masks
+        phones, emails, skills_count = columns['phone'], columns['email'], columns['skills_count']
+        flags: List[List[FraudFlag]] = [[] for _ in range(len(phones))]
+        
+        for i in np.flatnonzero(phone_length).tolist():
+            flags[i].append(FraudFlag(
+                check="phone_invalid",
+                severity="high",
+                message=f"Phone number must be 10 digits. Found: {phones[i]}"
+            ))
+        for i in np.flatnonzero(phone_prefix).tolist():
+            flags[i].append(FraudFlag(
+                check="phone_invalid",
+                severity="medium",
+                message=f"Phone number should start with 6, 7, 8, or 9. Found: {phones[i]}"
+            ))
+        for i in np.flatnonzero(email_invalid).tolist():
+            flags[i].append(FraudFlag(
+                check="email_invalid",
+                severity="medium",
+                message=f"Invalid email format: {emails[i]}"
+            ))
+        for i in np.flatnonzero(excessive_skills).tolist():
+            flags[i].append(FraudFlag(
+                check="excessive_skills",
+                severity="medium",
+                message=f"Excessive skills detected ({skills_count[i]}). This may indicate false information."
+            ))
+        for i in np.flatnonzero(age_mismatch).tolist():
+            flags[i].append(FraudFlag(
+                check="experience_age_mismatch",
+                severity="high",
+                message=f"Experience ({columns['experience_count'][i]} years) exceeds plausible age ({columns['age'][i]} years)"
+            ))
+        
+        for i, hits in keyword_hits.items():
+            for hit in hits:
+                flags[i].append(FraudFlag(
+                    check="suspicious_keyword",
+                    severity=hit.severity,
+                    message=f"Suspicious keyword detected: '{hit.rule}'"
+                ))
+        return flags
+    
+    def score(self, frame: pd.DataFrame, with_details: bool = True) -> pd.DataFrame:
+        columns = prepare_columns(frame)
+        return pd.concat([
+            self._health(columns, frame.index, with_details),
+            self._fraud(columns, frame.index, with_details)
+        ], axis=1)
+    
+    def parity_mismatches(self, frame: pd.DataFrame, limit: Optional[int] = None) -> List[Tuple[int, str]]:
+        rows = frame.head(limit) if limit else frame
+        scored = self.score(rows)
+        detector = FraudDetector(duplicate_index=None, keyword_scanner=self.keyword_scanner, short_circuit=False)
+        mismatches = []
+        
+        for i, row in enumerate(rows.to_dict('records')):
+            phone = '' if pd.isna(row.get('phone')) else str(row.get('phone', ''))
+            email = '' if pd.isna(row.get('email')) else str(row.get('email', ''))
+            location = '' if pd.isna(row.get('location')) else str(row.get('location', ''))
+            text = '' if pd.isna(row.get('text')) else str(row.get('text', ''))
+            skills = [''] * int(scored['skills_count'].iat[i])
+            age = row.get('age')
+            
+            health = self.health_scorer.calculate(
+                email, phone, row.get('education_count', 0) or 0, row.get('experience_count', 0) or 0, skills, location
+            )
+            fraud = detector.analyze(
+                phone, email, skills, row.get('experience_count', 0) or 0, text,
+                None if age is None or pd.isna(age) else age
+            )
+            
+            if health != health_score_at(scored, i):
+                mismatches.append((i, 'health'))
+            if fraud != fraud_report_at(scored, i):
+                mismatches.append((i, 'fraud'))
+        
+        return mismatches
+
+
+def health_score_at(scored: pd.DataFrame, position: int) -> HealthScore:
+    row = scored.iloc[position]
+    return HealthScore(
+        total_score=int(row['health_score']),
+        email_present=bool(row['email_present']),
+        phone_present=bool(row['phone_present']),
+        education_detected=bool(row['education_detected']),
+        experience_detected=bool(row['experience_detected']),
+        skills_count=int(row['skills_count']),
+        address_detected=bool(row['address_detected']),
+        suggestions=list(row['suggestions']) if 'suggestions' in scored.columns else []
+    )
+
+
+def fraud_report_at(scored: pd.DataFrame, position: int) -> FraudReport:
+    row = scored.iloc[position]
+    return FraudReport(
+        fraud_risk_score=int(row['fraud_risk_score']),
+        risk_label=row['risk_label'],
+        flags=list(row['fraud_flags']) if 'fraud_flags' in scored.columns else []
+    )
+
+
+_default_batch_scorer: Optional[BatchScorer] = None
+_default_batch_scorer_lock = threading.Lock()
+
+
+def get_batch_scorer() -> BatchScorer:
+    global _default_batch_scorer
+    with _default_batch_scorer_lock:
+        if _default_batch_scorer is None:
+            _default_batch_scorer = BatchScorer()
+        return _default_batch_scorer
+
+
+def score_health_frame(frame: pd.DataFrame, with_suggestions: bool = True) -> pd.DataFrame:
+    return get_batch_scorer().health(frame, with_suggestions)
+
+
+def score_fraud_frame(frame: pd.DataFrame, with_flags: bool = True) -> pd.DataFrame:
+    return get_batch_scorer().fraud(frame, with_flags)
+
+
+def score_frame(frame: pd.DataFrame, with_details: bool = True) -> pd.DataFrame:
+    return get_batch_scorer().score(frame, with_details)
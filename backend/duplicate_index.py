@@ -0,0 +1,269 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Iterable, List, Optional, Tuple
+import numpy as np
+from modules.config import (
+    DUPLICATE_INDEX_PATH, DUPLICATE_HASH_KEY, DUPLICATE_MINHASH_PERMUTATIONS, DUPLICATE_LSH_BANDS,
+    DUPLICATE_SHINGLE_SIZE, DUPLICATE_MIN_TOKENS, DUPLICATE_SIMILARITY_THRESHOLD, DUPLICATE_MAX_CANDIDATES,
+    DUPLICATE_MINHASH_SEED
+)
+from modules.schemas import DuplicateMatch
+from backend.metrics import timed
+
+TOKEN_PATTERN = re.compile(r'\w+')
+NON_DIGIT_REGEX = re.compile(r'[^\d]')
+SHINGLE_MULTIPLIER = np.uint64(0x100000001B3)
+BAND_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+LOW_32_BITS = np.uint64(0xFFFFFFFF)
+SHIFT_32 = np.uint64(32)
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS registrations (
+        id INTEGER PRIMARY KEY,
+        registration_id TEXT NOT NULL,
+        phone_hash BLOB,
+        email_hash BLOB,
+        signature BLOB,
+        created REAL NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_registrations_phone ON registrations(phone_hash)",
+    "CREATE INDEX IF NOT EXISTS idx_registrations_email ON registrations(email_hash)",
+    """CREATE TABLE IF NOT EXISTS lsh_buckets (
+        bucket INTEGER NOT NULL,
+        registration INTEGER NOT NULL,
+        PRIMARY KEY (bucket, registration)
+    ) WITHOUT ROWID""",
+)
+
+
+class DuplicateIndexMismatch(ValueError):
+    pass
+
+
+def normalize_phone(phone: str) -> str:
+    digits = NON_DIGIT_REGEX.sub('', phone or '')
+    return digits[-10:] if len(digits) >= 10 else ''
+
+
+def normalize_email(email: str) -> str:
+    email = (email or '').strip().lower()
+    if '@' not in email:
+        return ''
+    local, domain = email.rsplit('@', 1)
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+class DuplicateIndex:
+    def __init__(
+        self,
+        path: str = DUPLICATE_INDEX_PATH,
+        num_perm: int = DUPLICATE_MINHASH_PERMUTATIONS,
+        bands: int = DUPLICATE_LSH_BANDS,
+        shingle_size: int = DUPLICATE_SHINGLE_SIZE,
+        min_tokens: int = DUPLICATE_MIN_TOKENS,
+        threshold: float = DUPLICATE_SIMILARITY_THRESHOLD,
+        max_candidates: int = DUPLICATE_MAX_CANDIDATES,
+        hash_key: str = DUPLICATE_HASH_KEY,
+        seed: int = DUPLICATE_MINHASH_SEED
+    ):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        
+        self.path = path
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_tokens = min_tokens
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.hash_key = hash_key.encode('utf-8')[:64]
+        self.seed = seed
+        
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self._band_salts = rng.randint(0, 1 << 63, size=bands, dtype=np.uint64)
+        
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def params(self) -> str:
+        return f"perm={self.num_perm}:bands={self.bands}:shingle={self.shingle_size}:seed={self.seed}"
+    
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('params', ?)", (self.params,))
+        
+        stored = conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()[0]
+        if stored != self.params:
+            conn.close()
+            raise DuplicateIndexMismatch(f"Duplicate index at {self.path} was built with {stored}, not {self.params}")
+        
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+    
+    def exists(self) -> bool:
+        return self._conn is not None or self.path == ':memory:' or os.path.exists(self.path)
+    
+    def contact_hash(self, value: str) -> Optional[bytes]:
+        if not value:
+            return None
+        return hashlib.blake2b(value.encode('utf-8'), digest_size=16, key=self.hash_key).digest()
+    
+    def shingle_hashes(self, text: str) -> Optional[np.ndarray]:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) < self.min_tokens:
+            return None
+        
+        token_hashes = np.fromiter(
+            (zlib.crc32(token.encode('utf-8')) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens)
+        )
+        count = len(tokens) - self.shingle_size + 1
+        shingles = np.zeros(count, dtype=np.uint64)
+        for i in range(self.shingle_size):
+            shingles = shingles * SHINGLE_MULTIPLIER + token_hashes[i:i + count]
+        return np.unique((shingles ^ (shingles >> SHIFT_32)) & LOW_32_BITS)
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        shingles = self.shingle_hashes(text or '')
+        if shingles is None:
+            return None
+        permuted = np.outer(self._a, shingles)
+        permuted += self._b[:, None]
+        permuted >>= SHIFT_32
+        return permuted.min(axis=1).astype(np.uint32)
+    
+    def band_keys(self, signature: np.ndarray) -> List[int]:
+        rows = signature.reshape(self.bands, self.rows).astype(np.uint64)
+        keys = self._band_salts.copy()
+        for i in range(self.rows):
+            keys = keys * BAND_MULTIPLIER + rows[:, i]
+        return keys.view(np.int64).tolist()
+    
+    @timed('duplicates.lookup')
+    def lookup(self, phone: str = '', email: str = '', raw_text: str = '') -> DuplicateMatch:
+        if not self.exists():
+            return DuplicateMatch()
+        
+        phone_hash = self.contact_hash(normalize_phone(phone))
+        email_hash = self.contact_hash(normalize_email(email))
+        signature = self.signature(raw_text)
+        match = DuplicateMatch()
+        
+        with self._lock:
+            conn = self._connection()
+            
+            if phone_hash is not None:
+                match.phone_matches = [row[0] for row in conn.execute(
+                    "SELECT registration_id FROM registrations WHERE phone_hash = ? LIMIT ?",
+                    (phone_hash, self.max_candidates)
+                )]
+            
+            if email_hash is not None:
+                match.email_matches = [row[0] for row in conn.execute(
+                    "SELECT registration_id FROM registrations WHERE email_hash = ? LIMIT ?",
+                    (email_hash, self.max_candidates)
+                )]
+            
+            if signature is not None:
+                keys = self.band_keys(signature)
+                candidates = conn.execute(
+                    "SELECT registration_id, signature FROM registrations WHERE id IN ("
+                    f"SELECT registration FROM lsh_buckets WHERE bucket IN ({','.join('?' * len(keys))}) "
+                    "GROUP BY registration ORDER BY COUNT(*) DESC LIMIT ?)",
+                    (*keys, self.max_candidates)
+                ).fetchall()
+        
+        if signature is not None:
+            for registration_id, stored in candidates:
+                similarity = float(np.mean(np.frombuffer(stored, dtype=np.uint32) == signature))
+                if similarity >= self.threshold:
+                    match.near_duplicates.append((registration_id, round(similarity, 3)))
+            match.near_duplicates.sort(key=lambda item: -item[1])
+        
+        return match
+    
+    def add(self, registration_id: str, phone: str = '', email: str = '', raw_text: str = ''):
+        self.add_many([(registration_id, phone, email, raw_text)])
+    
+    @timed('duplicates.add')
+    def add_many(self, registrations: Iterable[Tuple[str, str, str, str]]):
+        rows = []
+        for registration_id, phone, email, raw_text in registrations:
+            signature = self.signature(raw_text)
+            rows.append((
+                registration_id,
+                self.contact_hash(normalize_phone(phone)),
+                self.contact_hash(normalize_email(email)),
+                signature.tobytes() if signature is not None else None,
+                self.band_keys(signature) if signature is not None else []
+            ))
+        
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for registration_id, phone_hash, email_hash, signature, keys in rows:
+                    cursor = conn.execute(
+                        "INSERT INTO registrations (registration_id, phone_hash, email_hash, signature, created) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (registration_id, phone_hash, email_hash, signature, now)
+                    )
+                    conn.executemany(
+                        "INSERT OR IGNORE INTO lsh_buckets (bucket, registration) VALUES (?, ?)",
+                        [(key, cursor.lastrowid) for key in keys]
+                    )
+    
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM registrations").fetchone()[0]
+    
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM lsh_buckets")
+                conn.execute("DELETE FROM registrations")
+    
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+
+_default_index: Optional[DuplicateIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_duplicate_index() -> DuplicateIndex:
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = DuplicateIndex()
+        return _default_index
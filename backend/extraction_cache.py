@@ -0,0 +1,114 @@
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+from modules.config import EXTRACTION_CACHE_MAX_ENTRIES, EXTRACTION_CACHE_TTL_SECONDS
+from modules.schemas import ExtractedData
+from backend.metrics import get_metrics
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize('NFC', text).replace('\r\n', '\n').replace('\r', '\n')
+    return '\n'.join(line.rstrip() for line in text.split('\n'))
+
+
+def copy_extracted(data: ExtractedData) -> ExtractedData:
+    return replace(
+        data,
+        education=[replace(item) for item in data.education],
+        experience=[replace(item) for item in data.experience],
+        skills=list(data.skills),
+        raw_skills=list(data.raw_skills)
+    )
+
+
+class ExtractionCache:
+    def __init__(self, max_entries: int = EXTRACTION_CACHE_MAX_ENTRIES, ttl_seconds: float = EXTRACTION_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: 'OrderedDict[str, Tuple[float, ExtractedData]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def make_key(self, normalized_text: str, version: str) -> str:
+        digest = hashlib.sha256(normalized_text.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(version.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[ExtractedData]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                get_metrics().inc('extraction_cache.misses')
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            get_metrics().inc('extraction_cache.hits')
+            return copy_extracted(entry[1])
+    
+    def put(self, key: str, data: ExtractedData):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy_extracted(data))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def extract(self, extractor, text: str) -> ExtractedData:
+        normalized = normalize_text(text)
+        key = self.make_key(normalized, extractor.version)
+        
+        data = self.get(key)
+        if data is None:
+            data = extractor.extract_all(normalized)
+            self.put(key, data)
+        
+        data.raw_text = text
+        return data
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+                "expirations": self.expirations
+            }
+
+
+_default_cache: Optional[ExtractionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_extraction_cache() -> ExtractionCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ExtractionCache()
+        return _default_cache
@@ -1,14 +1,95 @@
+import logging
 import re
-from typing import List, Optional
-from modules.schemas import FraudReport, FraudFlag
-from modules.config import FRAUD_KEYWORDS
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from modules.schemas import FraudReport, FraudFlag, FraudInput, FraudRule
+from modules.config import (
+    DUPLICATE_INDEX_ENABLED, FRAUD_CHECK_SCORES, FRAUD_MAX_SKILLS, FRAUD_MIN_WORKING_AGE, FRAUD_RISK_MODERATE,
+    FRAUD_RISK_HIGH, FRAUD_RULE_COSTS, FRAUD_SHORT_CIRCUIT
+)
+from backend.metrics import get_metrics, timed
+from backend.duplicate_index import DuplicateIndex, DuplicateIndexMismatch, get_duplicate_index
+from backend.keyword_scanner import KeywordScanner, get_keyword_scanner
+
+logger = logging.getLogger(__name__)
+
+NON_DIGIT_REGEX = re.compile(r'[^\d]')
+PHONE_PREFIXES = ('6', '7', '8', '9')
+EMAIL_PATTERN = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
 
 
 class FraudDetector:
-    def __init__(self):
+    def __init__(
+        self,
+        duplicate_index: Optional[DuplicateIndex] = None,
+        keyword_scanner: Optional[KeywordScanner] = None,
+        short_circuit: bool = FRAUD_SHORT_CIRCUIT
+    ):
         self.phone_pattern = re.compile(r'^(\+91)?[6-9]\d{9}$')
-        self.email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+        self.email_pattern = re.compile(EMAIL_PATTERN)
+        self.keyword_scanner = keyword_scanner or get_keyword_scanner()
+        self.duplicate_index = duplicate_index
+        self.duplicate_error = ""
+        self.short_circuit = short_circuit
+        
+        self.rules: List[FraudRule] = []
+        self._run_order: List[int] = []
+        self._register_default_rules()
+    
+    def _register_default_rules(self):
+        scores = FRAUD_CHECK_SCORES
+        self.register_rule(FraudRule(
+            'phone', lambda data: self._single(self._check_phone(data.phone)),
+            FRAUD_RULE_COSTS['phone'], max(scores['phone_length'], scores['phone_prefix']),
+            lambda data: bool(data.phone)
+        ))
+        self.register_rule(FraudRule(
+            'email', lambda data: self._single(self._check_email(data.email)),
+            FRAUD_RULE_COSTS['email'], scores['email_invalid'],
+            lambda data: bool(data.email)
+        ))
+        self.register_rule(FraudRule(
+            'skills', lambda data: self._single(self._check_skills(data.skills)),
+            FRAUD_RULE_COSTS['skills'], scores['excessive_skills'],
+            lambda data: bool(data.skills)
+        ))
+        self.register_rule(FraudRule(
+            'experience_age', lambda data: self._single(self._check_experience_age(data.experience_count, data.age)),
+            FRAUD_RULE_COSTS['experience_age'], scores['experience_age_mismatch'],
+            lambda data: bool(data.age) and data.experience_count > 0
+        ))
+        self.register_rule(FraudRule(
+            'keywords', lambda data: self._check_suspicious_keywords(data.raw_text),
+            FRAUD_RULE_COSTS['keywords'], 100,
+            lambda data: bool(data.raw_text)
+        ))
+        self.register_rule(FraudRule(
+            'duplicates', lambda data: self._check_duplicates(data.phone, data.email, data.raw_text),
+            FRAUD_RULE_COSTS['duplicates'],
+            scores['duplicate_phone'] + scores['duplicate_email'] + scores['near_duplicate_resume'],
+            lambda data: self.duplicate_index is not None and bool(data.phone or data.email or data.raw_text)
+        ))
+    
+    def register_rule(self, rule: FraudRule):
+        if any(existing.name == rule.name for existing in self.rules):
+            raise ValueError(f"Fraud rule already registered: {rule.name}")
+        self.rules.append(rule)
+        self._run_order = sorted(range(len(self.rules)), key=lambda i: self._priority(self.rules[i]))
+    
+    @staticmethod
+    def _priority(rule: FraudRule) -> Tuple[float, float]:
+        if rule.weight <= 0:
+            return float('inf'), rule.cost
+        return rule.cost / rule.weight, rule.cost
     
+    @staticmethod
+    def _single(result: tuple) -> Tuple[int, List[FraudFlag]]:
+        score, flag = result
+        return score, [flag] if flag else []
+    
+    @timed('fraud.analyze')
     def analyze(
         self,
         phone: str,
@@ -18,37 +99,29 @@ class FraudDetector:
         raw_text: str,
         age: Optional[int] = None
     ) -> FraudReport:
-        flags = []
+        data = FraudInput(phone, email, skills, experience_count, raw_text, age)
+        metrics = get_metrics()
+        results: Dict[int, List[FraudFlag]] = {}
+        timings: Dict[str, float] = {}
+        skipped: List[str] = []
         total_score = 0
         
-        if phone:
-            phone_score, phone_flag = self._check_phone(phone)
-            total_score += phone_score
-            if phone_flag:
-                flags.append(phone_flag)
-        
-        if email:
-            email_score, email_flag = self._check_email(email)
-            total_score += email_score
-            if email_flag:
-                flags.append(email_flag)
-        
-        if skills:
-            skills_score, skills_flag = self._check_skills(skills)
-            total_score += skills_score
-            if skills_flag:
-                flags.append(skills_flag)
-        
-        if age and experience_count > 0:
-            exp_score, exp_flag = self._check_experience_age(experience_count, age)
-            total_score += exp_score
-            if exp_flag:
-                flags.append(exp_flag)
-        
-        if raw_text:
-            keyword_score, keyword_flags = self._check_suspicious_keywords(raw_text)
-            total_score += keyword_score
-            flags.extend(keyword_flags)
+        for position in self._run_order:
+            rule = self.rules[position]
+            if not rule.applies(data):
+                continue
+            if self.short_circuit and total_score >= FRAUD_RISK_HIGH:
+                skipped.append(rule.name)
+                continue
+            
+            start = time.perf_counter()
+            score, flags = rule.check(data)
+            elapsed = time.perf_counter() - start
+            
+            metrics.observe(f'fraud.rule.{rule.name}', elapsed)
+            timings[rule.name] = round(elapsed * 1000, 4)
+            total_score += score
+            results[position] = flags
         
         fraud_score = min(total_score, 100)
         
@@ -57,21 +130,23 @@ class FraudDetector:
         return FraudReport(
             fraud_risk_score=fraud_score,
             risk_label=risk_label,
-            flags=flags
+            flags=[flag for position in sorted(results) for flag in results[position]],
+            skipped_rules=skipped,
+            rule_timings=timings
         )
     
     def _check_phone(self, phone: str) -> tuple:
-        clean_phone = re.sub(r'[^\d]', '', phone)
+        clean_phone = NON_DIGIT_REGEX.sub('', phone)
         
         if len(clean_phone) != 10:
-            return 20, FraudFlag(
+            return FRAUD_CHECK_SCORES['phone_length'], FraudFlag(
                 check="phone_invalid",
                 severity="high",
                 message=f"Phone number must be 10 digits. Found: {phone}"
             )
         
-        if not clean_phone.startswith(('6', '7', '8', '9')):
-            return 15, FraudFlag(
+        if not clean_phone.startswith(PHONE_PREFIXES):
+            return FRAUD_CHECK_SCORES['phone_prefix'], FraudFlag(
                 check="phone_invalid",
                 severity="medium",
                 message=f"Phone number should start with 6, 7, 8, or 9. Found: {phone}"
@@ -81,7 +156,7 @@ class FraudDetector:
     
     def _check_email(self, email: str) -> tuple:
         if not self.email_pattern.match(email):
-            return 15, FraudFlag(
+            return FRAUD_CHECK_SCORES['email_invalid'], FraudFlag(
                 check="email_invalid",
                 severity="medium",
                 message=f"Invalid email format: {email}"
@@ -90,8 +165,8 @@ class FraudDetector:
         return 0, None
     
     def _check_skills(self, skills: List[str]) -> tuple:
-        if len(skills) > 50:
-            return 15, FraudFlag(
+        if len(skills) > FRAUD_MAX_SKILLS:
+            return FRAUD_CHECK_SCORES['excessive_skills'], FraudFlag(
                 check="excessive_skills",
                 severity="medium",
                 message=f"Excessive skills detected ({len(skills)}). This may indicate false information."
@@ -100,8 +175,8 @@ class FraudDetector:
         return 0, None
     
     def _check_experience_age(self, experience_years: int, age: int) -> tuple:
-        if experience_years > age - 18 and age > 0:
-            return 25, FraudFlag(
+        if experience_years > age - FRAUD_MIN_WORKING_AGE and age > 0:
+            return FRAUD_CHECK_SCORES['experience_age_mismatch'], FraudFlag(
                 check="experience_age_mismatch",
                 severity="high",
                 message=f"Experience ({experience_years} years) exceeds plausible age ({age} years)"
@@ -110,30 +185,92 @@ class FraudDetector:
         return 0, None
     
     def _check_suspicious_keywords(self, text: str) -> tuple:
-        text_lower = text.lower()
         found_flags = []
         score = 0
         
-        for keyword in FRAUD_KEYWORDS:
-            if keyword.lower() in text_lower:
-                score += 25
-                found_flags.append(FraudFlag(
-                    check="suspicious_keyword",
-                    severity="high",
-                    message=f"Suspicious keyword detected: '{keyword}'"
-                ))
+        for hit in self.keyword_scanner.scan(text):
+            score += hit.score
+            found_flags.append(FraudFlag(
+                check="suspicious_keyword",
+                severity=hit.severity,
+                message=f"Suspicious keyword detected: '{hit.rule}'"
+            ))
+        
+        return score, found_flags
+    
+    def _check_duplicates(self, phone: str, email: str, raw_text: str) -> tuple:
+        try:
+            match = self.duplicate_index.lookup(phone, email, raw_text)
+        except DuplicateIndexMismatch as e:
+            self._duplicate_error(e)
+            self.duplicate_index = None
+            return 0, []
+        except (sqlite3.Error, OSError) as e:
+            self._duplicate_error(e)
+            return 0, []
+        
+        found_flags = []
+        score = 0
+        
+        if match.phone_matches:
+            score += FRAUD_CHECK_SCORES['duplicate_phone']
+            found_flags.append(FraudFlag(
+                check="duplicate_phone",
+                severity="high",
+                message=f"Phone number already used by {len(match.phone_matches)} earlier registration(s)"
+            ))
+        
+        if match.email_matches:
+            score += FRAUD_CHECK_SCORES['duplicate_email']
+            found_flags.append(FraudFlag(
+                check="duplicate_email",
+                severity="high",
+                message=f"Email already used by {len(match.email_matches)} earlier registration(s)"
+            ))
+        
+        if match.near_duplicates:
+            registration_id, similarity = match.near_duplicates[0]
+            score += FRAUD_CHECK_SCORES['near_duplicate_resume']
+            found_flags.append(FraudFlag(
+                check="near_duplicate_resume",
+                severity="medium",
+                message=(
+                    f"Resume text is {similarity:.0%} similar to {len(match.near_duplicates)} earlier "
+                    f"registration(s), closest {registration_id}"
+                )
+            ))
         
         return score, found_flags
     
+    def _duplicate_error(self, error: Exception):
+        if str(error) != self.duplicate_error:
+            logger.warning("Duplicate check skipped: %s", error)
+        self.duplicate_error = str(error)
+        get_metrics().inc('duplicates.index_errors')
+    
     def _get_risk_label(self, score: int) -> str:
-        if score < 25:
+        if score < FRAUD_RISK_MODERATE:
             return "Low"
-        elif score < 50:
+        elif score < FRAUD_RISK_HIGH:
             return "Moderate"
         else:
             return "High"
 
 
+_default_detector: Optional[FraudDetector] = None
+_default_detector_lock = threading.Lock()
+
+
+def get_fraud_detector() -> FraudDetector:
+    global _default_detector
+    with _default_detector_lock:
+        if _default_detector is None:
+            _default_detector = FraudDetector(
+                duplicate_index=get_duplicate_index() if DUPLICATE_INDEX_ENABLED else None
+            )
+        return _default_detector
+
+
 def detect_fraud(
     phone: str,
     email: str,
@@ -142,5 +279,4 @@ def detect_fraud(
     raw_text: str,
     age: Optional[int] = None
 ) -> FraudReport:
-    detector = FraudDetector()
-    return detector.analyze(phone, email, skills, experience_count, raw_text, age)
+    return get_fraud_detector().analyze(phone, email, skills, experience_count, raw_text, age)
@@ -0,0 +1,101 @@
+import os
+import re
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Set, Tuple
+from modules.config import GAZETTEER_DIR, GAZETTEER_FILES
+from backend.sections import trie_pattern
+
+
+EXACT_PREFIX = '='
+
+
+def _alias_regex(aliases: Iterable[str]) -> Optional[re.Pattern]:
+    aliases = list(aliases)
+    return re.compile(r'(?<!\w)(' + trie_pattern(aliases) + r')(?!\w)') if aliases else None
+
+
+class Gazetteer:
+    def __init__(
+        self,
+        name: str,
+        entries: Dict[str, str],
+        version: str = "",
+        exact_entries: Optional[Dict[str, str]] = None
+    ):
+        self.name = name
+        self.version = version
+        self.entries = entries
+        self.exact_entries = exact_entries or {}
+        self.regex = _alias_regex(entries)
+        self.exact_regex = _alias_regex(self.exact_entries)
+    
+    def __len__(self) -> int:
+        return len(set(self.entries.values()) | set(self.exact_entries.values()))
+    
+    def matches(self, text_lower: str, text: str = "") -> Iterator[Tuple[int, int, str]]:
+        found = []
+        if self.regex is not None:
+            found.extend((m.start(), m.end(), self._display(m, self.entries)) for m in self.regex.finditer(text_lower))
+        if self.exact_regex is not None and text:
+            found.extend((m.start(), m.end(), self._display(m, self.exact_entries)) for m in self.exact_regex.finditer(text))
+        yield from sorted(found)
+    
+    def first(self, text_lower: str, text: str = "") -> str:
+        match = self.regex.search(text_lower) if self.regex is not None else None
+        exact = self.exact_regex.search(text) if self.exact_regex is not None and text else None
+        if exact and (match is None or exact.start() < match.start()):
+            return self._display(exact, self.exact_entries)
+        return self._display(match, self.entries) if match else ""
+    
+    def search(self, text_lower: str, text: str = "") -> bool:
+        return bool(self.first(text_lower, text))
+    
+    def find_all(self, text_lower: str, text: str = "") -> Set[str]:
+        return {display for _, _, display in self.matches(text_lower, text)}
+    
+    def _display(self, match: re.Match, entries: Dict[str, str]) -> str:
+        return entries[' '.join(match.group(1).split())]
+
+
+def load_gazetteer(path: str, name: Optional[str] = None) -> Gazetteer:
+    entries: Dict[str, str] = {}
+    exact_entries: Dict[str, str] = {}
+    version = ""
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if line.startswith('#'):
+                key, _, value = line.lstrip('#').partition(':')
+                if key.strip() == 'version':
+                    version = value.strip()
+                continue
+            if not line:
+                continue
+            
+            names = [' '.join(part.split()) for part in line.split('|')]
+            display = names[0].lstrip(EXACT_PREFIX)
+            for alias in names:
+                if alias.startswith(EXACT_PREFIX) and alias[1:]:
+                    exact_entries.setdefault(alias[1:], display)
+                elif alias:
+                    entries.setdefault(alias.lower(), display)
+    
+    return Gazetteer(name or os.path.splitext(os.path.basename(path))[0], entries, version, exact_entries)
+
+
+_gazetteers: Dict[str, Gazetteer] = {}
+_gazetteers_lock = threading.Lock()
+
+
+def get_gazetteer(name: str) -> Gazetteer:
+    with _gazetteers_lock:
+        if name not in _gazetteers:
+            if name not in GAZETTEER_FILES:
+                raise KeyError(f"Unknown gazetteer: {name}")
+            _gazetteers[name] = load_gazetteer(os.path.join(GAZETTEER_DIR, GAZETTEER_FILES[name]), name)
+        return _gazetteers[name]
+
+
+def gazetteer_versions() -> Dict[str, str]:
+    return {name: get_gazetteer(name).version for name in GAZETTEER_FILES}
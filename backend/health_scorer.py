@@ -1,11 +1,15 @@
-from typing import List
+import threading
+from typing import List, Optional
+from modules.config import HEALTH_WEIGHTS, HEALTH_TARGET_SKILLS, HEALTH_POINTS_PER_SKILL
 from modules.schemas import HealthScore
+from backend.metrics import timed
 
 
 class HealthScorer:
     def __init__(self):
         pass
     
+    @timed('health.calculate')
     def calculate(
         self,
         email: str,
@@ -20,40 +24,40 @@ class HealthScorer:
         
         email_present = bool(email)
         if email_present:
-            score += 10
+            score += HEALTH_WEIGHTS['email']
         else:
             suggestions.append("Add your email address for contact")
         
         phone_present = bool(phone)
         if phone_present:
-            score += 10
+            score += HEALTH_WEIGHTS['phone']
         else:
             suggestions.append("Add your phone number for contact")
         
         education_detected = education_count > 0
         if education_detected:
-            score += 20
+            score += HEALTH_WEIGHTS['education']
         else:
             suggestions.append("Add your educational qualifications")
         
         experience_detected = experience_count > 0
         if experience_detected:
-            score += 20
+            score += HEALTH_WEIGHTS['experience']
         else:
             suggestions.append("Add your work experience")
         
         skills_count = len(skills)
-        if skills_count >= 5:
-            score += 20
+        if skills_count >= HEALTH_TARGET_SKILLS:
+            score += HEALTH_WEIGHTS['skills']
         elif skills_count > 0:
-            score += int(skills_count * 4)
-            suggestions.append(f"Add more skills (currently {skills_count}, recommend at least 5)")
+            score += int(skills_count * HEALTH_POINTS_PER_SKILL)
+            suggestions.append(f"Add more skills (currently {skills_count}, recommend at least {HEALTH_TARGET_SKILLS})")
         else:
             suggestions.append("Add your technical and soft skills")
         
         address_detected = bool(location)
         if address_detected:
-            score += 20
+            score += HEALTH_WEIGHTS['location']
         else:
             suggestions.append("Add your location/address")
         
@@ -69,6 +73,18 @@ class HealthScorer:
         )
 
 
+_default_scorer: Optional[HealthScorer] = None
+_default_scorer_lock = threading.Lock()
+
+
+def get_health_scorer() -> HealthScorer:
+    global _default_scorer
+    with _default_scorer_lock:
+        if _default_scorer is None:
+            _default_scorer = HealthScorer()
+        return _default_scorer
+
+
 def calculate_health_score(
     email: str,
     phone: str,
@@ -77,8 +93,7 @@ def calculate_health_score(
     skills: List[str],
     location: str
 ) -> HealthScore:
-    scorer = HealthScorer()
-    return scorer.calculate(
+    return get_health_scorer().calculate(
         email, phone, education_count, 
         experience_count, skills, location
     )
@@ -0,0 +1,174 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
+from modules.schemas import ExtractedData, FraudReport, HealthScore, IncrementalUpdate
+from backend.nlp_extractor import NLPExtractor, get_extractor
+from backend.fraud_detector import FraudDetector, get_fraud_detector
+from backend.health_scorer import HealthScorer, get_health_scorer
+from backend.sections import SectionIndex
+
+CONTACT_FIELDS = ('full_name', 'email', 'phone', 'location')
+
+
+class IncrementalExtractor:
+    def __init__(
+        self,
+        extractor: Optional[NLPExtractor] = None,
+        fraud_detector: Optional[FraudDetector] = None,
+        health_scorer: Optional[HealthScorer] = None
+    ):
+        self.extractor = extractor or get_extractor()
+        self.fraud_detector = fraud_detector or get_fraud_detector()
+        self.health_scorer = health_scorer or get_health_scorer()
+        
+        self._memo: Dict[Hashable, Any] = {}
+        self._sections: Dict[str, str] = {}
+        self._health: Optional[Tuple[Hashable, HealthScore]] = None
+        self._fraud: Optional[Tuple[Hashable, FraudReport]] = None
+        self._lock = threading.Lock()
+    
+    def update(self, text: str) -> IncrementalUpdate:
+        with self._lock:
+            return self._update(text)
+    
+    def reset(self):
+        with self._lock:
+            self._memo = {}
+            self._sections = {}
+            self._health = None
+            self._fraud = None
+    
+    def _update(self, text: str) -> IncrementalUpdate:
+        index = self.extractor.build_index(text)
+        previous, self._memo = self._memo, {}
+        recomputed: Set[str] = set()
+        
+        def cached(field_name: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+            key = (field_name, key)
+            if key in previous:
+                value = previous[key]
+            else:
+                value = compute()
+                recomputed.add(field_name)
+            self._memo[key] = value
+            return value
+        
+        data = ExtractedData()
+        data.raw_text = text
+        
+        for name in CONTACT_FIELDS:
+            setattr(data, name, self._contact_field(index, name, cached))
+        
+        education_text = index.text_in('education')[0]
+        data.education = copy.deepcopy(cached(
+            'education', education_text,
+            lambda: self.extractor.extract_field('education', index)
+        ))
+        data.experience = copy.deepcopy(self._experience(index, cached))
+        data.skills = self._skills(index, cached)
+        
+        sections = {section: index.text_in(section)[0] for section in index.spans}
+        changed = sorted(
+            section for section in set(sections) | set(self._sections)
+            if sections.get(section) != self._sections.get(section)
+        )
+        self._sections = sections
+        
+        health, health_recomputed = self._health_score(data)
+        fraud, fraud_recomputed = self._fraud_report(data)
+        
+        return IncrementalUpdate(
+            extracted=data,
+            health=health,
+            fraud=fraud,
+            changed_sections=changed,
+            recomputed_fields=[name for name in self.extractor.FIELD_METHODS if name in recomputed],
+            health_recomputed=health_recomputed,
+            fraud_recomputed=fraud_recomputed
+        )
+    
+    def _contact_field(self, index: SectionIndex, name: str, cached) -> str:
+        if name == 'full_name':
+            first_line = index.first_line()
+            value = cached(name, ('first_line', first_line), lambda: self.extractor.name_from_first_line(first_line))
+            if value:
+                return value
+            people = tuple(index.entities_in('contact', 'person'))
+            value = cached(name, ('entities', people), lambda: self.extractor.entity_name(index))
+            if value:
+                return value
+        
+        if name == 'location':
+            locations = (tuple(index.entities_in('contact', 'location')), tuple(index.entities_in(None, 'location')))
+            value = cached(name, ('entities', locations), lambda: self.extractor.entity_location(index))
+            if value:
+                return value
+        
+        for text, text_lower in self.extractor.contact_scopes(index):
+            value = cached(name, text, lambda: self.extractor.find_in_scope(name, text, text_lower))
+            if value:
+                return value
+        return ""
+    
+    def _experience(self, index: SectionIndex, cached) -> list:
+        entries = []
+        if index.has('experience'):
+            for i in index.line_numbers('experience', include_headers=False):
+                line, line_lower = index.lines[i], index.lower_lines[i]
+                organizations = tuple(index.entities_on(i, 'organization'))
+                entry = cached(
+                    'experience', (line, organizations),
+                    lambda: self.extractor.experience_entry(line, line_lower, organizations)
+                )
+                if entry:
+                    entries.append(entry)
+                    if len(entries) == 5:
+                        break
+        
+        if entries:
+            return entries
+        return cached('experience', ('fallback', index.text), lambda: self.extractor.experience_fallback(index))
+    
+    def _skills(self, index: SectionIndex, cached) -> List[str]:
+        found: Set[str] = set()
+        for line in set(index.lines):
+            found |= cached('skills', line, lambda: frozenset(self.extractor.skill_matcher.match(line)))
+        return self.extractor.rank_skills(found)
+    
+    def _health_score(self, data: ExtractedData) -> Tuple[HealthScore, bool]:
+        key = (
+            data.email, data.phone, len(data.education), len(data.experience),
+            tuple(data.skills), data.location
+        )
+        if self._health is not None and self._health[0] == key:
+            return copy.deepcopy(self._health[1]), False
+        
+        health = self.health_scorer.calculate(
+            data.email,
+            data.phone,
+            len(data.education),
+            len(data.experience),
+            data.skills,
+            data.location
+        )
+        self._health = (key, health)
+        return copy.deepcopy(health), True
+    
+    def _fraud_report(self, data: ExtractedData) -> Tuple[FraudReport, bool]:
+        key = (
+            data.phone, data.email, tuple(data.skills), len(data.experience), data.raw_text,
+            self.fraud_detector.keyword_scanner.current_ruleset()
+        )
+        if self._fraud is not None and self._fraud[0] == key:
+            return copy.deepcopy(self._fraud[1]), False
+        
+        fraud = self.fraud_detector.analyze(
+            data.phone,
+            data.email,
+            data.skills,
+            len(data.experience),
+            data.raw_text
+        )
+        self._fraud = (key, fraud)
+        return copy.deepcopy(fraud), True
+
@@ -0,0 +1,326 @@
+import glob
+import os
+import re
+import threading
+import time
+try:
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from modules.config import (
+    FRAUD_RULES_DIR, FRAUD_RULES_RELOAD_SECONDS, FRAUD_RULE_DEFAULT_SCORE, FRAUD_RULE_DEFAULT_SEVERITY,
+    KEYWORD_SCANNER_COMPILE_MIN, KEYWORD_SCANNER_MIN_LITERAL
+)
+from modules.schemas import KeywordRule, KeywordHit
+from backend.metrics import get_metrics
+from backend.sections import trie_pattern
+
+REGEX_PREFIX = 're:'
+REPEAT_OPS = tuple(
+    getattr(sre_constants, name) for name in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+    if hasattr(sre_constants, name)
+)
+
+
+def _best_group(groups: List[Set[str]]) -> Optional[Set[str]]:
+    return max(groups, key=lambda factors: (min(map(len, factors)), -len(factors)), default=None)
+
+
+def _sequence_groups(items) -> List[Set[str]]:
+    groups: List[Set[str]] = []
+    run: List[str] = []
+    
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            groups.append({''.join(run)})
+            run = []
+        
+        if op is sre_constants.SUBPATTERN:
+            groups.extend(_sequence_groups(av[-1]))
+        elif op is sre_constants.BRANCH:
+            alternatives = [_best_group(_sequence_groups(alternative)) for alternative in av[1]]
+            if all(alternatives):
+                groups.append(set().union(*alternatives))
+        elif op in REPEAT_OPS and av[0] >= 1:
+            groups.extend(_sequence_groups(av[2]))
+    
+    if run:
+        groups.append({''.join(run)})
+    return groups
+
+
+def _leading_factors(items) -> Optional[Set[str]]:
+    run: List[str] = []
+    
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            break
+        if op is sre_constants.AT:
+            continue
+        
+        if op is sre_constants.SUBPATTERN:
+            return _leading_factors(av[-1])
+        if op is sre_constants.BRANCH:
+            alternatives = [_leading_factors(alternative) for alternative in av[1]]
+            return set().union(*alternatives) if all(alternatives) else None
+        if op in REPEAT_OPS and av[0] >= 1:
+            return _leading_factors(av[2])
+        return None
+    
+    return {''.join(run)} if run else None
+
+
+def _usable(factors: Optional[Set[str]], min_length: int) -> List[str]:
+    if not factors or min(map(len, factors)) < min_length:
+        return []
+    return sorted({factor.lower() for factor in factors})
+
+
+def required_literals(pattern: str, min_length: int = KEYWORD_SCANNER_MIN_LITERAL) -> List[List[str]]:
+    try:
+        groups = _sequence_groups(sre_parse.parse(pattern))
+    except re.error:
+        return []
+    usable = [_usable(group, min_length) for group in groups]
+    return [group for i, group in enumerate(usable) if group and group not in usable[:i]]
+
+
+def leading_literals(pattern: str, min_length: int = KEYWORD_SCANNER_MIN_LITERAL) -> List[str]:
+    try:
+        return _usable(_leading_factors(sre_parse.parse(pattern)), min_length)
+    except re.error:
+        return []
+
+
+def load_rules(path: str) -> Tuple[List[KeywordRule], str]:
+    rules: List[KeywordRule] = []
+    headers = {'version': '', 'severity': FRAUD_RULE_DEFAULT_SEVERITY, 'score': str(FRAUD_RULE_DEFAULT_SCORE)}
+    source = os.path.basename(path)
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, raw_line in enumerate(f, 1):
+            line = raw_line.strip()
+            if line.startswith('#'):
+                key, _, value = line.lstrip('#').partition(':')
+                if key.strip() in headers and value.strip():
+                    headers[key.strip()] = value.strip()
+                continue
+            if not line:
+                continue
+            
+            severity, score = headers['severity'], int(headers['score'])
+            if line.startswith(REGEX_PREFIX):
+                pattern = line[len(REGEX_PREFIX):].strip()
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"{source}:{line_number}: invalid pattern {pattern!r}: {e}") from e
+                rules.append(KeywordRule(pattern, [pattern], True, severity, score, source))
+            else:
+                variants = [' '.join(part.split()) for part in line.split('|')]
+                variants = [variant for variant in variants if variant]
+                if variants:
+                    rules.append(KeywordRule(variants[0], variants, False, severity, score, source))
+    
+    return rules, headers['version']
+
+
+class RuleSet:
+    def __init__(
+        self,
+        rules: List[KeywordRule],
+        versions: Optional[Dict[str, str]] = None,
+        compile_min: int = KEYWORD_SCANNER_COMPILE_MIN
+    ):
+        self.rules = rules
+        self.versions = versions or {}
+        self.literals: Dict[str, Tuple[List[int], List[int]]] = {}
+        self.regexes: Dict[int, re.Pattern] = {}
+        self.requirements: Dict[int, List[List[str]]] = {}
+        self.leading: Dict[int, List[str]] = {}
+        self.unanchored: List[int] = []
+        
+        for index, rule in enumerate(rules):
+            if rule.is_regex:
+                self.regexes[index] = re.compile(rule.patterns[0])
+                groups = required_literals(rule.patterns[0])
+                leading = leading_literals(rule.patterns[0])
+                if leading:
+                    self.leading[index] = leading
+                    if leading not in groups:
+                        groups.append(leading)
+                if groups:
+                    self.requirements[index] = groups
+                else:
+                    self.unanchored.append(index)
+                for anchor in sorted({literal for group in groups for literal in group}):
+                    self.literals.setdefault(anchor, ([], []))[1].append(index)
+            else:
+                for variant in rule.patterns:
+                    self.literals.setdefault(variant.lower(), ([], []))[0].append(index)
+        
+        self.literal_regex = None
+        self.prefixes: Dict[str, List[str]] = {}
+        if len(self.literals) >= compile_min:
+            self.literal_regex = re.compile('(?=(' + trie_pattern(self.literals, flexible_spaces=False) + '))')
+            for literal in self.literals:
+                self.prefixes[literal] = [
+                    literal[:end] for end in range(1, len(literal) + 1) if literal[:end] in self.literals
+                ]
+    
+    def __len__(self) -> int:
+        return len(self.rules)
+    
+    def literal_positions(self, text_lower: str) -> Dict[str, List[int]]:
+        found: Dict[str, List[int]] = {}
+        if self.literal_regex is None:
+            for literal in self.literals:
+                position = text_lower.find(literal)
+                while position >= 0:
+                    found.setdefault(literal, []).append(position)
+                    position = text_lower.find(literal, position + 1)
+            return found
+        
+        for match in self.literal_regex.finditer(text_lower):
+            for literal in self.prefixes[match.group(1)]:
+                found.setdefault(literal, []).append(match.start())
+        return found
+    
+    def _matches(self, index: int, text_lower: str, found: Dict[str, List[int]]) -> Iterator[re.Match]:
+        regex = self.regexes[index]
+        if index in self.leading:
+            starts = sorted({position for literal in self.leading[index] for position in found.get(literal, ())})
+            for start in starts:
+                match = regex.match(text_lower, start)
+                if match:
+                    yield match
+            return
+        
+        match = regex.search(text_lower)
+        while match:
+            yield match
+            match = regex.search(text_lower, match.start() + 1)
+    
+    def scan(self, text: str) -> List[KeywordHit]:
+        text_lower = text.lower()
+        found = self.literal_positions(text_lower)
+        matched: Dict[int, str] = {}
+        phrase_spans: List[Tuple[int, int]] = []
+        candidates = set(self.unanchored)
+        
+        for literal, positions in found.items():
+            phrase_rules, regex_rules = self.literals[literal]
+            for index in phrase_rules:
+                matched.setdefault(index, literal)
+            if phrase_rules:
+                phrase_spans.extend((position, position + len(literal)) for position in positions)
+            candidates.update(regex_rules)
+        
+        for index in sorted(candidates):
+            groups = self.requirements.get(index, ())
+            if not all(any(literal in found for literal in group) for group in groups):
+                continue
+            for match in self._matches(index, text_lower, found):
+                if not any(start < match.end() and match.start() < end for start, end in phrase_spans):
+                    matched[index] = match.group(0)
+                    break
+        
+        hits = []
+        for index in sorted(matched):
+            rule = self.rules[index]
+            hits.append(KeywordHit(
+                rule=matched[index] if rule.is_regex else rule.name,
+                matched=matched[index],
+                severity=rule.severity,
+                score=rule.score,
+                source=rule.source
+            ))
+        return hits
+
+
+class KeywordScanner:
+    def __init__(self, rules_dir: str = FRAUD_RULES_DIR, reload_seconds: float = FRAUD_RULES_RELOAD_SECONDS):
+        self.rules_dir = rules_dir
+        self.reload_seconds = reload_seconds
+        self.last_error = ""
+        
+        self._signature: Tuple = ()
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        self.ruleset = RuleSet([])
+        self.reload()
+    
+    def rule_files(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.rules_dir, '*.txt')))
+    
+    def _file_signature(self) -> Tuple:
+        signature = []
+        for path in self.rule_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+    
+    def reload(self, force: bool = True) -> bool:
+        with self._lock:
+            self._checked = time.monotonic()
+            signature = self._file_signature()
+            if not force and signature == self._signature:
+                return False
+            
+            rules: List[KeywordRule] = []
+            versions: Dict[str, str] = {}
+            try:
+                for path, _, _ in signature:
+                    file_rules, version = load_rules(path)
+                    rules.extend(file_rules)
+                    versions[os.path.basename(path)] = version
+                ruleset = RuleSet(rules, versions)
+            except (OSError, ValueError, re.error) as e:
+                self.last_error = str(e)
+                self._signature = signature
+                get_metrics().inc('fraud.rules_reload_errors')
+                return False
+            
+            self.ruleset = ruleset
+            self._signature = signature
+            self.last_error = ""
+            get_metrics().inc('fraud.rules_reloads')
+            return True
+    
+    def _maybe_reload(self):
+        if self.reload_seconds <= 0 or time.monotonic() - self._checked < self.reload_seconds:
+            return
+        self.reload(force=False)
+    
+    def current_ruleset(self) -> RuleSet:
+        self._maybe_reload()
+        return self.ruleset
+    
+    def scan(self, text: str) -> List[KeywordHit]:
+        return self.current_ruleset().scan(text)
+    
+    def versions(self) -> Dict[str, str]:
+        return dict(self.ruleset.versions)
+
+
+_default_scanner: Optional[KeywordScanner] = None
+_default_scanner_lock = threading.Lock()
+
+
+def get_keyword_scanner() -> KeywordScanner:
+    global _default_scanner
+    with _default_scanner_lock:
+        if _default_scanner is None:
+            _default_scanner = KeywordScanner()
+        return _default_scanner
@@ -0,0 +1,240 @@
+import functools
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Deque, Dict, List, Optional
+from modules.config import METRICS_ENABLED, METRICS_EXPORT_PATH, METRICS_WINDOW, METRICS_BUCKETS
+from modules.schemas import StageStats
+
+METRIC_NAME_REGEX = re.compile(r'[^a-zA-Z0-9_]')
+
+
+class _Histogram:
+    def __init__(self, buckets: List[float], window: int):
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+
+class _Timer:
+    def __init__(self, metrics: 'Metrics', name: str):
+        self.metrics = metrics
+        self.name = name
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.metrics.observe(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class Metrics:
+    def __init__(
+        self,
+        enabled: bool = METRICS_ENABLED,
+        buckets: Optional[List[float]] = None,
+        window: int = METRICS_WINDOW
+    ):
+        self.enabled = enabled
+        self.buckets = sorted(buckets or METRICS_BUCKETS)
+        self.window = window
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+    
+    def inc(self, name: str, value: float = 1):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+    
+    def observe(self, name: str, seconds: float):
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = _Histogram(self.buckets, self.window)
+            histogram.bucket_counts[bisect_left(self.buckets, seconds)] += 1
+            histogram.count += 1
+            histogram.total += seconds
+            histogram.max = max(histogram.max, seconds)
+            histogram.recent.append(seconds)
+    
+    def timer(self, name: str):
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+    
+    def timed(self, name: str) -> Callable:
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.observe(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+    
+    def stage_stats(self) -> List[StageStats]:
+        with self._lock:
+            histograms = {name: (h.count, h.total, h.max, sorted(h.recent)) for name, h in self._histograms.items()}
+        
+        stats = []
+        for name, (count, total, longest, recent) in sorted(histograms.items()):
+            stats.append(StageStats(
+                stage=name,
+                count=count,
+                total_ms=round(total * 1000, 3),
+                mean_ms=round(total / count * 1000, 3) if count else 0.0,
+                p50_ms=round(self._percentile(recent, 0.50) * 1000, 3),
+                p95_ms=round(self._percentile(recent, 0.95) * 1000, 3),
+                p99_ms=round(self._percentile(recent, 0.99) * 1000, 3),
+                max_ms=round(longest * 1000, 3)
+            ))
+        return stats
+    
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+    
+    def reset(self):
+        with self._lock:
+            self._histograms = {}
+            self._counters = {}
+    
+    def drain(self) -> Dict[str, Dict]:
+        with self._lock:
+            histograms, counters = self._histograms, self._counters
+            self._histograms, self._counters = {}, {}
+        return {
+            'histograms': {
+                name: (h.bucket_counts, h.count, h.total, h.max, list(h.recent)) for name, h in histograms.items()
+            },
+            'counters': counters,
+        }
+    
+    def merge(self, drained: Dict[str, Dict]):
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, value in drained['counters'].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+            for name, (bucket_counts, count, total, longest, recent) in drained['histograms'].items():
+                histogram = self._histograms.get(name)
+                if histogram is None:
+                    histogram = self._histograms[name] = _Histogram(self.buckets, self.window)
+                histogram.bucket_counts = [a + b for a, b in zip(histogram.bucket_counts, bucket_counts)]
+                histogram.count += count
+                histogram.total += total
+                histogram.max = max(histogram.max, longest)
+                histogram.recent.extend(recent)
+    
+    def to_prometheus(self) -> str:
+        with self._lock:
+            histograms = {
+                name: (list(h.bucket_counts), h.count, h.total, sorted(h.recent))
+                for name, h in self._histograms.items()
+            }
+            counters = dict(self._counters)
+        
+        lines = []
+        if histograms:
+            lines.append("# HELP deet_stage_seconds Time spent per pipeline stage")
+            lines.append("# TYPE deet_stage_seconds histogram")
+            for name, (bucket_counts, count, total, _) in sorted(histograms.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets + [float('inf')], bucket_counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float('inf') else repr(bound)
+                    lines.append(f'deet_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+                lines.append(f'deet_stage_seconds_sum{{stage="{name}"}} {total!r}')
+                lines.append(f'deet_stage_seconds_count{{stage="{name}"}} {count}')
+            
+            lines.append("# HELP deet_stage_latency_seconds Recent per-stage latency quantiles")
+            lines.append("# TYPE deet_stage_latency_seconds summary")
+            for name, (_, count, total, recent) in sorted(histograms.items()):
+                for quantile in (0.5, 0.95, 0.99):
+                    value = self._percentile(recent, quantile)
+                    lines.append(f'deet_stage_latency_seconds{{stage="{name}",quantile="{quantile}"}} {value!r}')
+                lines.append(f'deet_stage_latency_seconds_sum{{stage="{name}"}} {total!r}')
+                lines.append(f'deet_stage_latency_seconds_count{{stage="{name}"}} {count}')
+        
+        for name, value in sorted(counters.items()):
+            metric = f"deet_{METRIC_NAME_REGEX.sub('_', name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value:g}")
+        
+        return "\n".join(lines) + "\n" if lines else ""
+    
+    def write_prometheus(self, path: str = METRICS_EXPORT_PATH):
+        if not path:
+            raise ValueError("No metrics export path configured. Set DEET_METRICS_FILE or pass a path.")
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+    
+    def _percentile(self, ordered: List[float], quantile: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+_default_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    return _default_metrics
+
+
+def timed(name: str) -> Callable:
+    return _default_metrics.timed(name)
+
+
+def start_metrics_server(port: int, host: str = '127.0.0.1', metrics: Optional[Metrics] = None) -> ThreadingHTTPServer:
+    registry = metrics or _default_metrics
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = registry.to_prometheus().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,83 @@
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple
+from modules.config import (
+    SPACY_MODEL, NER_DISABLED_COMPONENTS, NER_BATCH_SIZE, NER_N_PROCESS, NER_MAX_CHARS
+)
+
+try:
+    import spacy
+    SPACY_AVAILABLE = True
+except ImportError:
+    SPACY_AVAILABLE = False
+
+ENTITY_LABELS = {
+    'PERSON': 'person',
+    'GPE': 'location',
+    'LOC': 'location',
+    'ORG': 'organization',
+}
+
+Entity = Tuple[str, str, int]
+
+
+class SpacyNER:
+    def __init__(
+        self,
+        model: str = SPACY_MODEL,
+        disable: Optional[List[str]] = None,
+        batch_size: int = NER_BATCH_SIZE,
+        n_process: int = NER_N_PROCESS,
+        max_chars: int = NER_MAX_CHARS
+    ):
+        self.model = model
+        self.disable = list(disable if disable is not None else NER_DISABLED_COMPONENTS)
+        self.batch_size = batch_size
+        self.n_process = max(1, n_process)
+        self.max_chars = max_chars
+        self._nlp = None
+        self._lock = threading.Lock()
+    
+    @property
+    def nlp(self):
+        with self._lock:
+            if self._nlp is None:
+                if not SPACY_AVAILABLE:
+                    raise ImportError(
+                        f"spaCy not available. Please install spacy and run: python -m spacy download {self.model}"
+                    )
+                self._nlp = spacy.load(self.model, disable=self.disable)
+            return self._nlp
+    
+    def is_loaded(self) -> bool:
+        return self._nlp is not None
+    
+    def entities(self, text: str) -> List[Entity]:
+        return self._entities(self.nlp(text[:self.max_chars]))
+    
+    def pipe(self, texts: Iterable[str], n_process: Optional[int] = None) -> Iterator[List[Entity]]:
+        docs = self.nlp.pipe(
+            (text[:self.max_chars] for text in texts),
+            batch_size=self.batch_size,
+            n_process=max(1, n_process or self.n_process)
+        )
+        for doc in docs:
+            yield self._entities(doc)
+    
+    def _entities(self, doc) -> List[Entity]:
+        return [
+            (ENTITY_LABELS[ent.label_], ent.text.strip(), ent.start_char)
+            for ent in doc.ents
+            if ent.label_ in ENTITY_LABELS and ent.text.strip()
+        ]
+
+
+_default_ner: Optional[SpacyNER] = None
+_default_ner_lock = threading.Lock()
+
+
+def get_ner() -> SpacyNER:
+    global _default_ner
+    with _default_ner_lock:
+        if _default_ner is None:
+            _default_ner = SpacyNER()
+        return _default_ner
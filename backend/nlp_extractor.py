@@ -1,111 +1,269 @@
+import copy
 import re
-from typing import List, Dict, Set, Optional
+import threading
+import time
+from collections import deque
+from dataclasses import fields
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain, islice
+from typing import List, Dict, Set, Optional, Tuple, Iterable, Iterator
 from modules.config import (
     EMAIL_PATTERN, PHONE_PATTERN, URL_PATTERN,
-    DEGREE_KEYWORDS, EXPERIENCE_KEYWORDS, ALL_SKILLS
+    DEGREE_KEYWORDS, EXPERIENCE_KEYWORDS,
+    BATCH_WORKERS, BATCH_CHUNK_SIZE, BATCH_MAX_PENDING_CHUNKS, BATCH_MIN_POOL_ITEMS,
+    NER_BACKEND, EXTRACTOR_VERSION, EXTRACTION_CACHE_ENABLED
 )
-from modules.schemas import ExtractedData, Education, Experience
+from modules.schemas import ExtractedData, Education, Experience, BatchItem, BatchReport, BatchResult
+from backend.skill_matcher import get_skill_matcher
+from backend.gazetteer import get_gazetteer, gazetteer_versions
+from backend.extraction_cache import get_extraction_cache
+from backend.metrics import timed
+from backend.sections import SectionIndex, blank_page_markers
+from backend.ner import SpacyNER, Entity, get_ner
+
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+PHONE_REGEX = re.compile(PHONE_PATTERN)
+YEAR_REGEX = re.compile(r'(?:19|20)\d{2}')
+YEAR_RANGE_REGEX = re.compile(r'(?:19|20)\d{2}\s*[-–]\s*(?:19|20)?\d{2}')
+EDUCATION_REGEX = re.compile(r'(?:university|college|institute|school|academy|institution)')
+EXPERIENCE_YEARS_REGEX = re.compile(r'\d+\s*(?:years?|months?)\s*(?:of)?\s*(?:experience|exp)')
+
+
+def keyword_regex(keywords) -> re.Pattern:
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
 
 
 class NLPExtractor:
-    def __init__(self):
-        self.cities = [
-            'hyderabad', 'secunderabad', 'bangalore', 'bengaluru', 'chennai', 'mumbai',
-            'delhi', 'pune', 'kolkata', 'warangal', 'karimnagar', 'nizamabad', 'khammam',
-            'adilabad', 'kakinada', 'vijayawada', 'visakhapatnam', 'tirupati', 'nellore',
-            'gurgaon', 'noida', 'chandigarh', 'jaipur', 'ahmedabad', 'lucknow', 'coimbatore'
-        ]
-        
-        self.name_patterns = [
-            r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})',
-            r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)*)',
-        ]
-        
-        self.company_patterns = [
-            r'(?:at|@|in|with|working at|employed at|joined)\s+([A-Z][A-Za-z\s&]+?)(?:\s*[-|,]|$)',
-            r'^([A-Z][A-Za-z\s&]+?)\s+(?:Pvt\.?|Ltd\.?|Inc\.?|Technologies?|Solutions?|Services?|Systems?|Consulting?)',
-        ]
+    NAME_PATTERNS = (
+        re.compile(r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})'),
+        re.compile(r'([A-Z][a-z]+(?:\s+[A-Z]\.?\s*)?(?:\s+[A-Z][a-z]+)*)'),
+    )
+    
+    NAME_STOP_WORDS = ('email', 'phone', 'address', 'mobile', '@')
+    NAME_MATCH_STOP_WORDS = ('email', 'phone', 'address', 'www', 'http')
+    
+    LOCATION_PATTERNS = (
+        re.compile(r'(?:address|location|city|residing|located)[:\s]+([A-Za-z\s,]+)', re.IGNORECASE),
+        re.compile(r'(?:from|based in)[:\s]+([A-Za-z\s,]+)', re.IGNORECASE),
+    )
+    
+    DEGREE_MAPPING = (
+        ('b.tech', 'B.Tech'),
+        ('b.e.', 'B.E.'),
+        ('b.e ', 'B.E.'),
+        ('b.sc', 'B.Sc'),
+        ('b.com', 'B.Com'),
+        ('b.a', 'B.A'),
+        ('bba', 'BBA'),
+        ('bca', 'BCA'),
+        ('m.tech', 'M.Tech'),
+        ('m.e.', 'M.E.'),
+        ('m.sc', 'M.Sc'),
+        ('m.com', 'M.Com'),
+        ('mba', 'MBA'),
+        ('mca', 'MCA'),
+        ('ph.d', 'Ph.D'),
+        ('phd', 'Ph.D'),
+    )
+    
+    DEGREE_KEYWORDS = tuple(DEGREE_KEYWORDS)
+    DEGREE_KEYWORD_REGEX = keyword_regex(DEGREE_KEYWORDS)
+    
+    COMPANY_PATTERNS = (
+        re.compile(r'(?:at|@|in|with|working at|employed at|joined)\s+([A-Z][A-Za-z\s&]+?)(?:\s*[-|,]|$)', re.IGNORECASE),
+        re.compile(r'^([A-Z][A-Za-z\s&]+?)\s+(?:Pvt\.?|Ltd\.?|Inc\.?|Technologies?|Solutions?|Services?|Systems?|Consulting?)', re.IGNORECASE),
+    )
+    
+    ROLE_KEYWORDS = (
+        'engineer', 'developer', 'manager', 'analyst', 'designer',
+        'consultant', 'architect', 'lead', 'senior', 'junior',
+        'intern', 'trainee', 'associate', 'specialist', 'coordinator',
+        'executive', 'officer', 'supervisor', 'head', 'director', 'vp',
+        'founder', 'co-founder', 'ceo', 'cto', 'cfo', 'product'
+    )
+    ROLE_REGEX = keyword_regex(ROLE_KEYWORDS)
+    
+    DURATION_PATTERNS = (
+        re.compile(r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\s,]+\d{4}[\s,-]+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)?[a-z]*[\s,]?\d{0,4}', re.IGNORECASE),
+        re.compile(r'(?:19|20)\d{2}\s*[-–]\s*(?:present|current|now|19|20)?\d{0,4}', re.IGNORECASE),
+        re.compile(r'\d+\s*(?:years?|months?)\s*(?:of)?\s*(?:experience|exp)', re.IGNORECASE),
+    )
     
-    def extract_all(self, text: str) -> ExtractedData:
+    FIELD_METHODS = {
+        'full_name': '_extract_name',
+        'email': '_extract_email',
+        'phone': '_extract_phone',
+        'location': '_extract_location',
+        'education': '_extract_education',
+        'experience': '_extract_experience',
+        'skills': '_extract_skills',
+    }
+    
+    SCOPE_FINDERS = {
+        'full_name': '_find_name',
+        'email': '_find_email',
+        'phone': '_find_phone',
+        'location': '_find_location',
+    }
+    
+    def __init__(self, ner_backend: str = NER_BACKEND):
+        self.cities = get_gazetteer('cities')
+        self.institutions = get_gazetteer('institutions')
+        self.companies = get_gazetteer('companies')
+        self.name_patterns = self.NAME_PATTERNS
+        self.company_patterns = self.COMPANY_PATTERNS
+        self.skill_matcher = get_skill_matcher()
+        
+        if ner_backend not in ('regex', 'spacy'):
+            raise ValueError(f"Unknown NER backend: {ner_backend}")
+        self.ner_backend = ner_backend
+        self.ner: Optional[SpacyNER] = get_ner() if ner_backend == 'spacy' else None
+        
+        gazetteers = ','.join(f"{name}-{version}" for name, version in sorted(gazetteer_versions().items()))
+        ner = f"spacy/{self.ner.model}" if self.ner is not None else ner_backend
+        self.version = f"v{EXTRACTOR_VERSION}:ner={ner}:gazetteers={gazetteers}"
+    
+    def build_index(self, text: str, entities: Optional[List[Entity]] = None) -> SectionIndex:
+        index = SectionIndex(text)
+        if self.ner is not None:
+            index.attach_entities(self.ner.entities(index.text) if entities is None else entities)
+        return index
+    
+    @timed('extract.all')
+    def extract_all(self, text: str, entities: Optional[List[Entity]] = None) -> ExtractedData:
         data = ExtractedData()
         data.raw_text = text
+        index = self.build_index(text, entities)
         
-        data.email = self._extract_email(text)
-        data.phone = self._extract_phone(text)
+        data.email = self._extract_email(index)
+        data.phone = self._extract_phone(index)
         
-        data.full_name = self._extract_name(text)
-        data.location = self._extract_location(text)
+        data.full_name = self._extract_name(index)
+        data.location = self._extract_location(index)
         
-        data.education = self._extract_education(text)
-        data.experience = self._extract_experience(text)
+        data.education = self._extract_education(index)
+        data.experience = self._extract_experience(index)
         
-        data.skills = self._extract_skills(text)
+        data.skills = self._extract_skills(index)
         
         return data
     
-    def _extract_email(self, text: str) -> str:
-        match = re.search(EMAIL_PATTERN, text)
+    def extract_batch(self, texts: Iterable[str], n_process: Optional[int] = None) -> List[ExtractedData]:
+        texts = list(texts)
+        if self.ner is None:
+            return [self.extract_all(text) for text in texts]
+        
+        return [
+            self.extract_all(text, entities)
+            for text, entities in zip(texts, self.ner.pipe([blank_page_markers(text) for text in texts], n_process))
+        ]
+    
+    def extract_lazy(self, text: str) -> 'LazyExtractedData':
+        return LazyExtractedData(text, self)
+    
+    def extract_field(self, name: str, index: SectionIndex):
+        return getattr(self, self.FIELD_METHODS[name])(index)
+    
+    def contact_scopes(self, index: SectionIndex) -> List[Tuple[str, str]]:
+        contact = index.text_in('contact')
+        whole = (index.text, index.text_lower)
+        return [contact, whole] if contact[0] != index.text else [whole]
+    
+    def find_in_scope(self, name: str, text: str, text_lower: str) -> str:
+        return getattr(self, self.SCOPE_FINDERS[name])(text, text_lower)
+    
+    def _first_in_scopes(self, index: SectionIndex, name: str) -> str:
+        for text, text_lower in self.contact_scopes(index):
+            value = self.find_in_scope(name, text, text_lower)
+            if value:
+                return value
+        return ""
+    
+    @timed('extract.email')
+    def _extract_email(self, index: SectionIndex) -> str:
+        return self._first_in_scopes(index, 'email')
+    
+    @timed('extract.phone')
+    def _extract_phone(self, index: SectionIndex) -> str:
+        return self._first_in_scopes(index, 'phone')
+    
+    @timed('extract.full_name')
+    def _extract_name(self, index: SectionIndex) -> str:
+        return (
+            self.name_from_first_line(index.first_line())
+            or self.entity_name(index)
+            or self._first_in_scopes(index, 'full_name')
+        )
+    
+    @timed('extract.location')
+    def _extract_location(self, index: SectionIndex) -> str:
+        return self.entity_location(index) or self._first_in_scopes(index, 'location')
+    
+    def entity_name(self, index: SectionIndex) -> str:
+        for name in index.entities_in('contact', 'person'):
+            if len(name) > 3 and len(name.split()) <= 4:
+                if not any(c in name.lower() for c in self.NAME_MATCH_STOP_WORDS):
+                    return name
+        return ""
+    
+    def entity_location(self, index: SectionIndex) -> str:
+        locations = index.entities_in('contact', 'location') or index.entities_in(None, 'location')
+        return locations[0].title() if locations else ""
+    
+    def _find_email(self, text: str, text_lower: str) -> str:
+        match = EMAIL_REGEX.search(text)
         return match.group(0) if match else ""
     
-    def _extract_phone(self, text: str) -> str:
-        match = re.search(PHONE_PATTERN, text)
+    def _find_phone(self, text: str, text_lower: str) -> str:
+        match = PHONE_REGEX.search(text)
         if match:
             phone = match.group(0)
             return phone.replace('+91', '').strip()
         return ""
     
-    def _extract_name(self, text: str) -> str:
-        lines = text.strip().split('\n')
-        
-        if lines:
-            first_line = lines[0].strip()
+    def name_from_first_line(self, first_line: str) -> str:
+        if first_line:
             if len(first_line) < 50 and len(first_line.split()) <= 4:
                 words = first_line.split()
                 if all(w[0].isupper() if w else False for w in words if len(w) > 1):
-                    if not any(c in first_line.lower() for c in ['email', 'phone', 'address', 'mobile', '@']):
+                    if not any(c in first_line.lower() for c in self.NAME_STOP_WORDS):
                         return first_line
-        
+        return ""
+    
+    def _find_name(self, text: str, text_lower: str) -> str:
         for pattern in self.name_patterns:
-            matches = re.findall(pattern, text[:500])
+            matches = pattern.findall(text[:500])
             for match in matches:
                 if len(match) > 3 and len(match.split()) <= 4:
-                    if not any(c in match.lower() for c in ['email', 'phone', 'address', 'www', 'http']):
+                    if not any(c in match.lower() for c in self.NAME_MATCH_STOP_WORDS):
                         return match.strip()
-        
         return ""
     
-    def _extract_location(self, text: str) -> str:
-        text_lower = text.lower()
+    def _find_location(self, text: str, text_lower: str) -> str:
+        city = self.cities.first(text_lower)
+        if city:
+            return city
         
-        for city in self.cities:
-            if city in text_lower:
-                return city.title()
-        
-        location_patterns = [
-            r'(?:address|location|city|residing|located)[:\s]+([A-Za-z\s,]+)',
-            r'(?:from|based in)[:\s]+([A-Za-z\s,]+)',
-        ]
-        
-        for pattern in location_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.LOCATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip().title()
         
         return ""
     
-    def _extract_education(self, text: str) -> List[Education]:
+    @timed('extract.education')
+    def _extract_education(self, index: SectionIndex) -> List[Education]:
         education = []
-        lines = text.split('\n')
-        
-        edu_pattern = r'(?:university|college|institute|school|academy|institution)'
+        lines, lower_lines = index.lines_in('education')
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+        for i, line_lower in enumerate(lower_lines):
+            line = lines[i]
             
-            if any(keyword in line_lower for keyword in DEGREE_KEYWORDS):
-                degree = self._extract_degree(line)
+            if self.DEGREE_KEYWORD_REGEX.search(line_lower):
+                degree = self._extract_degree(line_lower)
                 
-                institution = self._extract_institution(line, lines, i)
+                institution = self._extract_institution(lines, lower_lines, i)
                 
                 year = self._extract_year(line)
                 
@@ -116,7 +274,7 @@ class NLPExtractor:
                         year=year or ""
                     ))
             
-            elif re.search(edu_pattern, line_lower):
+            elif EDUCATION_REGEX.search(line_lower):
                 institution = line.strip()
                 year = self._extract_year(line)
                 
@@ -125,189 +283,384 @@ class NLPExtractor:
                     degree="",
                     year=year or ""
                 ))
+            
+            if len(education) == 5:
+                break
         
-        return education[:5]
-    
-    def _extract_degree(self, text: str) -> str:
-        degree_mapping = {
-            'b.tech': 'B.Tech',
-            'b.e.': 'B.E.',
-            'b.e ': 'B.E.',
-            'b.sc': 'B.Sc',
-            'b.com': 'B.Com',
-            'b.a': 'B.A',
-            'bba': 'BBA',
-            'bca': 'BCA',
-            'm.tech': 'M.Tech',
-            'm.e.': 'M.E.',
-            'm.sc': 'M.Sc',
-            'm.com': 'M.Com',
-            'mba': 'MBA',
-            'mca': 'MCA',
-            'ph.d': 'Ph.D',
-            'phd': 'Ph.D',
-        }
-        
-        text_lower = text.lower()
-        for pattern, degree in degree_mapping.items():
+        return education
+    
+    def _extract_degree(self, text_lower: str) -> str:
+        for pattern, degree in self.DEGREE_MAPPING:
             if pattern in text_lower:
                 return degree
         
-        for keyword in DEGREE_KEYWORDS:
+        for keyword in self.DEGREE_KEYWORDS:
             if keyword in text_lower:
                 return keyword.upper()
         
         return ""
     
-    def _extract_institution(self, line: str, lines: List[str], idx: int) -> str:
-        institutions = [
-            'iit', 'nit', 'iiit', 'bits', 'vit', 'amrita', 'manipal',
-            'jntu', 'ou', 'osmania', 'deccan', 'gurunanak',
-            'nawab', 'chancellor', 'university', 'college', 'institute',
-            'rvce', 'jntuh', 'jntuk', 'iim', 'iisc'
-        ]
+    def _extract_institution(self, lines: List[str], lower_lines: List[str], idx: int) -> str:
+        if self.institutions.search(lower_lines[idx], lines[idx]):
+            return lines[idx].strip()
         
-        line_lower = line.lower()
-        for inst in institutions:
-            if inst in line_lower:
-                return line.strip()
-        
-        if idx + 1 < len(lines):
-            next_line = lines[idx + 1].lower()
-            for inst in institutions:
-                if inst in next_line:
-                    return lines[idx + 1].strip()
+        if idx + 1 < len(lines) and self.institutions.search(lower_lines[idx + 1], lines[idx + 1]):
+            return lines[idx + 1].strip()
         
         return ""
     
     def _extract_year(self, text: str) -> str:
-        year_pattern = r'(?:19|20)\d{2}'
-        match = re.search(year_pattern, text)
+        match = YEAR_REGEX.search(text)
         if match:
             return match.group(0)
         
-        year_range = r'(?:19|20)\d{2}\s*[-–]\s*(?:19|20)?\d{2}'
-        match = re.search(year_range, text)
+        match = YEAR_RANGE_REGEX.search(text)
         if match:
             return match.group(0)
         
         return ""
     
-    def _extract_experience(self, text: str) -> List[Experience]:
+    @timed('extract.experience')
+    def _extract_experience(self, index: SectionIndex) -> List[Experience]:
+        return self.experience_entries(index) or self.experience_fallback(index)
+    
+    def experience_entries(self, index: SectionIndex) -> List[Experience]:
         experience = []
-        lines = text.split('\n')
-        
-        exp_section = False
-        exp_keywords = ['experience', 'employment', 'work history', 'professional background', 'career']
-        
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
-            
-            if any(kw in line_lower for kw in exp_keywords):
-                exp_section = True
-                continue
-            
-            if exp_section:
-                if any(kw in line_lower for kw in ['education', 'skills', 'projects', 'certifications', 'academic']):
-                    break
-                
-                if len(line.strip()) > 10:
-                    company = self._extract_company(line, lines, i)
-                    role = self._extract_role(line)
-                    duration = self._extract_duration(line)
-                    
-                    if company or role:
-                        experience.append(Experience(
-                            company=company or "",
-                            role=role or line.strip()[:50],
-                            duration=duration or ""
-                        ))
-        
-        if not experience:
-            for line in lines:
-                if re.search(r'\d+\s*(?:years?|months?)\s*(?:of)?\s*(?:experience|exp)', line.lower()):
-                    exp = Experience(
-                        company="",
-                        role="Experience Detected",
-                        duration=line.strip()
-                    )
-                    experience.append(exp)
+        if not index.has('experience'):
+            return experience
+        
+        for i in index.line_numbers('experience', include_headers=False):
+            entry = self.experience_entry(index.lines[i], index.lower_lines[i], index.entities_on(i, 'organization'))
+            if entry:
+                experience.append(entry)
+                if len(experience) == 5:
                     break
         
-        return experience[:5]
+        return experience
     
-    def _extract_company(self, line: str, lines: List[str], idx: int) -> str:
-        companies = [
-            'tcs', 'infosys', 'wipro', 'accenture', 'cognizant', 'capgemini',
-            'hcl', 'tech mahindra', 'amazon', 'google', 'microsoft', 'apple',
-            'flipkart', 'paytm', 'ola', 'uber', 'swiggy', 'zomato',
-            'facebook', 'meta', 'netflix', 'adobe', 'oracle', 'salesforce',
-            'ibm', 'dell', 'hp', 'intel', 'amd', 'nvidia', 'qualcomm',
-            'byju', 'unacademy', 'upgrad', 'swiggy', 'rapido', ' Dunzo'
-        ]
+    def experience_entry(self, line: str, line_lower: str, organizations: Iterable[str] = ()) -> Optional[Experience]:
+        if len(line.strip()) <= 10:
+            return None
         
-        line_lower = line.lower()
-        for company in companies:
-            if company in line_lower:
-                return company.title()
+        company = next(iter(organizations), "") or self._extract_company(line, line_lower)
+        role = self._extract_role(line, line_lower)
+        
+        if not (company or role):
+            return None
+        
+        return Experience(
+            company=company or "",
+            role=role or line.strip()[:50],
+            duration=self._extract_duration(line) or ""
+        )
+    
+    def experience_fallback(self, index: SectionIndex) -> List[Experience]:
+        for line, line_lower in zip(index.lines, index.lower_lines):
+            if EXPERIENCE_YEARS_REGEX.search(line_lower):
+                return [Experience(
+                    company="",
+                    role="Experience Detected",
+                    duration=line.strip()
+                )]
+        return []
+    
+    def _extract_company(self, line: str, line_lower: str) -> str:
+        company = self.companies.first(line_lower, line)
+        if company:
+            return company
         
         for pattern in self.company_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+            match = pattern.search(line)
             if match:
                 return match.group(1).strip()
         
         return ""
     
-    def _extract_role(self, text: str) -> str:
-        role_keywords = [
-            'engineer', 'developer', 'manager', 'analyst', 'designer',
-            'consultant', 'architect', 'lead', 'senior', 'junior',
-            'intern', 'trainee', 'associate', 'specialist', 'coordinator',
-            'executive', 'officer', 'supervisor', 'head', 'director', 'vp',
-            'founder', 'co-founder', 'ceo', 'cto', 'cfo', 'product'
-        ]
-        
-        text_lower = text.lower()
-        for keyword in role_keywords:
-            if keyword in text_lower:
-                return text.strip()
+    def _extract_role(self, text: str, text_lower: str) -> str:
+        if self.ROLE_REGEX.search(text_lower):
+            return text.strip()
         
         return ""
     
     def _extract_duration(self, text: str) -> str:
-        duration_patterns = [
-            r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*[\s,]+\d{4}[\s,-]+(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)?[a-z]*[\s,]?\d{0,4}',
-            r'(?:19|20)\d{2}\s*[-–]\s*(?:present|current|now|19|20)?\d{0,4}',
-            r'\d+\s*(?:years?|months?)\s*(?:of)?\s*(?:experience|exp)',
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.DURATION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(0)
         
         return ""
     
-    def _extract_skills(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        
-        found_skills = set()
-        
-        words = re.findall(r'\b\w+\b', text_lower)
-        
-        for skill in ALL_SKILLS:
-            if skill in text_lower:
-                found_skills.add(skill)
-            elif len(skill) > 3:
-                for word in words:
-                    if word.startswith(skill[:4]) and len(word) >= len(skill) - 2:
-                        found_skills.add(skill)
+    @timed('extract.skills')
+    def _extract_skills(self, index: SectionIndex) -> List[str]:
+        found_skills = self.skill_matcher.match(index.text)
         
+        return self.rank_skills(found_skills)
+    
+    def rank_skills(self, found_skills: Set[str]) -> List[str]:
         skill_list = sorted(list(found_skills))
         
         return skill_list[:50]
 
 
+def _lazy_field(name: str) -> property:
+    def getter(self):
+        values = self.__dict__['_values']
+        if name not in values:
+            values[name] = self._extractor.extract_field(name, self.section_index)
+        return values[name]
+    
+    def setter(self, value):
+        self.__dict__['_values'][name] = value
+    
+    return property(getter, setter)
+
+
+def _stored_field(name: str, default) -> property:
+    def getter(self):
+        return self.__dict__['_values'].setdefault(name, default())
+    
+    def setter(self, value):
+        self.__dict__['_values'][name] = value
+    
+    return property(getter, setter)
+
+
+class LazyExtractedData(ExtractedData):
+    LAZY_FIELDS = tuple(NLPExtractor.FIELD_METHODS)
+    
+    def __init__(self, text: Optional[str] = None, extractor: Optional[NLPExtractor] = None, **values):
+        unknown = set(values) - {f.name for f in fields(ExtractedData)}
+        if unknown:
+            raise TypeError(f"LazyExtractedData() got unexpected keyword arguments: {', '.join(sorted(unknown))}")
+        self.__dict__['_values'] = {}
+        self._extractor = extractor or get_extractor()
+        self._index: Optional[SectionIndex] = None
+        self.raw_text = values.pop('raw_text', text or "")
+        for name, value in values.items():
+            setattr(self, name, value)
+    
+    full_name = _lazy_field('full_name')
+    email = _lazy_field('email')
+    phone = _lazy_field('phone')
+    location = _lazy_field('location')
+    education = _lazy_field('education')
+    experience = _lazy_field('experience')
+    skills = _lazy_field('skills')
+    raw_text = _stored_field('raw_text', str)
+    raw_skills = _stored_field('raw_skills', list)
+    
+    @property
+    def section_index(self) -> SectionIndex:
+        if self._index is None:
+            self._index = self._extractor.build_index(self.raw_text)
+        return self._index
+    
+    def computed_fields(self) -> List[str]:
+        return [name for name in self.LAZY_FIELDS if name in self._values]
+    
+    def materialize(self) -> ExtractedData:
+        return ExtractedData(**{f.name: getattr(self, f.name) for f in fields(ExtractedData)})
+    
+    def __repr__(self) -> str:
+        shown = [
+            f"{f.name}=<lazy>" if f.name in self.LAZY_FIELDS and f.name not in self._values
+            else f"{f.name}={getattr(self, f.name)!r}"
+            for f in fields(ExtractedData)
+        ]
+        return f"LazyExtractedData({', '.join(shown)})"
+    
+    def __eq__(self, other):
+        if not isinstance(other, ExtractedData):
+            return NotImplemented
+        return all(getattr(self, f.name) == getattr(other, f.name) for f in fields(ExtractedData))
+    
+    def __getstate__(self):
+        return {'_values': dict(self._values), '_extractor': None, '_index': None}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._extractor = get_extractor()
+    
+    def __deepcopy__(self, memo):
+        clone = LazyExtractedData.__new__(LazyExtractedData)
+        clone.__dict__.update(
+            _values=copy.deepcopy(self._values, memo),
+            _extractor=self._extractor,
+            _index=self._index
+        )
+        return clone
+
+
+_default_extractor: Optional[NLPExtractor] = None
+_default_extractor_lock = threading.Lock()
+
+
+def get_extractor() -> NLPExtractor:
+    global _default_extractor
+    with _default_extractor_lock:
+        if _default_extractor is None:
+            _default_extractor = NLPExtractor()
+        return _default_extractor
+
+
 def extract_from_text(text: str) -> ExtractedData:
-    extractor = NLPExtractor()
-    return extractor.extract_all(text)
+    if EXTRACTION_CACHE_ENABLED:
+        return get_extraction_cache().extract(get_extractor(), text)
+    return get_extractor().extract_all(text)
+
+
+def extract_lazy(text: str) -> LazyExtractedData:
+    return get_extractor().extract_lazy(text)
+
+
+def _extract_chunk(texts: List[str]) -> List[Tuple[Optional[ExtractedData], str]]:
+    extractor = get_extractor()
+    if extractor.ner is not None:
+        try:
+            return [(data, "") for data in extractor.extract_batch(texts)]
+        except Exception:
+            pass
+    
+    results = []
+    for text in texts:
+        try:
+            results.append((extractor.extract_all(text), ""))
+        except Exception as e:
+            results.append((None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class BatchExtractor:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        max_pending_chunks: int = BATCH_MAX_PENDING_CHUNKS,
+        min_pool_items: int = BATCH_MIN_POOL_ITEMS
+    ):
+        self.workers = max(1, workers if workers is not None else BATCH_WORKERS)
+        self.chunk_size = max(1, chunk_size)
+        self.max_pending = max(1, max_pending_chunks) * self.workers
+        self.min_pool_items = min_pool_items
+        self.report = BatchReport(workers=self.workers)
+        self._started = 0.0
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    def run(self, texts: Iterable[str]) -> BatchResult:
+        items = list(self.stream(texts))
+        return BatchResult(items=items, report=self.report)
+    
+    def stream(self, texts: Iterable[str]) -> Iterator[BatchItem]:
+        self.report = BatchReport(workers=self.workers)
+        self._started = time.perf_counter()
+        
+        texts = iter(texts)
+        head = list(islice(texts, self.min_pool_items))
+        chunks = self._chunks(chain(head, texts))
+        
+        if self.workers == 1 or len(head) < self.min_pool_items:
+            self.report.workers = 1
+            for start, chunk in chunks:
+                yield from self._collect(start, chunk, _extract_chunk(chunk))
+            return
+        
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        pending = deque()
+        try:
+            for start, chunk in chunks:
+                future = self._submit(chunk)
+                pending.append((start, chunk, future, self._pool))
+                if len(pending) >= self.max_pending:
+                    yield from self._collect_future(*pending.popleft())
+            
+            while pending:
+                yield from self._collect_future(*pending.popleft())
+        finally:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+    
+    def _chunks(self, texts: Iterator[str]) -> Iterator[Tuple[int, List[str]]]:
+        start = 0
+        while True:
+            chunk = list(islice(texts, self.chunk_size))
+            if not chunk:
+                return
+            yield start, chunk
+            start += len(chunk)
+    
+    def _renew_pool(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+    
+    def _submit(self, chunk: List[str]) -> Future:
+        try:
+            return self._pool.submit(_extract_chunk, chunk)
+        except BrokenProcessPool:
+            self._renew_pool()
+            return self._pool.submit(_extract_chunk, chunk)
+    
+    def _collect_future(
+        self,
+        start: int,
+        chunk: List[str],
+        future: Future,
+        pool: ProcessPoolExecutor
+    ) -> Iterator[BatchItem]:
+        try:
+            results = future.result()
+        except BrokenProcessPool:
+            results = self._isolate(chunk, pool)
+        except Exception as e:
+            results = [(None, f"{type(e).__name__}: {e}")] * len(chunk)
+        return self._collect(start, chunk, results)
+    
+    def _isolate(self, chunk: List[str], pool: ProcessPoolExecutor) -> List[Tuple[Optional[ExtractedData], str]]:
+        if pool is self._pool:
+            self._renew_pool()
+        
+        results = []
+        for text in chunk:
+            try:
+                results.extend(self._pool.submit(_extract_chunk, [text]).result())
+            except BrokenProcessPool:
+                self._renew_pool()
+                results.append((None, "BrokenProcessPool: worker crashed"))
+            except Exception as e:
+                results.append((None, f"{type(e).__name__}: {e}"))
+        return results
+    
+    def _collect(
+        self,
+        start: int,
+        chunk: List[str],
+        results: List[Tuple[Optional[ExtractedData], str]]
+    ) -> Iterator[BatchItem]:
+        report = self.report
+        for offset, (data, error) in enumerate(results):
+            report.total += 1
+            if error:
+                report.failed += 1
+            else:
+                report.succeeded += 1
+            
+            report.elapsed_seconds = time.perf_counter() - self._started
+            if report.elapsed_seconds > 0:
+                report.resumes_per_second = report.total / report.elapsed_seconds
+            
+            yield BatchItem(index=start + offset, data=data, error=error)
+
+
+def extract_many(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE
+) -> BatchResult:
+    return BatchExtractor(workers=workers, chunk_size=chunk_size).run(texts)
+
+
+def extract_stream(
+    texts: Iterable[str],
+    workers: Optional[int] = None,
+    chunk_size: int = BATCH_CHUNK_SIZE
+) -> Iterator[BatchItem]:
+    return BatchExtractor(workers=workers, chunk_size=chunk_size).stream(texts)
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict
+from typing import Dict, Any, Optional
+from modules.config import OCR_CACHE_DIR, OCR_CACHE_MAX_BYTES
+from modules.schemas import OCRResult, PageText, OCRLine, OCRWord
+
+
+class OCRCache:
+    def __init__(self, cache_dir: str = OCR_CACHE_DIR, max_bytes: int = OCR_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+    
+    def make_key(self, file_bytes: bytes, config_signature: str) -> str:
+        digest = hashlib.sha256(file_bytes)
+        digest.update(b'\0')
+        digest.update(config_signature.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[OCRResult]:
+        path = self._path(key)
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        
+        return OCRResult(
+            text=payload['text'],
+            pages=[self._load_page(page) for page in payload.get('pages', [])],
+            skipped_pages=payload.get('skipped_pages', []),
+            confidence=payload.get('confidence')
+        )
+    
+    def put(self, key: str, result: OCRResult):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        data = json.dumps(asdict(result)).encode('utf-8')
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        
+        previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_size()
+            else:
+                self._total_bytes += len(data) - previous_size
+            
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+    
+    def clear(self):
+        with self._lock:
+            for path, _, _ in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._total_bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "bytes": self._total_bytes if self._total_bytes is not None else self._scan_size(),
+                "max_bytes": self.max_bytes
+            }
+    
+    def _load_page(self, page: Dict[str, Any]) -> PageText:
+        lines = [
+            OCRLine(**{**line, 'words': [OCRWord(**word) for word in line.get('words', [])]})
+            for line in page.get('lines', [])
+        ]
+        return PageText(**{**page, 'lines': lines})
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+    
+    def _entries(self):
+        if not os.path.isdir(self.cache_dir):
+            return []
+        
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.json'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        
+        return entries
+    
+    def _scan_size(self) -> int:
+        return sum(size for _, _, size in self._entries())
+    
+    def _evict(self):
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * 0.9)
+        
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+        
+        self._total_bytes = total
+
+
+_default_cache: Optional[OCRCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_ocr_cache() -> OCRCache:
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = OCRCache()
+        return _default_cache
@@ -1,74 +1,387 @@
 import io
+import os
 import re
-from typing import Optional
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import pytesseract
-from PIL import Image, ImageEnhance, ImageFilter
-import numpy as np
+from PIL import Image
+from modules.config import (
+    OCR_TESSERACT_CONFIG, OCR_CLEANUP_VERSION, OCR_MAX_WORKERS, OCR_TARGET_DPI, OCR_CACHE_ENABLED,
+    PDF_TEXT_LAYER_ENABLED, PDF_TEXT_LAYER_MIN_CHARS,
+    OCR_MIN_LINE_CONFIDENCE, OCR_REOCR_ENABLED, OCR_REOCR_PSM, OCR_REOCR_SCALE, OCR_REOCR_MAX_LINES
+)
+from modules.schemas import OCRResult, PageText, OCRLine, OCRWord
+from backend.ocr_cache import OCRCache, get_ocr_cache
+from backend.preprocessing import ImagePreprocessor
+from backend.page_classifier import PageClassifier
+from backend.metrics import get_metrics, timed
 
 try:
-    from pdf2image import convert_from_bytes
+    from pdf2image import convert_from_path, pdfinfo_from_path
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
 
+PDFTOTEXT_PATH = shutil.which('pdftotext')
+
 
 class OCREngine:
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_text_layer: bool = PDF_TEXT_LAYER_ENABLED,
+        cache: Optional[OCRCache] = None,
+        preprocessor: Optional[ImagePreprocessor] = None,
+        page_classifier_factory: Callable[[], PageClassifier] = PageClassifier,
+        reocr: bool = OCR_REOCR_ENABLED
+    ):
         self.supported_formats = ['pdf', 'jpg', 'jpeg', 'png']
+        self.tesseract_config = OCR_TESSERACT_CONFIG
+        self.max_workers = max(1, max_workers if max_workers is not None else OCR_MAX_WORKERS)
+        self.use_text_layer = use_text_layer and PDFTOTEXT_PATH is not None
+        self.cache = cache
+        self.preprocessor = preprocessor or ImagePreprocessor()
+        self.page_classifier_factory = page_classifier_factory
+        self.reocr = reocr
+        self.min_line_confidence = OCR_MIN_LINE_CONFIDENCE
+        
+        if self.max_workers > 1:
+            os.environ.setdefault('OMP_THREAD_LIMIT', '1')
     
     def process_file(self, file_bytes: bytes, filename: str) -> str:
+        return self.process_document(file_bytes, filename).text
+    
+    @timed('ocr.document')
+    def process_document(self, file_bytes: bytes, filename: str) -> OCRResult:
+        cached = self.cached_document(file_bytes, filename)
+        if cached is not None:
+            get_metrics().inc('ocr.cache_hits')
+            return cached
+        if self.cache is not None:
+            get_metrics().inc('ocr.cache_misses')
+        
+        result = self._process_document(file_bytes, filename)
+        self.store_document(file_bytes, filename, result)
+        return result
+    
+    def cached_document(self, file_bytes: bytes, filename: str) -> Optional[OCRResult]:
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.make_key(file_bytes, self.config_signature(filename)))
+    
+    def store_document(self, file_bytes: bytes, filename: str, result: OCRResult):
+        if self.cache is not None:
+            self.cache.put(self.cache.make_key(file_bytes, self.config_signature(filename)), result)
+    
+    def config_signature(self, filename: str) -> str:
+        ext = filename.split('.')[-1].lower()
+        text_layer = f"text_layer:{PDF_TEXT_LAYER_MIN_CHARS}" if self.use_text_layer else "ocr_only"
+        pages = self.page_classifier_factory().signature()
+        reocr = (
+            f"reocr:{self.min_line_confidence}:psm{OCR_REOCR_PSM}:x{OCR_REOCR_SCALE}:{OCR_REOCR_MAX_LINES}"
+            if self.reocr else "reocr:off"
+        )
+        return f"{ext}|{self.tesseract_config}|preprocess:{self.preprocessor.signature()}|cleanup:v{OCR_CLEANUP_VERSION}|{text_layer}|{pages}|{reocr}"
+    
+    def _process_document(self, file_bytes: bytes, filename: str) -> OCRResult:
         ext = filename.split('.')[-1].lower()
         
         if ext == 'pdf':
-            return self._process_pdf(file_bytes)
+            return self.build_pdf_result(self._process_pdf_pages(file_bytes))
         elif ext in ['jpg', 'jpeg', 'png']:
-            return self._process_image(file_bytes)
+            page = self._recognize_image(self._open_image(file_bytes), 1)
+            return OCRResult(
+                text=self._cleanup_text(page.text),
+                pages=[page],
+                confidence=page.confidence
+            )
         else:
             raise ValueError(f"Unsupported file format: {ext}")
     
+    def build_pdf_result(self, pages: List[PageText]) -> OCRResult:
+        return OCRResult(
+            text=self.join_pages(pages),
+            pages=pages,
+            skipped_pages=[page.page_number for page in pages if page.source in ("blank", "duplicate")],
+            confidence=self._document_confidence(pages)
+        )
+    
     def _process_pdf(self, file_bytes: bytes) -> str:
+        return self.join_pages(self._process_pdf_pages(file_bytes))
+    
+    def _process_pdf_pages(self, file_bytes: bytes) -> List[PageText]:
+        return list(self.iter_pdf_pages(file_bytes))
+    
+    def iter_pdf_pages(self, file_bytes: bytes, window: Optional[int] = None) -> Iterator[PageText]:
         if not PDF2IMAGE_AVAILABLE:
             raise ImportError("pdf2image not available. Please install poppler-utils.")
         
-        images = convert_from_bytes(file_bytes)
+        window = max(1, window or self.max_workers)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pdf_path = os.path.join(tmp_dir, 'input.pdf')
+            with open(pdf_path, 'wb') as f:
+                f.write(file_bytes)
+            
+            page_count = pdfinfo_from_path(pdf_path)['Pages']
+            layer_texts = self._extract_text_layer(pdf_path, page_count) if self.use_text_layer else []
+            
+            workers = min(self.max_workers, window)
+            executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+            classifier = self.page_classifier_factory()
+            recognized: Dict[int, PageText] = {}
+            
+            try:
+                for first in range(1, page_count + 1, window):
+                    page_numbers = list(range(first, min(first + window, page_count + 1)))
+                    ocr_page_numbers = [
+                        n for n in page_numbers
+                        if not self._has_usable_text(self._layer_text(layer_texts, n))
+                    ]
+                    
+                    image_paths = self._rasterize_to_paths(pdf_path, ocr_page_numbers, tmp_dir)
+                    kinds = {
+                        page_number: self._classify_page(path, page_number, classifier)
+                        for page_number, path in zip(ocr_page_numbers, image_paths)
+                    }
+                    content = [
+                        (page_number, path)
+                        for page_number, path in zip(ocr_page_numbers, image_paths)
+                        if kinds[page_number][0] == "content"
+                    ]
+                    
+                    content_numbers = [page_number for page_number, _ in content]
+                    content_paths = [path for _, path in content]
+                    if executor is not None:
+                        ocr_pages = list(executor.map(self._ocr_image_path, content_paths, content_numbers))
+                    else:
+                        ocr_pages = [self._ocr_image_path(path, n) for path, n in zip(content_paths, content_numbers)]
+                    recognized.update(zip(content_numbers, ocr_pages))
+                    
+                    for page_number in page_numbers:
+                        kind, original = kinds.get(page_number, ("text_layer", None))
+                        if kind == "content":
+                            yield recognized[page_number]
+                        elif kind == "blank":
+                            yield PageText(page_number=page_number, text="", source="blank")
+                        elif kind == "duplicate":
+                            source_page = recognized.get(original)
+                            yield PageText(
+                                page_number=page_number,
+                                text=source_page.text if source_page else "",
+                                source="duplicate",
+                                duplicate_of=original,
+                                confidence=source_page.confidence if source_page else None,
+                                lines=source_page.lines if source_page else []
+                            )
+                        else:
+                            yield PageText(
+                                page_number=page_number,
+                                text=self._layer_text(layer_texts, page_number),
+                                source="text_layer"
+                            )
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+    
+    @timed('ocr.text_layer')
+    def _extract_text_layer(self, pdf_path: str, page_count: int) -> List[str]:
+        try:
+            result = subprocess.run(
+                [PDFTOTEXT_PATH, '-enc', 'UTF-8', pdf_path, '-'],
+                capture_output=True,
+                timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return []
+        
+        if result.returncode != 0:
+            return []
+        
+        return result.stdout.decode('utf-8', errors='ignore').split('\f')[:page_count]
+    
+    def _layer_text(self, layer_texts: List[str], page_number: int) -> str:
+        return layer_texts[page_number - 1] if page_number <= len(layer_texts) else ""
+    
+    def _has_usable_text(self, text: str) -> bool:
+        return sum(1 for c in text if c.isalnum()) >= PDF_TEXT_LAYER_MIN_CHARS
+    
+    @timed('ocr.rasterize')
+    def _rasterize_to_paths(self, pdf_path: str, page_numbers: List[int], output_dir: str) -> List[str]:
+        paths = []
+        run_start = None
+        
+        for i, page_number in enumerate(page_numbers):
+            if run_start is None:
+                run_start = page_number
+            if i + 1 == len(page_numbers) or page_numbers[i + 1] != page_number + 1:
+                paths.extend(convert_from_path(
+                    pdf_path,
+                    first_page=run_start,
+                    last_page=page_number,
+                    dpi=OCR_TARGET_DPI,
+                    output_folder=output_dir,
+                    paths_only=True
+                ))
+                run_start = None
+        
+        return paths
+    
+    @timed('ocr.classify_page')
+    def _classify_page(self, path: str, page_number: int, classifier: PageClassifier) -> Tuple[str, Optional[int]]:
+        with Image.open(path) as image:
+            kind, original = classifier.classify(image, page_number)
+        
+        if kind != "content":
+            os.remove(path)
+        
+        return kind, original
+    
+    def _ocr_image_path(self, path: str, page_number: int) -> PageText:
+        try:
+            with Image.open(path) as image:
+                image.info['dpi'] = (OCR_TARGET_DPI, OCR_TARGET_DPI)
+                return self._recognize_image(image, page_number)
+        finally:
+            os.remove(path)
+    
+    def join_pages(self, pages: List[PageText]) -> str:
         full_text = ""
         
-        for i, image in enumerate(images):
-            text = self._extract_text_from_image(image)
-            full_text += f"\n--- Page {i+1} ---\n{text}"
+        for page in pages:
+            full_text += f"\n--- Page {page.page_number} ---\n{page.text}"
         
         return self._cleanup_text(full_text)
     
-    def _process_image(self, file_bytes: bytes) -> str:
+    def _document_confidence(self, pages: List[PageText]) -> Optional[float]:
+        scores = [page.confidence for page in pages if page.source == "ocr" and page.confidence is not None]
+        return sum(scores) / len(scores) if scores else None
+    
+    def _open_image(self, file_bytes: bytes) -> Image.Image:
         image = Image.open(io.BytesIO(file_bytes))
         
         if image.mode != 'RGB':
             image = image.convert('RGB')
         
-        text = self._extract_text_from_image(image)
+        return image
+    
+    def _process_image(self, file_bytes: bytes) -> str:
+        text = self._extract_text_from_image(self._open_image(file_bytes))
         return self._cleanup_text(text)
     
     def _extract_text_from_image(self, image: Image.Image) -> str:
-        gray = image.convert('L')
+        return self._recognize_image(image, 1).text
+    
+    @timed('ocr.recognize')
+    def _recognize_image(self, image: Image.Image, page_number: int) -> PageText:
+        prepared = self.preprocessor.process(image)
+        
+        with get_metrics().timer('ocr.tesseract'):
+            data = pytesseract.image_to_data(
+                prepared,
+                config=self.tesseract_config,
+                output_type=pytesseract.Output.DICT
+            )
+        lines = self._group_lines(data)
         
-        enhancer = ImageEnhance.Contrast(gray)
-        enhanced = enhancer.enhance(1.5)
+        if self.reocr:
+            weak = [i for i, line in enumerate(lines) if line.confidence < self.min_line_confidence]
+            for i in sorted(weak, key=lambda i: lines[i].confidence)[:OCR_REOCR_MAX_LINES]:
+                lines[i] = self._reocr_line(prepared, lines[i])
         
-        enhanced = enhanced.filter(ImageFilter.MedianFilter(size=3))
+        words = [word for line in lines for word in line.words]
+        confidence = sum(word.confidence for word in words) / len(words) if words else None
         
-        text = pytesseract.image_to_string(
-            enhanced,
-            config='--psm 6 --oem 3'
+        return PageText(
+            page_number=page_number,
+            text="\n".join(line.text for line in lines),
+            source="ocr",
+            confidence=confidence,
+            lines=lines
         )
+    
+    def _group_lines(self, data: Dict[str, list], offset: Tuple[int, int] = (0, 0), scale: float = 1.0) -> List[OCRLine]:
+        grouped: Dict[Tuple[int, int, int], List[int]] = {}
         
-        return text
+        for i, word in enumerate(data['text']):
+            if not str(word).strip() or float(data['conf'][i]) < 0:
+                continue
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            grouped.setdefault(key, []).append(i)
+        
+        lines = []
+        for indices in grouped.values():
+            words = [OCRWord(text=str(data['text'][i]).strip(), confidence=float(data['conf'][i])) for i in indices]
+            left = min(data['left'][i] for i in indices)
+            top = min(data['top'][i] for i in indices)
+            right = max(data['left'][i] + data['width'][i] for i in indices)
+            bottom = max(data['top'][i] + data['height'][i] for i in indices)
+            
+            lines.append(OCRLine(
+                text=" ".join(word.text for word in words),
+                confidence=sum(word.confidence for word in words) / len(words),
+                bbox=[
+                    offset[0] + int(left / scale),
+                    offset[1] + int(top / scale),
+                    int((right - left) / scale),
+                    int((bottom - top) / scale)
+                ],
+                words=words
+            ))
+        
+        return lines
     
+    @timed('ocr.reocr_line')
+    def _reocr_line(self, prepared: Image.Image, line: OCRLine) -> OCRLine:
+        left, top, width, height = line.bbox
+        pad = max(4, height // 4)
+        box = (
+            max(0, left - pad),
+            max(0, top - pad),
+            min(prepared.width, left + width + pad),
+            min(prepared.height, top + height + pad)
+        )
+        
+        crop = prepared.crop(box)
+        crop = crop.resize(
+            (max(1, int(crop.width * OCR_REOCR_SCALE)), max(1, int(crop.height * OCR_REOCR_SCALE))),
+            Image.BICUBIC
+        )
+        
+        data = pytesseract.image_to_data(
+            crop,
+            config=re.sub(r'--psm\s+\d+', f'--psm {OCR_REOCR_PSM}', self.tesseract_config),
+            output_type=pytesseract.Output.DICT
+        )
+        candidates = self._group_lines(data, offset=(box[0], box[1]), scale=OCR_REOCR_SCALE)
+        
+        words = [word for candidate in candidates for word in candidate.words]
+        if not words:
+            return line
+        
+        confidence = sum(word.confidence for word in words) / len(words)
+        if confidence <= line.confidence:
+            return line
+        
+        return OCRLine(
+            text=" ".join(word.text for word in words),
+            confidence=confidence,
+            bbox=line.bbox,
+            words=words,
+            reocr=True
+        )
+    
+    @timed('ocr.cleanup')
     def _cleanup_text(self, text: str) -> str:
         text = re.sub(r'\n\s*\n', '\n\n', text)
         
         text = re.sub(r'[^\x00-\x7F]+', ' ', text)
         
-        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'[^\S\n]+', ' ', text)
         
         lines = text.split('\n')
         cleaned_lines = [line.strip() for line in lines if line.strip()]
@@ -77,8 +390,41 @@ class OCREngine:
         return text
 
 
+def field_confidence(result: OCRResult, value: str) -> Optional[float]:
+    needle = value.strip().lower()
+    if not needle:
+        return None
+    
+    scores = [
+        line.confidence
+        for page in result.pages
+        for line in page.lines
+        if needle in line.text.lower()
+    ]
+    return max(scores) if scores else None
+
+
+def default_ocr_cache() -> Optional[OCRCache]:
+    return get_ocr_cache() if OCR_CACHE_ENABLED else None
+
+
+_default_engine: Optional[OCREngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_ocr_engine() -> OCREngine:
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = OCREngine(cache=default_ocr_cache())
+        return _default_engine
+
+
 def extract_text_from_file(uploaded_file) -> str:
-    engine = OCREngine()
     file_bytes = uploaded_file.getvalue()
     filename = uploaded_file.name
-    return engine.process_file(file_bytes, filename)
+    return get_ocr_engine().process_file(file_bytes, filename)
+
+
+def extract_document_from_file(uploaded_file) -> OCRResult:
+    return get_ocr_engine().process_document(uploaded_file.getvalue(), uploaded_file.name)
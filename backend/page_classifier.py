@@ -0,0 +1,85 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from PIL import Image
+from modules.config import (
+    OCR_SKIP_BLANK_PAGES, OCR_BLANK_INK_RATIO, OCR_BLANK_INK_CONTRAST,
+    OCR_SKIP_DUPLICATE_PAGES, OCR_DUPLICATE_HASH_DISTANCE, OCR_DUPLICATE_MAX_DIFF
+)
+
+
+class PageClassifier:
+    THUMBNAIL_WIDTH = 512
+    HASH_SIZE = 16
+    
+    def __init__(
+        self,
+        skip_blank: bool = OCR_SKIP_BLANK_PAGES,
+        skip_duplicates: bool = OCR_SKIP_DUPLICATE_PAGES,
+        blank_ink_ratio: float = OCR_BLANK_INK_RATIO,
+        duplicate_distance: int = OCR_DUPLICATE_HASH_DISTANCE,
+        duplicate_max_diff: float = OCR_DUPLICATE_MAX_DIFF
+    ):
+        self.skip_blank = skip_blank
+        self.skip_duplicates = skip_duplicates
+        self.blank_ink_ratio = blank_ink_ratio
+        self.duplicate_distance = duplicate_distance
+        self.duplicate_max_diff = duplicate_max_diff
+        self._seen: List[Tuple[int, np.ndarray, Tuple[int, int], int]] = []
+    
+    def signature(self) -> str:
+        blank = f"blank:{self.blank_ink_ratio}" if self.skip_blank else "blank:off"
+        duplicate = (
+            f"dup:{self.duplicate_distance}:{self.duplicate_max_diff}"
+            if self.skip_duplicates else "dup:off"
+        )
+        return f"{blank}|{duplicate}"
+    
+    def classify(self, image: Image.Image, page_number: int) -> Tuple[str, Optional[int]]:
+        if not (self.skip_blank or self.skip_duplicates):
+            return "content", None
+        
+        ink = self.ink_mask(image)
+        
+        if self.skip_blank and ink.mean() < self.blank_ink_ratio:
+            return "blank", None
+        
+        if self.skip_duplicates:
+            page_hash = self.ink_hash(ink)
+            packed = np.packbits(ink)
+            original = self._find_duplicate(page_hash, packed, ink.shape)
+            if original is not None:
+                return "duplicate", original
+            self._seen.append((page_hash, packed, ink.shape, page_number))
+        
+        return "content", None
+    
+    def ink_mask(self, image: Image.Image) -> np.ndarray:
+        gray = image.convert('L')
+        factor = max(1, gray.width // self.THUMBNAIL_WIDTH)
+        if factor > 1:
+            gray = gray.reduce(factor)
+        height = max(self.HASH_SIZE, round(gray.height * self.THUMBNAIL_WIDTH / gray.width))
+        
+        thumbnail = np.asarray(gray.resize((self.THUMBNAIL_WIDTH, height), Image.BILINEAR), dtype=np.int16)
+        return thumbnail < np.median(thumbnail) - OCR_BLANK_INK_CONTRAST
+    
+    def ink_hash(self, ink: np.ndarray) -> int:
+        n = self.HASH_SIZE
+        height, width = ink.shape
+        cells = ink[:height // n * n, :width // n * n].reshape(n, height // n, n, width // n).mean(axis=(1, 3))
+        bits = (cells > cells.mean()).ravel()
+        return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+    
+    def _find_duplicate(self, page_hash: int, packed: np.ndarray, shape: Tuple[int, int]) -> Optional[int]:
+        for seen_hash, seen_packed, seen_shape, page_number in self._seen:
+            if seen_shape != shape:
+                continue
+            if bin(page_hash ^ seen_hash).count('1') > self.duplicate_distance:
+                continue
+            
+            differing = np.unpackbits(seen_packed ^ packed).sum()
+            inked = np.unpackbits(seen_packed | packed).sum()
+            if inked and differing / inked <= self.duplicate_max_diff:
+                return page_number
+        
+        return None
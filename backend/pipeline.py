@@ -0,0 +1,192 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Any, Callable, Dict, Optional
+from modules.config import (
+    EXTRACTION_CACHE_ENABLED, PIPELINE_PARALLEL_ANALYSIS, PIPELINE_ANALYSIS_WORKERS, PIPELINE_PARALLEL_MIN_MS
+)
+from modules.schemas import ExtractedData, FraudReport, HealthScore, OCRResult, PipelineResult
+from backend.nlp_extractor import NLPExtractor, get_extractor
+from backend.extraction_cache import ExtractionCache, get_extraction_cache
+from backend.health_scorer import HealthScorer, get_health_scorer
+from backend.fraud_detector import FraudDetector, get_fraud_detector
+from backend.metrics import get_metrics
+
+
+class ResumePipeline:
+    STAGES = ('ocr', 'extract', 'health', 'fraud')
+    
+    def __init__(
+        self,
+        ocr_engine=None,
+        extractor: Optional[NLPExtractor] = None,
+        health_scorer: Optional[HealthScorer] = None,
+        fraud_detector: Optional[FraudDetector] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
+        use_cache: bool = EXTRACTION_CACHE_ENABLED,
+        parallel_analysis: bool = PIPELINE_PARALLEL_ANALYSIS,
+        stages: Optional[Dict[str, Callable]] = None
+    ):
+        self.ocr_engine = ocr_engine
+        self.extractor = extractor or get_extractor()
+        self.health_scorer = health_scorer or get_health_scorer()
+        self.fraud_detector = fraud_detector or get_fraud_detector()
+        self.extraction_cache = (extraction_cache or get_extraction_cache()) if use_cache else None
+        self.parallel_analysis = parallel_analysis
+        self.parallel_min_ms = PIPELINE_PARALLEL_MIN_MS
+        self.average_ms: Dict[str, float] = {}
+        
+        self.stages: Dict[str, Callable] = {
+            'ocr': self._ocr,
+            'extract': self._extract,
+            'health': self._health,
+            'fraud': self._fraud,
+        }
+        for name, stage in (stages or {}).items():
+            self.set_stage(name, stage)
+        
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    def set_stage(self, name: str, stage: Callable):
+        if name not in self.STAGES:
+            raise ValueError(f"Unknown pipeline stage: {name}")
+        self.stages[name] = stage
+        self.average_ms.pop(name, None)
+    
+    def run(
+        self,
+        text: Optional[str] = None,
+        file_bytes: Optional[bytes] = None,
+        filename: str = ""
+    ) -> PipelineResult:
+        if text is None and file_bytes is None:
+            raise ValueError("Provide either text or file_bytes")
+        
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        
+        ocr: Optional[OCRResult] = None
+        if text is None:
+            ocr = self._timed('ocr', timings, self.stages['ocr'], file_bytes, filename)
+            text = ocr.text
+        
+        extracted = self._timed('extract', timings, self.stages['extract'], text)
+        health, fraud = self.analyze(extracted, timings)
+        
+        timings['total'] = (time.perf_counter() - start) * 1000
+        return PipelineResult(
+            raw_text=text,
+            extracted=extracted,
+            health=health,
+            fraud=fraud,
+            timings=timings,
+            ocr=ocr
+        )
+    
+    def run_text(self, text: str) -> PipelineResult:
+        return self.run(text=text)
+    
+    def run_file(self, file_bytes: bytes, filename: str) -> PipelineResult:
+        return self.run(file_bytes=file_bytes, filename=filename)
+    
+    def analyze(self, extracted: ExtractedData, timings: Optional[Dict[str, float]] = None):
+        timings = {} if timings is None else timings
+        
+        if not self.should_parallelize():
+            health = self._timed('health', timings, self.stages['health'], extracted)
+            fraud = self._timed('fraud', timings, self.stages['fraud'], extracted)
+            return health, fraud
+        
+        fraud_future = self._get_executor().submit(self._timed, 'fraud', timings, self.stages['fraud'], extracted)
+        health = self._timed('health', timings, self.stages['health'], extracted)
+        return health, fraud_future.result()
+    
+    def should_parallelize(self) -> bool:
+        if not self.parallel_analysis:
+            return False
+        return min(self.average_ms.get('health', 0.0), self.average_ms.get('fraud', 0.0)) >= self.parallel_min_ms
+    
+    def shutdown(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+    
+    def _timed(self, name: str, timings: Dict[str, float], stage: Callable, *args) -> Any:
+        start = time.perf_counter()
+        try:
+            return stage(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            timings[name] = elapsed * 1000
+            self.average_ms[name] = 0.8 * self.average_ms.get(name, timings[name]) + 0.2 * timings[name]
+            get_metrics().observe(f'pipeline.{name}', elapsed)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=PIPELINE_ANALYSIS_WORKERS,
+                    thread_name_prefix='deet-pipeline'
+                )
+            return self._executor
+    
+    def _ocr(self, file_bytes: bytes, filename: str) -> OCRResult:
+        if self.ocr_engine is None:
+            from backend.ocr_engine import get_ocr_engine
+            self.ocr_engine = get_ocr_engine()
+        return self.ocr_engine.process_document(file_bytes, filename)
+    
+    def _extract(self, text: str) -> ExtractedData:
+        if self.extraction_cache is not None:
+            return self.extraction_cache.extract(self.extractor, text)
+        return self.extractor.extract_all(text)
+    
+    def _health(self, extracted: ExtractedData) -> HealthScore:
+        return self.health_scorer.calculate(
+            extracted.email,
+            extracted.phone,
+            len(extracted.education),
+            len(extracted.experience),
+            extracted.skills,
+            extracted.location
+        )
+    
+    def _fraud(self, extracted: ExtractedData) -> FraudReport:
+        return self.fraud_detector.analyze(
+            extracted.phone,
+            extracted.email,
+            extracted.skills,
+            len(extracted.experience),
+            extracted.raw_text
+        )
+
+
+def result_to_dict(result: PipelineResult) -> Dict[str, Any]:
+    return {
+        "raw_text": result.raw_text,
+        "extracted": asdict(result.extracted),
+        "health": asdict(result.health),
+        "fraud": asdict(result.fraud),
+        "timings": result.timings,
+        "ocr_confidence": result.ocr.confidence if result.ocr is not None else None,
+        "skipped_pages": result.ocr.skipped_pages if result.ocr is not None else [],
+    }
+
+
+_default_pipeline: Optional[ResumePipeline] = None
+_default_pipeline_lock = threading.Lock()
+
+
+def get_pipeline() -> ResumePipeline:
+    global _default_pipeline
+    with _default_pipeline_lock:
+        if _default_pipeline is None:
+            _default_pipeline = ResumePipeline()
+        return _default_pipeline
+
+
+def run_pipeline(text: Optional[str] = None, file_bytes: Optional[bytes] = None, filename: str = "") -> PipelineResult:
+    return get_pipeline().run(text=text, file_bytes=file_bytes, filename=filename)
@@ -0,0 +1,155 @@
+from typing import Optional
+import numpy as np
+from PIL import Image, ImageEnhance, ImageFilter
+from modules.config import (
+    OCR_PREPROCESS_VERSION, OCR_PREPROCESS_MODE, OCR_TARGET_DPI, OCR_MAX_UPSCALE,
+    OCR_ASSUMED_PAGE_WIDTH_INCHES, OCR_BINARIZATION, OCR_SAUVOLA_WINDOW,
+    OCR_SAUVOLA_K, OCR_DENOISE
+)
+from backend.metrics import timed
+
+
+class ImagePreprocessor:
+    MODES = ('numpy', 'legacy')
+    BINARIZATIONS = ('sauvola', 'otsu', 'none')
+    
+    def __init__(
+        self,
+        mode: str = OCR_PREPROCESS_MODE,
+        target_dpi: int = OCR_TARGET_DPI,
+        binarization: str = OCR_BINARIZATION,
+        sauvola_window: int = OCR_SAUVOLA_WINDOW,
+        sauvola_k: float = OCR_SAUVOLA_K,
+        denoise: bool = OCR_DENOISE
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported preprocessing mode: {mode}")
+        if binarization not in self.BINARIZATIONS:
+            raise ValueError(f"Unsupported binarization: {binarization}")
+        
+        self.mode = mode
+        self.target_dpi = target_dpi
+        self.binarization = binarization
+        self.sauvola_window = sauvola_window | 1
+        self.sauvola_k = sauvola_k
+        self.denoise = denoise
+    
+    def signature(self) -> str:
+        if self.mode == 'legacy':
+            return f"v{OCR_PREPROCESS_VERSION}:legacy"
+        return (
+            f"v{OCR_PREPROCESS_VERSION}:numpy:dpi={self.target_dpi}:bin={self.binarization}"
+            f":w={self.sauvola_window}:k={self.sauvola_k}:denoise={int(self.denoise)}"
+        )
+    
+    @timed('ocr.preprocess')
+    def process(self, image: Image.Image) -> Image.Image:
+        if self.mode == 'legacy':
+            return self._process_legacy(image)
+        
+        gray = self._resample(image.convert('L'), self._source_dpi(image))
+        pixels = np.asarray(gray, dtype=np.uint8)
+        
+        if self.binarization == 'none':
+            return gray
+        
+        if self.binarization == 'otsu':
+            binary = pixels > self._otsu_threshold(pixels)
+        else:
+            binary = self._sauvola(pixels)
+        
+        if self.denoise:
+            binary = self._remove_specks(binary)
+        
+        return Image.fromarray(binary.astype(np.uint8) * 255, mode='L')
+    
+    def _process_legacy(self, image: Image.Image) -> Image.Image:
+        gray = image.convert('L')
+        
+        enhancer = ImageEnhance.Contrast(gray)
+        enhanced = enhancer.enhance(1.5)
+        
+        return enhanced.filter(ImageFilter.MedianFilter(size=3))
+    
+    def _source_dpi(self, image: Image.Image) -> float:
+        dpi = image.info.get('dpi')
+        if dpi and dpi[0] and dpi[0] >= 50:
+            return float(dpi[0])
+        return image.width / OCR_ASSUMED_PAGE_WIDTH_INCHES
+    
+    def _resample(self, gray: Image.Image, source_dpi: float) -> Image.Image:
+        scale = min(self.target_dpi / source_dpi, OCR_MAX_UPSCALE)
+        
+        if 0.9 <= scale <= 1.1:
+            return gray
+        
+        size = (max(1, round(gray.width * scale)), max(1, round(gray.height * scale)))
+        if scale < 1:
+            return gray.resize(size, Image.BILINEAR, reducing_gap=2.0)
+        return gray.resize(size, Image.BICUBIC)
+    
+    def _otsu_threshold(self, pixels: np.ndarray) -> int:
+        hist = np.bincount(pixels.ravel(), minlength=256).astype(np.float64)
+        levels = np.arange(256, dtype=np.float64)
+        
+        weight_bg = np.cumsum(hist)
+        weight_fg = weight_bg[-1] - weight_bg
+        mass_bg = np.cumsum(hist * levels)
+        mean_bg = mass_bg / np.maximum(weight_bg, 1)
+        mean_fg = (mass_bg[-1] - mass_bg) / np.maximum(weight_fg, 1)
+        
+        between_var = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+        return int(np.argmax(between_var))
+    
+    def _sauvola(self, pixels: np.ndarray) -> np.ndarray:
+        factor = max(1, self.sauvola_window // 8)
+        height, width = pixels.shape
+        
+        small = Image.fromarray(pixels, mode='L').reduce(factor) if factor > 1 else Image.fromarray(pixels, mode='L')
+        values = np.asarray(small, dtype=np.float64)
+        window = max(3, (self.sauvola_window // factor) | 1)
+        
+        mean = self._box_mean(values, window)
+        sq_mean = self._box_mean(values * values, window)
+        std = np.sqrt(np.maximum(sq_mean - mean * mean, 0))
+        
+        threshold = (mean * (1 + self.sauvola_k * (std / 128.0 - 1))).astype(np.float32)
+        if factor > 1:
+            threshold = np.asarray(
+                Image.fromarray(threshold, mode='F').resize((width, height), Image.BILINEAR)
+            )
+        
+        return pixels > threshold
+    
+    def _remove_specks(self, binary: np.ndarray) -> np.ndarray:
+        ink = (~binary).astype(np.uint8)
+        padded = np.pad(ink, 1)
+        height, width = ink.shape
+        
+        neighbours = np.zeros_like(ink)
+        for dy in range(3):
+            for dx in range(3):
+                neighbours += padded[dy:dy + height, dx:dx + width]
+        
+        specks = (ink == 1) & (neighbours <= 1)
+        return binary | specks
+    
+    def _box_mean(self, values: np.ndarray, window: int) -> np.ndarray:
+        pad = window // 2
+        padded = np.pad(values, pad, mode='edge')
+        
+        integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.float64)
+        np.cumsum(np.cumsum(padded, axis=0), axis=1, out=integral[1:, 1:])
+        
+        height, width = values.shape
+        total = (
+            integral[window:window + height, window:window + width]
+            - integral[:height, window:window + width]
+            - integral[window:window + height, :width]
+            + integral[:height, :width]
+        )
+        return total / (window * window)
+
+
+def preprocess_image(image: Image.Image, preprocessor: Optional[ImagePreprocessor] = None) -> Image.Image:
+    return (preprocessor or ImagePreprocessor()).process(image)
@@ -0,0 +1,129 @@
+import copy
+import threading
+from dataclasses import fields, is_dataclass
+from typing import Iterator, List, Optional
+from modules.schemas import ExtractedData, PageText, ProgressiveSnapshot
+from backend.ocr_engine import OCREngine, get_ocr_engine
+from backend.pipeline import ResumePipeline, get_pipeline
+
+
+class ProgressiveExtraction:
+    def __init__(
+        self,
+        file_bytes: bytes,
+        filename: str,
+        engine: Optional[OCREngine] = None,
+        pipeline: Optional[ResumePipeline] = None
+    ):
+        self.file_bytes = file_bytes
+        self.filename = filename
+        self.engine = engine or get_ocr_engine()
+        self.pipeline = pipeline or get_pipeline()
+        self._lock = threading.Lock()
+        self._pages: List[PageText] = []
+        self._raw_text = ""
+        self._extracted = ExtractedData()
+        self._health = None
+        self._fraud = None
+        self._done = False
+        self._error = ""
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> ProgressiveSnapshot:
+        cached = self.engine.cached_document(self.file_bytes, self.filename)
+        if cached is not None or self.filename.split('.')[-1].lower() != 'pdf':
+            result = cached or self.engine.process_document(self.file_bytes, self.filename)
+            self._update(result.pages, result.text, done=True)
+            return self.snapshot()
+        
+        pages = self.engine.iter_pdf_pages(self.file_bytes, window=1)
+        first_page = next(pages, None)
+        
+        if first_page is None:
+            self._update([], "", done=True)
+            return self.snapshot()
+        
+        self._add_page(first_page)
+        
+        self._thread = threading.Thread(target=self._consume, args=(pages,), daemon=True)
+        self._thread.start()
+        
+        return self.snapshot()
+    
+    def snapshot(self) -> ProgressiveSnapshot:
+        with self._lock:
+            return ProgressiveSnapshot(
+                raw_text=self._raw_text,
+                extracted=copy.deepcopy(self._extracted),
+                health=copy.deepcopy(self._health),
+                fraud=copy.deepcopy(self._fraud),
+                pages_done=len(self._pages),
+                done=self._done,
+                error=self._error
+            )
+    
+    @property
+    def done(self) -> bool:
+        with self._lock:
+            return self._done
+    
+    def wait(self, timeout: Optional[float] = None) -> ProgressiveSnapshot:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.snapshot()
+    
+    def _consume(self, pages: Iterator[PageText]):
+        try:
+            for page in pages:
+                self._add_page(page)
+        except Exception as e:
+            with self._lock:
+                self._error = str(e)
+        finally:
+            with self._lock:
+                self._done = True
+                pages = list(self._pages)
+                failed = bool(self._error)
+            
+            if pages and not failed:
+                self.engine.store_document(self.file_bytes, self.filename, self.engine.build_pdf_result(pages))
+    
+    def _add_page(self, page: PageText):
+        with self._lock:
+            pages = self._pages + [page]
+        self._update(pages, self.engine.join_pages(pages), done=False)
+    
+    def _update(self, pages: List[PageText], raw_text: str, done: bool):
+        result = self.pipeline.run_text(raw_text)
+        
+        with self._lock:
+            self._pages = pages
+            self._raw_text = raw_text
+            self._extracted = result.extracted
+            self._health = result.health
+            self._fraud = result.fraud
+            self._done = done
+
+
+def _is_blank(value) -> bool:
+    if isinstance(value, list):
+        return all(_is_blank(item) for item in value)
+    if is_dataclass(value):
+        return all(_is_blank(getattr(value, f.name)) for f in fields(value))
+    return not value
+
+
+def merge_user_edits(incoming: ExtractedData, baseline: ExtractedData, current: ExtractedData) -> ExtractedData:
+    merged = copy.deepcopy(incoming)
+    for f in fields(ExtractedData):
+        edited = getattr(current, f.name)
+        original = getattr(baseline, f.name)
+        if edited != original and not (_is_blank(edited) and _is_blank(original)):
+            setattr(merged, f.name, copy.deepcopy(edited))
+    return merged
+
+
+def start_progressive_extraction(uploaded_file) -> ProgressiveExtraction:
+    job = ProgressiveExtraction(uploaded_file.getvalue(), uploaded_file.name)
+    job.start()
+    return job
@@ -0,0 +1,131 @@
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
+from modules.config import SECTION_HEADERS
+from modules.schemas import SectionHeader
+
+HEADER_LOOKUP = {
+    header: section
+    for section, headers in SECTION_HEADERS.items()
+    for header in headers
+}
+
+
+def trie_pattern(phrases: Iterable[str], flexible_spaces: bool = True) -> str:
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[''] = {}
+    
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [
+            (r'[ \t]+' if ch == ' ' and flexible_spaces else re.escape(ch)) + emit(child)
+            for ch, child in sorted(node.items())
+            if ch
+        ]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return f'(?:{body})?' if '' in node else body
+    
+    return emit(trie)
+
+
+PAGE_MARKER_REGEX = re.compile(r'^--- Page \d+ ---$', re.MULTILINE)
+
+
+def blank_page_markers(text: str) -> str:
+    if '--- Page ' not in text:
+        return text
+    return PAGE_MARKER_REGEX.sub(lambda match: ' ' * len(match.group(0)), text)
+
+
+HEADER_REGEX = re.compile(r'^[^a-z\n]*(' + trie_pattern(HEADER_LOOKUP) + r')[^a-z0-9\n:]*(?::.*)?$', re.MULTILINE)
+
+
+class SectionIndex:
+    def __init__(self, text: str):
+        text = blank_page_markers(text)
+        self.text = text
+        self.lines = text.split('\n')
+        self.text_lower = text.lower()
+        self.lower_lines = self.text_lower.split('\n')
+        self.headers: List[SectionHeader] = []
+        self.spans: Dict[str, List[Tuple[int, int]]] = {}
+        
+        line = 0
+        last_offset = 0
+        for match in HEADER_REGEX.finditer(self.text_lower):
+            offset = match.start()
+            line += self.text_lower.count('\n', last_offset, offset)
+            last_offset = offset
+            section = HEADER_LOOKUP[' '.join(match.group(1).split())]
+            self.headers.append(SectionHeader(section=section, line=line, offset=offset))
+        
+        boundaries = [header.line for header in self.headers] + [len(self.lines)]
+        if not self.headers or boundaries[0] > 0:
+            self.spans['contact'] = [(0, boundaries[0])]
+        for header, end in zip(self.headers, boundaries[1:]):
+            self.spans.setdefault(header.section, []).append((header.line, end))
+        
+        self.header_lines = {header.line for header in self.headers}
+        self._texts: Dict[str, Tuple[str, str]] = {}
+        self.entities: Dict[int, List[Tuple[str, str]]] = {}
+    
+    def has(self, section: str) -> bool:
+        return section in self.spans
+    
+    def line_numbers(self, section: str, include_headers: bool = True) -> List[int]:
+        if section not in self.spans:
+            return list(range(len(self.lines)))
+        
+        return [
+            i
+            for start, end in self.spans[section]
+            for i in range(start, end)
+            if include_headers or i not in self.header_lines
+        ]
+    
+    def lines_in(self, section: str, include_headers: bool = True) -> Tuple[List[str], List[str]]:
+        numbers = self.line_numbers(section, include_headers)
+        return [self.lines[i] for i in numbers], [self.lower_lines[i] for i in numbers]
+    
+    def text_in(self, section: str) -> Tuple[str, str]:
+        if section not in self._texts:
+            if section in self.spans:
+                lines, lower_lines = self.lines_in(section)
+                self._texts[section] = '\n'.join(lines), '\n'.join(lower_lines)
+            else:
+                self._texts[section] = self.text, self.text_lower
+        return self._texts[section]
+    
+    def attach_entities(self, entities: Iterable[Tuple[str, str, int]]):
+        starts = [0]
+        for line in self.lines[:-1]:
+            starts.append(starts[-1] + len(line) + 1)
+        
+        self.entities = {}
+        for label, value, offset in entities:
+            line = bisect_right(starts, offset) - 1
+            self.entities.setdefault(line, []).append((label, value))
+    
+    def entities_on(self, line: int, label: str) -> List[str]:
+        return [value for entity_label, value in self.entities.get(line, ()) if entity_label == label]
+    
+    def entities_in(self, section: Optional[str], label: str) -> List[str]:
+        if not self.entities:
+            return []
+        numbers = self.line_numbers(section) if section else sorted(self.entities)
+        return [value for i in numbers for value in self.entities_on(i, label)]
+    
+    def first_line(self) -> str:
+        for line in self.lines:
+            if line.strip():
+                return line.strip()
+        return ""
+
+
+def build_section_index(text: str) -> SectionIndex:
+    return SectionIndex(text)
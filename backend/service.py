@@ -0,0 +1,255 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from PIL import UnidentifiedImageError
+from modules.config import (
+    SERVICE_HOST, SERVICE_PORT, SERVICE_WORKERS, SERVICE_MAX_QUEUE,
+    SERVICE_REQUEST_TIMEOUT, SERVICE_MAX_UPLOAD_BYTES
+)
+from backend.metrics import get_metrics
+from backend.pipeline import ResumePipeline, get_pipeline, result_to_dict
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+_worker_pipeline: Optional[ResumePipeline] = None
+
+
+def _init_worker():
+    global _worker_pipeline
+    from backend.ocr_engine import OCREngine, default_ocr_cache
+    
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    get_metrics().reset()
+    _worker_pipeline = ResumePipeline(ocr_engine=OCREngine(max_workers=1, cache=default_ocr_cache()))
+
+
+def _pipeline() -> ResumePipeline:
+    return _worker_pipeline or get_pipeline()
+
+
+def _run_in_worker(func, *args) -> Tuple[Dict[str, Any], Dict[str, Dict]]:
+    return func(*args), get_metrics().drain()
+
+
+def process_text(text: str) -> Dict[str, Any]:
+    return result_to_dict(_pipeline().run_text(text))
+
+
+def process_file(file_bytes: bytes, filename: str) -> Dict[str, Any]:
+    return result_to_dict(_pipeline().run_file(file_bytes, filename))
+
+
+class ResumeService:
+    def __init__(
+        self,
+        workers: int = SERVICE_WORKERS,
+        max_queue: int = SERVICE_MAX_QUEUE,
+        timeout: float = SERVICE_REQUEST_TIMEOUT,
+        max_upload_bytes: int = SERVICE_MAX_UPLOAD_BYTES
+    ):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self.capacity = self.workers + self.max_queue
+        self.timeout = timeout
+        self.max_upload_bytes = max_upload_bytes
+        self.started_at = time.time()
+        
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+        self._server: Optional[ThreadingHTTPServer] = None
+    
+    def submit(self, func, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            get_metrics().inc('service.rejected')
+            raise ServiceBusy(f"Service at capacity ({self.capacity} requests in flight)")
+        
+        with self._lock:
+            self._in_flight += 1
+            future = None
+            try:
+                try:
+                    future = self._pool.submit(_run_in_worker, func, *args)
+                except BrokenProcessPool:
+                    self._pool.shutdown(wait=False, cancel_futures=True)
+                    self._pool = self._new_pool()
+                    future = self._pool.submit(_run_in_worker, func, *args)
+            finally:
+                if future is None:
+                    self._in_flight -= 1
+                    self._slots.release()
+        
+        future.add_done_callback(self._release)
+        return future
+    
+    def run(self, func, *args) -> Dict[str, Any]:
+        future = self.submit(func, *args)
+        try:
+            result, worker_metrics = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            get_metrics().inc('service.timeouts')
+            raise
+        get_metrics().merge(worker_metrics)
+        return result
+    
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self._in_flight
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "in_flight": in_flight,
+            "capacity": self.capacity,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+        }
+    
+    def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT) -> ThreadingHTTPServer:
+        self._server = ServiceHTTPServer((host, port), ServiceRequestHandler, self)
+        return self._server
+    
+    def serve_forever(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT):
+        server = self.start(host, port)
+        try:
+            server.serve_forever()
+        finally:
+            self.shutdown()
+    
+    def shutdown(self):
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        self._pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+    
+    def _release(self, future: Future):
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, address: Tuple[str, int], handler, service: ResumeService):
+        super().__init__(address, handler)
+        self.service = service
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    server: ServiceHTTPServer
+    
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/healthz':
+            self._send_json(200, self.server.service.health())
+        elif path == '/metrics':
+            self._send(200, get_metrics().to_prometheus().encode('utf-8'), 'text/plain; version=0.0.4; charset=utf-8')
+        else:
+            self._send_json(404, {"error": "Not found"})
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        service = self.server.service
+        start = time.perf_counter()
+        
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Content-Length must be a non-negative integer"})
+            return
+        if length > service.max_upload_bytes:
+            self._send_json(413, {"error": f"Request body exceeds {service.max_upload_bytes} bytes"})
+            return
+        body = self.rfile.read(length)
+        
+        try:
+            if url.path == '/v1/extract/text':
+                func, args = process_text, (self._read_text(body),)
+            elif url.path == '/v1/extract/file':
+                func, args = process_file, (body, self._filename(url.query))
+            else:
+                self._send_json(404, {"error": "Not found"})
+                return
+            
+            get_metrics().inc('service.requests')
+            result = service.run(func, *args)
+            get_metrics().observe(f'service{url.path.replace("/", ".")}', time.perf_counter() - start)
+            self._send_json(200, result)
+        except ServiceBusy as e:
+            self._send_json(429, {"error": str(e)}, {'Retry-After': '1'})
+        except FutureTimeoutError:
+            self._send_json(504, {"error": f"Request timed out after {service.timeout:g}s"})
+        except (ValueError, UnicodeDecodeError, UnidentifiedImageError) as e:
+            self._send_json(400, {"error": str(e)})
+        except (ImportError, BrokenProcessPool) as e:
+            self._send_json(503, {"error": str(e)})
+        except Exception as e:
+            get_metrics().inc('service.errors')
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+    
+    def _read_text(self, body: bytes) -> str:
+        if self.headers.get_content_type() == 'application/json':
+            payload = json.loads(body.decode('utf-8'))
+            text = payload.get('text') if isinstance(payload, dict) else None
+            if not isinstance(text, str):
+                raise ValueError("JSON body must contain a 'text' string")
+            return text
+        return body.decode('utf-8')
+    
+    def _filename(self, query: str) -> str:
+        filename = parse_qs(query).get('filename', [''])[0] or self.headers.get('X-Filename', '')
+        if not filename:
+            raise ValueError("Pass the original file name as ?filename= or the X-Filename header")
+        return filename
+    
+    def _send_json(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None):
+        self._send(status, json.dumps(payload).encode('utf-8'), 'application/json', headers)
+    
+    def _send(self, status: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DEET resume extraction service")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=SERVICE_WORKERS)
+    parser.add_argument("--max-queue", type=int, default=SERVICE_MAX_QUEUE)
+    parser.add_argument("--timeout", type=float, default=SERVICE_REQUEST_TIMEOUT)
+    args = parser.parse_args()
+    
+    service = ResumeService(workers=args.workers, max_queue=args.max_queue, timeout=args.timeout)
+    print(f"DEET service listening on http://{args.host}:{args.port} ({service.workers} workers, queue {service.max_queue})")
+    try:
+        service.serve_forever(args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from modules.config import ALL_SKILLS
+from backend.automaton import KeywordAutomaton
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class SkillMatcher:
+    PREFIX_LENGTH = 4
+    
+    def __init__(self, skills: Iterable[str] = ALL_SKILLS):
+        self.skills = sorted(set(s.lower() for s in skills if s))
+        self.automaton = KeywordAutomaton(self.skills)
+        
+        self.prefix_index: Dict[str, List[Tuple[int, str]]] = {}
+        for skill in self.skills:
+            if len(skill) > 3:
+                self.prefix_index.setdefault(skill[:self.PREFIX_LENGTH], []).append((len(skill) - 2, skill))
+    
+    def match(self, text: str) -> Set[str]:
+        text_lower = text.lower()
+        found = self.automaton.find_all(text_lower)
+        
+        for word in set(WORD_PATTERN.findall(text_lower)):
+            candidates = self.prefix_index.get(word[:self.PREFIX_LENGTH])
+            if not candidates:
+                continue
+            for min_length, skill in candidates:
+                if len(word) >= min_length:
+                    found.add(skill)
+        
+        return found
+
+
+_default_matcher: Optional[SkillMatcher] = None
+_default_matcher_lock = threading.Lock()
+
+
+def get_skill_matcher() -> SkillMatcher:
+    global _default_matcher
+    with _default_matcher_lock:
+        if _default_matcher is None:
+            _default_matcher = SkillMatcher()
+        return _default_matcher
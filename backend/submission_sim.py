@@ -1,8 +1,13 @@
 import json
+import sqlite3
+import threading
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional
 from modules.schemas import SubmissionResult, ExtractedData
+from modules.config import DUPLICATE_INDEX_ENABLED
+from backend.metrics import get_metrics, timed
+from backend.duplicate_index import DuplicateIndex, get_duplicate_index
 
 
 class DEETSubmissionSimulator:
@@ -28,8 +33,9 @@ class DEETSubmissionSimulator:
         "skills": ["string"]
     }
     
-    def __init__(self):
+    def __init__(self, duplicate_index: Optional[DuplicateIndex] = None):
         self.simulated_delay = 1.5
+        self.duplicate_index = duplicate_index
     
     def generate_payload(self, data: ExtractedData) -> Dict[str, Any]:
         payload = {
@@ -78,6 +84,7 @@ class DEETSubmissionSimulator:
         
         return True, "Payload valid"
     
+    @timed('submission.submit')
     def submit(self, data: ExtractedData) -> SubmissionResult:
         import time
         time.sleep(self.simulated_delay)
@@ -87,6 +94,7 @@ class DEETSubmissionSimulator:
         is_valid, message = self.validate_payload(payload)
         
         if not is_valid:
+            get_metrics().inc('submission.rejected')
             return SubmissionResult(
                 success=False,
                 message=message,
@@ -96,6 +104,13 @@ class DEETSubmissionSimulator:
             )
         
         submission_id = f"DEET-{uuid.uuid4().hex[:12].upper()}"
+        get_metrics().inc('submission.accepted')
+        
+        if self.duplicate_index is not None:
+            try:
+                self.duplicate_index.add(submission_id, data.phone, data.email, data.raw_text)
+            except (sqlite3.Error, OSError, ValueError):
+                get_metrics().inc('duplicates.index_errors')
         
         return SubmissionResult(
             success=True,
@@ -136,11 +151,23 @@ To integrate with real DEET API:
 """
 
 
+_default_simulator: Optional[DEETSubmissionSimulator] = None
+_default_simulator_lock = threading.Lock()
+
+
+def get_submission_simulator() -> DEETSubmissionSimulator:
+    global _default_simulator
+    with _default_simulator_lock:
+        if _default_simulator is None:
+            _default_simulator = DEETSubmissionSimulator(
+                duplicate_index=get_duplicate_index() if DUPLICATE_INDEX_ENABLED else None
+            )
+        return _default_simulator
+
+
 def submit_to_deet(data: ExtractedData) -> SubmissionResult:
-    simulator = DEETSubmissionSimulator()
-    return simulator.submit(data)
+    return get_submission_simulator().submit(data)
 
 
 def generate_deet_payload(data: ExtractedData) -> Dict[str, Any]:
-    simulator = DEETSubmissionSimulator()
-    return simulator.generate_payload(data)
+    return get_submission_simulator().generate_payload(data)
@@ -0,0 +1,751 @@
+import argparse
+import inspect
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+import types
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def _time_call(func: Callable[[], Any], repeats: int) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = func()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+
+def _print_rows(rows: List[Dict[str, Any]], columns: List[str]):
+    widths = {c: max(len(c), *(len(str(row.get(c, ""))) for row in rows)) for c in columns}
+    print(" | ".join(c.ljust(widths[c]) for c in columns))
+    print("-+-".join("-" * widths[c] for c in columns))
+    for row in rows:
+        print(" | ".join(str(row.get(c, "")).ljust(widths[c]) for c in columns))
+
+
+def benchmark_preprocessing(image_paths: List[str], repeats: int = 3, run_ocr: bool = True) -> List[Dict[str, Any]]:
+    import pytesseract
+    from PIL import Image
+    from backend.preprocessing import ImagePreprocessor
+    from modules.config import OCR_TESSERACT_CONFIG
+    
+    preprocessors = {
+        "legacy": ImagePreprocessor(mode='legacy'),
+        "numpy": ImagePreprocessor(mode='numpy'),
+    }
+    
+    rows = []
+    for path in image_paths:
+        with Image.open(path) as source:
+            image = source.convert('RGB')
+            if 'dpi' in source.info:
+                image.info['dpi'] = source.info['dpi']
+        
+        for name, preprocessor in preprocessors.items():
+            preprocess_ms, prepared = _time_call(lambda: preprocessor.process(image), repeats)
+            
+            row = {
+                "image": path,
+                "pipeline": name,
+                "input_size": f"{image.width}x{image.height}",
+                "ocr_size": f"{prepared.width}x{prepared.height}",
+                "preprocess_ms": round(preprocess_ms, 1),
+            }
+            
+            if run_ocr:
+                ocr_ms, text = _time_call(
+                    lambda: pytesseract.image_to_string(prepared, config=OCR_TESSERACT_CONFIG),
+                    1
+                )
+                row["ocr_ms"] = round(ocr_ms, 1)
+                row["page_ms"] = round(preprocess_ms + ocr_ms, 1)
+                row["chars"] = len(text.strip())
+                row["text"] = text
+            
+            rows.append(row)
+    
+    return rows
+
+
+def _sample_resumes() -> List[str]:
+    from modules.evaluation import AccuracyEvaluator
+    return [case["text"] for case in AccuracyEvaluator().test_cases.values()]
+
+
+def _legacy_skill_scan(text: str, skills: Iterable[str]) -> Set[str]:
+    text_lower = text.lower()
+    found_skills = set()
+    words = re.findall(r'\b\w+\b', text_lower)
+    
+    for skill in skills:
+        if skill in text_lower:
+            found_skills.add(skill)
+        elif len(skill) > 3:
+            for word in words:
+                if word.startswith(skill[:4]) and len(word) >= len(skill) - 2:
+                    found_skills.add(skill)
+    
+    return found_skills
+
+
+def _scaled_skills(skills: Iterable[str], scale: int) -> List[str]:
+    suffixes = ['developer', 'engineering', 'administration', 'certified', 'advanced', 'fundamentals',
+                'architecture', 'testing', 'migration', 'operations', 'analytics', 'automation']
+    scaled = list(skills)
+    for i in range(1, scale):
+        suffix = suffixes[(i - 1) % len(suffixes)]
+        round_tag = f" {i // len(suffixes) + 1}" if i > len(suffixes) else ""
+        scaled.extend(f"{skill} {suffix}{round_tag}" for skill in skills)
+    return scaled
+
+
+def benchmark_skill_matching(scale: int = 10, long_factor: int = 20, repeats: int = 5) -> List[Dict[str, Any]]:
+    from backend.skill_matcher import SkillMatcher
+    from modules.config import ALL_SKILLS
+    
+    resumes = _sample_resumes()
+    corpora = {
+        "sample": resumes,
+        f"long_x{long_factor}": ["\n".join(resumes[i % len(resumes)] for i in range(long_factor))],
+    }
+    skill_sets = {
+        "base": sorted(ALL_SKILLS),
+        f"x{scale}": _scaled_skills(sorted(ALL_SKILLS), scale),
+    }
+    
+    rows = []
+    for skills_name, skills in skill_sets.items():
+        build_ms, matcher = _time_call(lambda: SkillMatcher(skills), 1)
+        
+        for corpus_name, texts in corpora.items():
+            legacy_ms, legacy = _time_call(lambda: [_legacy_skill_scan(t, skills) for t in texts], repeats)
+            matcher_ms, matched = _time_call(lambda: [matcher.match(t) for t in texts], repeats)
+            
+            rows.append({
+                "skills": f"{skills_name} ({len(skills)})",
+                "corpus": f"{corpus_name} ({sum(len(t) for t in texts)} chars)",
+                "legacy_ms": round(legacy_ms / len(texts), 3),
+                "automaton_ms": round(matcher_ms / len(texts), 3),
+                "speedup": round(legacy_ms / matcher_ms, 1) if matcher_ms else 0,
+                "build_ms": round(build_ms, 1),
+                "identical": legacy == matched,
+            })
+    
+    return rows
+
+
+def benchmark_gazetteers(scale: int = 20, repeats: int = 20) -> List[Dict[str, Any]]:
+    from backend.gazetteer import Gazetteer, get_gazetteer
+    from modules.config import GAZETTEER_FILES
+    
+    lines = [line for text in _sample_resumes() for line in text.lower().split('\n') if line.strip()]
+    
+    rows = []
+    for name in GAZETTEER_FILES:
+        base = get_gazetteer(name).entries
+        sizes = {"base": base, f"x{scale}": dict(base)}
+        for i in range(1, scale):
+            sizes[f"x{scale}"].update({f"{alias} unit {i}": display for alias, display in base.items()})
+        
+        for size_name, entries in sizes.items():
+            aliases = list(entries)
+            build_ms, gazetteer = _time_call(lambda: Gazetteer(name, entries), 1)
+            legacy_ms, _ = _time_call(lambda: [next((a for a in aliases if a in line), "") for line in lines], repeats)
+            compiled_ms, _ = _time_call(lambda: [gazetteer.first(line) for line in lines], repeats)
+            
+            rows.append({
+                "gazetteer": name,
+                "entries": f"{size_name} ({len(entries)})",
+                "lines": len(lines),
+                "substring_ms": round(legacy_ms, 3),
+                "compiled_ms": round(compiled_ms, 3),
+                "speedup": round(legacy_ms / compiled_ms, 1) if compiled_ms else 0,
+                "build_ms": round(build_ms, 1),
+            })
+    
+    return rows
+
+
+def _synthetic_keyword_rules(count: int, regex_ratio: float, rng: random.Random) -> List[Any]:
+    from backend.keyword_scanner import load_rules
+    from modules.config import FRAUD_RULES_DIR
+    from modules.schemas import KeywordRule
+    
+    base = []
+    for name in sorted(os.listdir(FRAUD_RULES_DIR)):
+        if name.endswith('.txt'):
+            base.extend(load_rules(os.path.join(FRAUD_RULES_DIR, name))[0])
+    
+    words = sorted({w for text in _sample_resumes() for w in re.findall(r'[a-z]{3,}', text.lower())})
+    rules = list(base)
+    while len(rules) < count:
+        phrase = " ".join(rng.choice(words) for _ in range(rng.randint(2, 3)))
+        if rng.random() < regex_ratio:
+            pattern = r"\b" + r"\s+".join(phrase.split()) + r"\s*\d*"
+            rules.append(KeywordRule(pattern, [pattern], True, "high", 25, "synthetic"))
+        else:
+            rules.append(KeywordRule(f"{phrase} {len(rules)}", [f"{phrase} {len(rules)}"], False, "high", 25, "synthetic"))
+    return rules[:max(count, len(base))]
+
+
+def _legacy_keyword_scan(text: str, rules: List[Any]) -> Set[int]:
+    text_lower = text.lower()
+    return {
+        index for index, rule in enumerate(rules)
+        if (re.search(rule.patterns[0], text_lower) if rule.is_regex else any(p.lower() in text_lower for p in rule.patterns))
+    }
+
+
+def benchmark_keyword_scanner(
+    sizes: Optional[List[int]] = None,
+    regex_ratio: float = 0.05,
+    long_factor: int = 20,
+    repeats: int = 5
+) -> List[Dict[str, Any]]:
+    from backend.automaton import KeywordAutomaton
+    from backend.keyword_scanner import RuleSet
+    
+    rng = random.Random(7)
+    resumes = _sample_resumes()
+    resumes[0] += "\nWe guarantee job without interview, pay Rs. 5,000 security deposit."
+    corpora = {
+        "sample": resumes,
+        f"long_x{long_factor}": ["\n".join(resumes[i % len(resumes)] for i in range(long_factor))],
+    }
+    
+    rows = []
+    for size in sizes or [10, 100, 1000, 5000]:
+        rules = _synthetic_keyword_rules(size, regex_ratio, rng)
+        build_ms, ruleset = _time_call(lambda: RuleSet(rules), 1)
+        automaton = KeywordAutomaton(p.lower() for rule in rules if not rule.is_regex for p in rule.patterns)
+        
+        for corpus_name, texts in corpora.items():
+            legacy_ms, legacy = _time_call(lambda: [_legacy_keyword_scan(t, rules) for t in texts], repeats)
+            automaton_ms, _ = _time_call(lambda: [automaton.find_all(t.lower()) for t in texts], repeats)
+            scanner_ms, hits = _time_call(lambda: [ruleset.scan(t) for t in texts], repeats)
+            
+            rows.append({
+                "rules": f"{len(rules)} ({sum(r.is_regex for r in rules)} re)",
+                "corpus": f"{corpus_name} ({sum(len(t) for t in texts)} chars)",
+                "legacy_ms": round(legacy_ms / len(texts), 3),
+                "automaton_ms": round(automaton_ms / len(texts), 3),
+                "scanner_ms": round(scanner_ms / len(texts), 3),
+                "speedup": round(legacy_ms / scanner_ms, 1) if scanner_ms else 0,
+                "build_ms": round(build_ms, 1),
+                "hits": sum(len(h) for h in hits),
+                "legacy_hits": sum(len(h) for h in legacy),
+            })
+    
+    return rows
+
+
+def _synthetic_applicants(count: int, text_ratio: float, seed: int = 11):
+    import numpy as np
+    import pandas as pd
+    
+    rng = np.random.default_rng(seed)
+    phones = np.array([
+        "9876543210", "+91 98765 43210", "8123456789", "98765-4321", "5123456789", "", None, "౯౮౭౬౫౪౩౨౧౦", "7012345678"
+    ], dtype=object)
+    emails = np.array([
+        "rahul@example.com", "priya.k@gmail.com", "bad-email@", "no at sign", "", None, "x@y.co.in"
+    ], dtype=object)
+    locations = np.array(["Hyderabad", "Warangal", "", None], dtype=object)
+    texts = np.array(_sample_resumes() + [
+        "Guarantee job without interview, pay fees now",
+        "Registration fee Rs. 2,000 and processing fee.",
+    ], dtype=object)
+    
+    frame = pd.DataFrame({
+        "phone": phones[rng.integers(0, len(phones), count)],
+        "email": emails[rng.integers(0, len(emails), count)],
+        "skills_count": rng.choice([0, 1, 3, 5, 12, 60], count),
+        "education_count": rng.integers(0, 3, count),
+        "experience_count": rng.integers(0, 12, count),
+        "location": locations[rng.integers(0, len(locations), count)],
+        "age": rng.choice([0, 20, 24, 35], count),
+    })
+    frame["text"] = np.where(rng.random(count) < text_ratio, texts[rng.integers(0, len(texts), count)], "")
+    return frame
+
+
+def benchmark_batch_scoring(
+    count: int = 1000000,
+    loop_rows: int = 20000,
+    parity_rows: int = 5000,
+    text_ratio: float = 0.1
+) -> List[Dict[str, Any]]:
+    import pandas as pd
+    from backend.batch_scoring import BatchScorer
+    from backend.fraud_detector import FraudDetector
+    from backend.health_scorer import HealthScorer
+    
+    frame = _synthetic_applicants(count, text_ratio)
+    scorer = BatchScorer()
+    detector = FraudDetector(duplicate_index=None, short_circuit=False)
+    health_scorer = HealthScorer()
+    
+    loop_frame = frame.head(loop_rows)
+    
+    def per_row():
+        for row in loop_frame.itertuples(index=False):
+            phone, email, location = ("" if pd.isna(v) else v for v in (row.phone, row.email, row.location))
+            skills = [""] * row.skills_count
+            health_scorer.calculate(email, phone, row.education_count, row.experience_count, skills, location)
+            detector.analyze(phone, email, skills, row.experience_count, row.text, row.age)
+    
+    loop_ms, _ = _time_call(per_row, 1)
+    rows = []
+    for details in (False, True):
+        vector_ms, _ = _time_call(lambda: scorer.score(frame, with_details=details), 1)
+        loop_rate = len(loop_frame) / (loop_ms / 1000)
+        vector_rate = count / (vector_ms / 1000)
+        rows.append({
+            "rows": count,
+            "details": details,
+            "text_ratio": text_ratio,
+            "per_row_per_sec": round(loop_rate),
+            "vectorized_s": round(vector_ms / 1000, 2),
+            "vectorized_per_sec": round(vector_rate),
+            "speedup": round(vector_rate / loop_rate, 1),
+        })
+    
+    mismatches = scorer.parity_mismatches(frame, parity_rows)
+    for row in rows:
+        row["parity_rows"] = min(parity_rows, count)
+        row["mismatches"] = len(mismatches)
+    return rows
+
+
+def _exec_module_at(ref: str, path: str) -> types.ModuleType:
+    source = subprocess.run(["git", "show", f"{ref}:{path}"], capture_output=True, text=True, check=True).stdout
+    module = types.ModuleType(f"baseline_{path.replace('/', '_')[:-3]}")
+    module.__file__ = os.path.abspath(path)
+    exec(compile(source, f"{ref}:{path}", "exec"), module.__dict__)
+    return module
+
+
+def _load_module_at(ref: str, path: str) -> types.ModuleType:
+    current_config = sys.modules.get("modules.config")
+    sys.modules["modules.config"] = _exec_module_at(ref, "modules/config.py")
+    try:
+        return _exec_module_at(ref, path)
+    finally:
+        sys.modules["modules.config"] = current_config
+
+
+def benchmark_shared_instances(repeats: int = 200, baseline_ref: Optional[str] = None) -> List[Dict[str, Any]]:
+    from backend.nlp_extractor import NLPExtractor, get_extractor
+    from backend.fraud_detector import FraudDetector, get_fraud_detector
+    from backend.health_scorer import HealthScorer, get_health_scorer
+    
+    resumes = _sample_resumes()
+    extracted = [get_extractor().extract_all(text) for text in resumes]
+    
+    def fraud(detector, data):
+        return detector.analyze(data.phone, data.email, data.skills, len(data.experience), data.raw_text)
+    
+    def health(scorer, data):
+        return scorer.calculate(data.email, data.phone, len(data.education), len(data.experience), data.skills, data.location)
+    
+    duplicate_index = get_fraud_detector().duplicate_index
+    stages = [
+        ("extract", "backend/nlp_extractor.py", NLPExtractor, {}, get_extractor, lambda extractor, data: extractor.extract_all(data.raw_text)),
+        ("fraud", "backend/fraud_detector.py", FraudDetector, {"duplicate_index": duplicate_index}, get_fraud_detector, fraud),
+        ("health", "backend/health_scorer.py", HealthScorer, {}, get_health_scorer, health),
+    ]
+    
+    rows = []
+    for name, path, cls, kwargs, shared, run in stages:
+        factory = lambda: cls(**kwargs)
+        construct_ms, _ = _time_call(factory, repeats)
+        fresh_ms, fresh = _time_call(lambda: [run(factory(), data) for data in extracted], repeats)
+        shared_ms, reused = _time_call(lambda: [run(shared(), data) for data in extracted], repeats)
+        
+        row = {
+            "stage": name,
+            "construct_us": round(construct_ms * 1000, 2),
+            "fresh_us": round(fresh_ms * 1000 / len(extracted), 2),
+            "shared_us": round(shared_ms * 1000 / len(extracted), 2),
+            "identical": fresh == reused,
+        }
+        
+        if baseline_ref:
+            baseline_cls = getattr(_load_module_at(baseline_ref, path), cls.__name__)
+            accepted = inspect.signature(baseline_cls).parameters
+            baseline_kwargs = {key: value for key, value in kwargs.items() if key in accepted}
+            baseline_ms, baseline = _time_call(
+                lambda: [run(baseline_cls(**baseline_kwargs), data) for data in extracted], repeats
+            )
+            row["baseline_us"] = round(baseline_ms * 1000 / len(extracted), 2)
+            row["speedup"] = round(baseline_ms / shared_ms, 2) if shared_ms else 0
+            row["identical"] = row["identical"] and baseline == reused
+        
+        rows.append(row)
+    
+    return rows
+
+
+def benchmark_batch_extraction(
+    count: int = 5000,
+    workers: Optional[List[int]] = None,
+    chunk_size: int = 32
+) -> List[Dict[str, Any]]:
+    import os
+    from backend.nlp_extractor import extract_many
+    
+    resumes = _sample_resumes()
+    texts = [resumes[i % len(resumes)] for i in range(count)]
+    
+    rows = []
+    for worker_count in workers or sorted({1, 2, os.cpu_count() or 1}):
+        report = extract_many(texts, workers=worker_count, chunk_size=chunk_size).report
+        rows.append({
+            "workers": report.workers,
+            "resumes": report.total,
+            "failed": report.failed,
+            "seconds": round(report.elapsed_seconds, 2),
+            "resumes_per_sec": round(report.resumes_per_second, 1),
+        })
+    
+    return rows
+
+
+def benchmark_lazy_extraction(repeats: int = 200) -> List[Dict[str, Any]]:
+    from backend.nlp_extractor import extract_lazy, get_extractor
+    
+    extractor = get_extractor()
+    resumes = _sample_resumes()
+    field_sets = [
+        ("phone+email", ["phone", "email"]),
+        ("fraud prescreen", ["phone", "email", "raw_text"]),
+        ("all fields", ["full_name", "email", "phone", "location", "education", "experience", "skills"]),
+    ]
+    
+    full_ms, _ = _time_call(lambda: [extractor.extract_all(text) for text in resumes], repeats)
+    
+    rows = []
+    for name, names in field_sets:
+        lazy_ms, _ = _time_call(lambda: [[getattr(data, f) for f in names] for data in map(extract_lazy, resumes)], repeats)
+        rows.append({
+            "fields": name,
+            "extract_all_us": round(full_ms * 1000 / len(resumes), 2),
+            "lazy_us": round(lazy_ms * 1000 / len(resumes), 2),
+            "speedup": round(full_ms / lazy_ms, 1) if lazy_ms else 0,
+        })
+    
+    return rows
+
+
+def benchmark_ner_backends(
+    model: Optional[str] = None,
+    n_process: int = 1,
+    count: int = 200,
+    repeats: int = 5
+) -> List[Dict[str, Any]]:
+    from backend.ner import SpacyNER
+    from backend.nlp_extractor import NLPExtractor
+    from modules.evaluation import AccuracyEvaluator
+    
+    resumes = _sample_resumes()
+    texts = [resumes[i % len(resumes)] for i in range(count)]
+    
+    rows = []
+    for backend in ("regex", "spacy"):
+        row: Dict[str, Any] = {"backend": backend}
+        try:
+            extractor = NLPExtractor(backend)
+            if extractor.ner is not None:
+                if model:
+                    extractor.ner = SpacyNER(model=model)
+                load_ms, _ = _time_call(lambda: extractor.ner.nlp, 1)
+                row["load_ms"] = round(load_ms, 1)
+        except (ImportError, OSError) as e:
+            row["error"] = str(e).splitlines()[0]
+            rows.append(row)
+            continue
+        
+        single_ms, _ = _time_call(lambda: [extractor.extract_all(text) for text in resumes], repeats)
+        bulk_ms, _ = _time_call(lambda: extractor.extract_batch(texts, n_process), 1)
+        report = AccuracyEvaluator(extractor.extract_all).evaluate_all()
+        
+        row.update({
+            "latency_ms": round(single_ms / len(resumes), 2),
+            "bulk_per_sec": round(len(texts) / (bulk_ms / 1000), 1) if bulk_ms else 0,
+            "accuracy": report.accuracy_percentage,
+            **{f"{field}_acc": value for field, value in report.field_wise_accuracy.items() if field in ("full_name", "location")},
+        })
+        rows.append(row)
+    
+    return rows
+
+
+def benchmark_extraction_cache(repeats: int = 200) -> List[Dict[str, Any]]:
+    from backend.extraction_cache import ExtractionCache
+    from backend.nlp_extractor import get_extractor
+    
+    extractor = get_extractor()
+    resumes = _sample_resumes()
+    cache = ExtractionCache()
+    
+    direct_ms, _ = _time_call(lambda: [extractor.extract_all(text) for text in resumes], repeats)
+    cold_ms, _ = _time_call(lambda: (cache.clear(), [cache.extract(extractor, text) for text in resumes]), repeats)
+    warm_ms, _ = _time_call(lambda: [cache.extract(extractor, text) for text in resumes], repeats)
+    stats = cache.stats()
+    
+    return [{
+        "resumes": len(resumes),
+        "extract_all_us": round(direct_ms * 1000 / len(resumes), 2),
+        "cold_us": round(cold_ms * 1000 / len(resumes), 2),
+        "warm_us": round(warm_ms * 1000 / len(resumes), 2),
+        "speedup": round(direct_ms / warm_ms, 1) if warm_ms else 0,
+        "hit_rate": round(stats["hit_rate"], 3),
+    }]
+
+
+def _synthetic_registration(rng: random.Random, vocabulary: List[str], tokens: int = 150) -> Tuple[str, str, str]:
+    phone = f"{rng.choice('6789')}{rng.randrange(10 ** 9):09d}"
+    email = f"user{rng.randrange(10 ** 12)}@example.com"
+    return phone, email, " ".join(rng.choice(vocabulary) for _ in range(tokens))
+
+
+def _perturb(rng: random.Random, text: str, ratio: float) -> str:
+    words = text.split()
+    for i in rng.sample(range(len(words)), int(len(words) * ratio)):
+        words[i] = f"w{rng.randrange(10 ** 6)}"
+    return " ".join(words)
+
+
+def benchmark_duplicate_index(
+    count: int = 20000,
+    lookups: int = 500,
+    perturb: float = 0.03,
+    batch_size: int = 1000
+) -> List[Dict[str, Any]]:
+    import tempfile
+    from backend.duplicate_index import DuplicateIndex
+    
+    rng = random.Random(42)
+    vocabulary = [f"w{i}" for i in range(5000)]
+    workdir = tempfile.mkdtemp(prefix="deet-duplicates-")
+    index = DuplicateIndex(path=os.path.join(workdir, "duplicates.sqlite3"))
+    
+    registered = []
+    per_batch = max(1, -(-lookups * batch_size // count))
+    start = time.perf_counter()
+    for offset in range(0, count, batch_size):
+        batch = [
+            (f"REG-{offset + i}", *_synthetic_registration(rng, vocabulary))
+            for i in range(min(batch_size, count - offset))
+        ]
+        index.add_many(batch)
+        registered.extend(batch[:per_batch])
+    build_s = time.perf_counter() - start
+    
+    probes = rng.sample(registered, min(lookups, len(registered)))
+    scenarios = {
+        "new": [("", *_synthetic_registration(rng, vocabulary)) for _ in probes],
+        "same_phone": [(reg, phone, "", "") for reg, phone, _, _ in probes],
+        "same_email": [(reg, "", email, "") for reg, _, email, _ in probes],
+        "near_duplicate": [(reg, "", "", _perturb(rng, text, perturb)) for reg, _, _, text in probes],
+    }
+    
+    rows = []
+    for scenario, queries in scenarios.items():
+        timings = []
+        found = 0
+        for reg, phone, email, text in queries:
+            start = time.perf_counter()
+            match = index.lookup(phone, email, text)
+            timings.append((time.perf_counter() - start) * 1000)
+            ids = set(match.phone_matches) | set(match.email_matches) | {r for r, _ in match.near_duplicates}
+            found += bool(reg in ids) if reg else bool(ids)
+        
+        timings.sort()
+        rows.append({
+            "scenario": scenario,
+            "registrations": count,
+            "build_s": round(build_s, 1),
+            "p50_ms": round(timings[len(timings) // 2], 3),
+            "p95_ms": round(timings[int(len(timings) * 0.95)], 3),
+            "hit_rate": round(found / len(queries), 3),
+        })
+    
+    index.close()
+    return rows
+
+
+def benchmark_fraud_rules(count: int = 1000, registrations: int = 20000, repeats: int = 3) -> List[Dict[str, Any]]:
+    import tempfile
+    from backend.duplicate_index import DuplicateIndex
+    from backend.fraud_detector import FraudDetector
+    
+    rng = random.Random(7)
+    vocabulary = [f"w{i}" for i in range(5000)]
+    workdir = tempfile.mkdtemp(prefix="deet-fraud-rules-")
+    index = DuplicateIndex(path=os.path.join(workdir, "duplicates.sqlite3"))
+    for offset in range(0, registrations, 1000):
+        index.add_many([
+            (f"REG-{offset + i}", *_synthetic_registration(rng, vocabulary))
+            for i in range(min(1000, registrations - offset))
+        ])
+    
+    applicants = {"low_risk": [], "high_risk": []}
+    for _ in range(count):
+        phone, email, text = _synthetic_registration(rng, vocabulary)
+        skills = ["python"] * rng.randint(1, 10)
+        applicants["low_risk"].append((phone, email, skills, 2, text, 30))
+        applicants["high_risk"].append((
+            f"12345{rng.randrange(10 ** 4)}", "not-an-email", skills * 10, 15, f"{text} guarantee job pay fees now", 22
+        ))
+    
+    full = FraudDetector(duplicate_index=index, short_circuit=False)
+    short = FraudDetector(duplicate_index=index, short_circuit=True)
+    
+    rows = []
+    for group, cases in applicants.items():
+        full_ms, full_reports = _time_call(lambda: [full.analyze(*case) for case in cases], repeats)
+        short_ms, short_reports = _time_call(lambda: [short.analyze(*case) for case in cases], repeats)
+        
+        rule_ms: Dict[str, float] = {}
+        for report in full_reports:
+            for name, elapsed in report.rule_timings.items():
+                rule_ms[name] = rule_ms.get(name, 0.0) + elapsed
+        slowest = max(rule_ms, key=rule_ms.get) if rule_ms else ""
+        
+        rows.append({
+            "applicants": group,
+            "count": count,
+            "full_us": round(full_ms * 1000 / count, 1),
+            "short_circuit_us": round(short_ms * 1000 / count, 1),
+            "speedup": round(full_ms / short_ms, 1),
+            "skipped_per_call": round(sum(len(r.skipped_rules) for r in short_reports) / count, 2),
+            "slowest_rule": f"{slowest} ({rule_ms.get(slowest, 0.0) * 1000 / count:.1f}us)" if slowest else "",
+            "same_labels": all(a.risk_label == b.risk_label for a, b in zip(full_reports, short_reports)),
+        })
+    
+    index.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DEET pipeline benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+    
+    preprocessing = subparsers.add_parser("preprocessing", help="Compare the legacy PIL chain with the NumPy pipeline")
+    preprocessing.add_argument("images", nargs="+")
+    preprocessing.add_argument("--repeats", type=int, default=3)
+    preprocessing.add_argument("--no-ocr", action="store_true")
+    preprocessing.add_argument("--show-text", action="store_true")
+    
+    skills = subparsers.add_parser("skills", help="Compare the skills x words loop with the automaton matcher")
+    skills.add_argument("--scale", type=int, default=10)
+    skills.add_argument("--long-factor", type=int, default=20)
+    skills.add_argument("--repeats", type=int, default=5)
+    
+    gazetteers = subparsers.add_parser("gazetteers", help="Compare substring scans with the compiled gazetteer lookup")
+    gazetteers.add_argument("--scale", type=int, default=20)
+    gazetteers.add_argument("--repeats", type=int, default=20)
+    
+    instances = subparsers.add_parser("instances", help="Compare per-call construction with the shared extractor instances")
+    instances.add_argument("--repeats", type=int, default=200)
+    instances.add_argument("--baseline", help="git ref whose per-call construction to compare against, e.g. HEAD~1")
+    
+    batch = subparsers.add_parser("batch", help="Measure extract_many throughput across worker counts")
+    batch.add_argument("--count", type=int, default=5000)
+    batch.add_argument("--workers", type=int, nargs="+")
+    batch.add_argument("--chunk-size", type=int, default=32)
+    
+    lazy = subparsers.add_parser("lazy", help="Compare extract_all with lazy per-field extraction")
+    lazy.add_argument("--repeats", type=int, default=200)
+    
+    cache = subparsers.add_parser("cache", help="Compare extract_all with cold and warm extraction cache lookups")
+    cache.add_argument("--repeats", type=int, default=200)
+    
+    ner = subparsers.add_parser("ner", help="Compare latency and accuracy of the regex and spaCy NER backends")
+    ner.add_argument("--model", help="spaCy model name or path (defaults to SPACY_MODEL)")
+    ner.add_argument("--n-process", type=int, default=1)
+    ner.add_argument("--count", type=int, default=200)
+    ner.add_argument("--repeats", type=int, default=5)
+    
+    keywords = subparsers.add_parser("keywords", help="Compare per-keyword substring scans with the compiled fraud rule scanner")
+    keywords.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    keywords.add_argument("--regex-ratio", type=float, default=0.05)
+    keywords.add_argument("--long-factor", type=int, default=20)
+    keywords.add_argument("--repeats", type=int, default=5)
+    
+    scoring = subparsers.add_parser("scoring", help="Compare per-row fraud/health scoring with the vectorized DataFrame scorer")
+    scoring.add_argument("--count", type=int, default=1000000)
+    scoring.add_argument("--loop-rows", type=int, default=20000)
+    scoring.add_argument("--parity-rows", type=int, default=5000)
+    scoring.add_argument("--text-ratio", type=float, default=0.1)
+    
+    duplicates = subparsers.add_parser("duplicates", help="Measure duplicate index lookup latency and recall as it grows")
+    duplicates.add_argument("--count", type=int, default=20000)
+    duplicates.add_argument("--lookups", type=int, default=500)
+    duplicates.add_argument("--perturb", type=float, default=0.03, help="Fraction of words changed in near-duplicate probes")
+    
+    rules = subparsers.add_parser("rules", help="Compare running every fraud rule with cost-ordered short-circuiting")
+    rules.add_argument("--count", type=int, default=1000)
+    rules.add_argument("--registrations", type=int, default=20000)
+    rules.add_argument("--repeats", type=int, default=3)
+    
+    args = parser.parse_args()
+    
+    if args.benchmark == "preprocessing":
+        rows = benchmark_preprocessing(args.images, args.repeats, run_ocr=not args.no_ocr)
+        columns = ["image", "pipeline", "input_size", "ocr_size", "preprocess_ms"]
+        if not args.no_ocr:
+            columns += ["ocr_ms", "page_ms", "chars"]
+        _print_rows(rows, columns)
+        
+        if args.show_text and not args.no_ocr:
+            for row in rows:
+                print(f"\n=== {row['image']} [{row['pipeline']}] ===\n{row['text']}")
+    elif args.benchmark == "skills":
+        rows = benchmark_skill_matching(args.scale, args.long_factor, args.repeats)
+        _print_rows(rows, ["skills", "corpus", "legacy_ms", "automaton_ms", "speedup", "build_ms", "identical"])
+    elif args.benchmark == "gazetteers":
+        rows = benchmark_gazetteers(args.scale, args.repeats)
+        _print_rows(rows, ["gazetteer", "entries", "lines", "substring_ms", "compiled_ms", "speedup", "build_ms"])
+    elif args.benchmark == "instances":
+        rows = benchmark_shared_instances(args.repeats, args.baseline)
+        columns = ["stage", "construct_us", "fresh_us", "shared_us"]
+        if args.baseline:
+            columns += ["baseline_us", "speedup"]
+        _print_rows(rows, columns + ["identical"])
+    elif args.benchmark == "batch":
+        rows = benchmark_batch_extraction(args.count, args.workers, args.chunk_size)
+        _print_rows(rows, ["workers", "resumes", "failed", "seconds", "resumes_per_sec"])
+    elif args.benchmark == "lazy":
+        _print_rows(benchmark_lazy_extraction(args.repeats), ["fields", "extract_all_us", "lazy_us", "speedup"])
+    elif args.benchmark == "cache":
+        rows = benchmark_extraction_cache(args.repeats)
+        _print_rows(rows, ["resumes", "extract_all_us", "cold_us", "warm_us", "speedup", "hit_rate"])
+    elif args.benchmark == "ner":
+        rows = benchmark_ner_backends(args.model, args.n_process, args.count, args.repeats)
+        columns = ["backend", "load_ms", "latency_ms", "bulk_per_sec", "accuracy", "full_name_acc", "location_acc"]
+        if any("error" in row for row in rows):
+            columns.append("error")
+        _print_rows(rows, columns)
+    elif args.benchmark == "keywords":
+        rows = benchmark_keyword_scanner(args.sizes, args.regex_ratio, args.long_factor, args.repeats)
+        columns = ["rules", "corpus", "legacy_ms", "automaton_ms", "scanner_ms", "speedup", "build_ms", "hits", "legacy_hits"]
+        _print_rows(rows, columns)
+    elif args.benchmark == "scoring":
+        rows = benchmark_batch_scoring(args.count, args.loop_rows, args.parity_rows, args.text_ratio)
+        columns = ["rows", "details", "text_ratio", "per_row_per_sec", "vectorized_s", "vectorized_per_sec", "speedup"]
+        _print_rows(rows, columns + ["parity_rows", "mismatches"])
+    elif args.benchmark == "duplicates":
+        rows = benchmark_duplicate_index(args.count, args.lookups, args.perturb)
+        _print_rows(rows, ["scenario", "registrations", "build_s", "p50_ms", "p95_ms", "hit_rate"])
+    elif args.benchmark == "rules":
+        rows = benchmark_fraud_rules(args.count, args.registrations, args.repeats)
+        columns = ["applicants", "count", "full_us", "short_circuit_us", "speedup", "skipped_per_call", "slowest_rule"]
+        _print_rows(rows, columns + ["same_labels"])
+
+
+if __name__ == "__main__":
+    main()
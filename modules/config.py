@@ -1,3 +1,5 @@
+import os
+
 SKILLS_LIST = {
     'programming': [
         'python', 'java', 'javascript', 'c++', 'c#', 'ruby', 'go', 'rust', 'swift',
@@ -57,10 +59,168 @@ EXPERIENCE_KEYWORDS = [
     'career', 'internship', 'trainee', 'fresher', 'years', 'months'
 ]
 
-FRAUD_KEYWORDS = [
-    'guarantee job', 'pay fee', 'no interview', 'job without',
-    'immediate joining', 'zero interview', 'direct placement',
-    'refund money', 'registration fee', 'processing fee'
-]
+SECTION_HEADERS = {
+    'contact': [
+        'contact', 'contact details', 'contact information', 'personal details',
+        'personal information', 'personal profile'
+    ],
+    'summary': [
+        'summary', 'professional summary', 'profile', 'profile summary', 'objective',
+        'career objective', 'about me'
+    ],
+    'education': [
+        'education', 'educational qualification', 'educational qualifications', 'education details',
+        'educational background', 'academic qualifications', 'academic details', 'academic background',
+        'academic profile', 'academics', 'qualifications'
+    ],
+    'experience': [
+        'experience', 'work experience', 'professional experience', 'employment',
+        'employment history', 'work history', 'professional background', 'career',
+        'career history', 'internship', 'internships', 'internship experience'
+    ],
+    'skills': [
+        'skills', 'technical skills', 'key skills', 'core skills', 'core competencies',
+        'skill set', 'skillset', 'skills summary', 'technologies', 'tools'
+    ],
+    'projects': [
+        'projects', 'project', 'academic projects', 'personal projects', 'key projects',
+        'project details'
+    ],
+    'other': [
+        'certifications', 'certification', 'certificates', 'courses', 'achievements',
+        'awards', 'languages', 'hobbies', 'interests', 'declaration', 'references'
+    ]
+}
+
+GAZETTEER_DIR = os.environ.get('DEET_GAZETTEER_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gazetteers'))
+GAZETTEER_FILES = {
+    'cities': 'cities.txt',
+    'institutions': 'institutions.txt',
+    'companies': 'companies.txt',
+}
+
+FRAUD_CHECK_SCORES = {
+    'phone_length': 20,
+    'phone_prefix': 15,
+    'email_invalid': 15,
+    'excessive_skills': 15,
+    'experience_age_mismatch': 25,
+    'duplicate_phone': 30,
+    'duplicate_email': 25,
+    'near_duplicate_resume': 20,
+}
+FRAUD_RULE_COSTS = {
+    'skills': 0.1,
+    'experience_age': 0.2,
+    'phone': 1.0,
+    'email': 1.0,
+    'keywords': 10.0,
+    'duplicates': 500.0,
+}
+FRAUD_SHORT_CIRCUIT = os.environ.get('DEET_FRAUD_SHORT_CIRCUIT', '0').lower() in ('1', 'true', 'yes')
+FRAUD_MAX_SKILLS = 50
+FRAUD_MIN_WORKING_AGE = 18
+FRAUD_RISK_MODERATE = 25
+FRAUD_RISK_HIGH = 50
+
+HEALTH_WEIGHTS = {
+    'email': 10,
+    'phone': 10,
+    'education': 20,
+    'experience': 20,
+    'skills': 20,
+    'location': 20,
+}
+HEALTH_TARGET_SKILLS = 5
+HEALTH_POINTS_PER_SKILL = 4
+
+SCORING_CHUNK_ROWS = 65536
+SCORING_PHONE_WIDTH = 32
+SCORING_EMAIL_WIDTH = 96
+
+FRAUD_RULES_DIR = os.environ.get('DEET_FRAUD_RULES_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'fraud_rules'))
+FRAUD_RULES_RELOAD_SECONDS = float(os.environ.get('DEET_FRAUD_RULES_RELOAD_SECONDS', 2.0))
+FRAUD_RULE_DEFAULT_SCORE = 25
+FRAUD_RULE_DEFAULT_SEVERITY = 'high'
+KEYWORD_SCANNER_COMPILE_MIN = 200
+KEYWORD_SCANNER_MIN_LITERAL = 3
+
+DUPLICATE_INDEX_ENABLED = os.environ.get('DEET_DUPLICATE_INDEX', '0').lower() in ('1', 'true', 'yes')
+DUPLICATE_INDEX_PATH = os.environ.get('DEET_DUPLICATE_INDEX_PATH', os.path.join(os.path.expanduser('~'), '.cache', 'deet', 'duplicates.sqlite3'))
+DUPLICATE_HASH_KEY = os.environ.get('DEET_DUPLICATE_HASH_KEY', '')
+DUPLICATE_MINHASH_PERMUTATIONS = 128
+DUPLICATE_LSH_BANDS = 32
+DUPLICATE_SHINGLE_SIZE = 3
+DUPLICATE_MIN_TOKENS = 20
+DUPLICATE_SIMILARITY_THRESHOLD = 0.7
+DUPLICATE_MAX_CANDIDATES = 50
+DUPLICATE_MINHASH_SEED = 7
 
 SPACY_MODEL = 'en_core_web_sm'
+NER_BACKEND = os.environ.get('DEET_NER_BACKEND', 'regex')
+NER_DISABLED_COMPONENTS = ['parser', 'lemmatizer', 'tagger', 'attribute_ruler', 'senter']
+NER_BATCH_SIZE = 32
+NER_N_PROCESS = int(os.environ.get('DEET_NER_PROCESSES', 1))
+NER_MAX_CHARS = 10000
+
+EXTRACTOR_VERSION = 1
+EXTRACTION_CACHE_ENABLED = True
+EXTRACTION_CACHE_MAX_ENTRIES = 512
+EXTRACTION_CACHE_TTL_SECONDS = 3600
+
+METRICS_ENABLED = os.environ.get('DEET_METRICS', '0').lower() in ('1', 'true', 'yes')
+METRICS_EXPORT_PATH = os.environ.get('DEET_METRICS_FILE', '')
+METRICS_WINDOW = 2048
+METRICS_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+
+PIPELINE_PARALLEL_ANALYSIS = True
+PIPELINE_ANALYSIS_WORKERS = 2
+PIPELINE_PARALLEL_MIN_MS = 1.0
+
+BATCH_WORKERS = int(os.environ.get('DEET_BATCH_WORKERS', os.cpu_count() or 1))
+BATCH_CHUNK_SIZE = 32
+BATCH_MAX_PENDING_CHUNKS = 4
+BATCH_MIN_POOL_ITEMS = 64
+BATCH_FILE_EXTENSIONS = ['pdf', 'jpg', 'jpeg', 'png']
+BATCH_FLUSH_RECORDS = 50
+BATCH_FLUSH_SECONDS = 5.0
+
+SERVICE_HOST = os.environ.get('DEET_SERVICE_HOST', '127.0.0.1')
+SERVICE_PORT = int(os.environ.get('DEET_SERVICE_PORT', 8080))
+SERVICE_WORKERS = int(os.environ.get('DEET_SERVICE_WORKERS', os.cpu_count() or 1))
+SERVICE_MAX_QUEUE = int(os.environ.get('DEET_SERVICE_MAX_QUEUE', 16))
+SERVICE_REQUEST_TIMEOUT = float(os.environ.get('DEET_SERVICE_TIMEOUT', 60))
+SERVICE_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+OCR_TESSERACT_CONFIG = '--psm 6 --oem 3'
+OCR_MAX_WORKERS = int(os.environ.get('DEET_OCR_WORKERS', os.cpu_count() or 1))
+PDF_TEXT_LAYER_ENABLED = True
+PDF_TEXT_LAYER_MIN_CHARS = 20
+
+OCR_PREPROCESS_VERSION = 2
+OCR_CLEANUP_VERSION = 2
+OCR_PREPROCESS_MODE = os.environ.get('DEET_OCR_PREPROCESS', 'numpy')
+OCR_TARGET_DPI = 300
+OCR_MAX_UPSCALE = 2.0
+OCR_ASSUMED_PAGE_WIDTH_INCHES = 8.27
+OCR_BINARIZATION = 'sauvola'
+OCR_SAUVOLA_WINDOW = 31
+OCR_SAUVOLA_K = 0.2
+OCR_DENOISE = True
+
+OCR_MIN_LINE_CONFIDENCE = 60.0
+OCR_REOCR_ENABLED = True
+OCR_REOCR_PSM = 7
+OCR_REOCR_SCALE = 2.0
+OCR_REOCR_MAX_LINES = 20
+
+OCR_SKIP_BLANK_PAGES = True
+OCR_BLANK_INK_RATIO = 0.002
+OCR_BLANK_INK_CONTRAST = 60
+OCR_SKIP_DUPLICATE_PAGES = True
+OCR_DUPLICATE_HASH_DISTANCE = 12
+OCR_DUPLICATE_MAX_DIFF = 0.15
+
+OCR_CACHE_ENABLED = True
+OCR_CACHE_DIR = os.environ.get('DEET_OCR_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'deet', 'ocr'))
+OCR_CACHE_MAX_BYTES = 256 * 1024 * 1024
@@ -1,12 +1,13 @@
 import json
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 from modules.schemas import ExtractedData, EvaluationResult, AccuracyReport
 from backend.nlp_extractor import extract_from_text
 from difflib import SequenceMatcher
 
 
 class AccuracyEvaluator:
-    def __init__(self):
+    def __init__(self, extract: Optional[Callable[[str], ExtractedData]] = None):
+        self.extract = extract or extract_from_text
         self.test_cases = self._get_test_cases()
     
     def _get_test_cases(self) -> Dict[str, Dict]:
@@ -249,7 +250,7 @@ Skills: Teaching, Communication, Microsoft Office
         expected = test_case["expected"]
         text = test_case["text"]
         
-        extracted = extract_from_text(text)
+        extracted = self.extract(text)
         
         results = []
         
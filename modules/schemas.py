@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable
 from datetime import datetime
 
 
@@ -42,6 +42,53 @@ class FraudReport:
     fraud_risk_score: int
     risk_label: str
     flags: List[FraudFlag] = field(default_factory=list)
+    skipped_rules: List[str] = field(default_factory=list)
+    rule_timings: Dict[str, float] = field(default_factory=dict, compare=False)
+
+
+@dataclass
+class FraudInput:
+    phone: str
+    email: str
+    skills: List[str]
+    experience_count: int
+    raw_text: str
+    age: Optional[int] = None
+
+
+@dataclass
+class FraudRule:
+    name: str
+    check: Callable[[FraudInput], Tuple[int, List[FraudFlag]]]
+    cost: float
+    weight: int
+    applies: Callable[[FraudInput], bool] = lambda data: True
+
+
+@dataclass
+class KeywordRule:
+    name: str
+    patterns: List[str]
+    is_regex: bool
+    severity: str
+    score: int
+    source: str
+
+
+@dataclass
+class KeywordHit:
+    rule: str
+    matched: str
+    severity: str
+    score: int
+    source: str
+
+
+@dataclass
+class DuplicateMatch:
+    phone_matches: List[str] = field(default_factory=list)
+    email_matches: List[str] = field(default_factory=list)
+    near_duplicates: List[Tuple[str, float]] = field(default_factory=list)
 
 
 @dataclass
@@ -65,6 +112,92 @@ class SubmissionResult:
     payload: Dict[str, Any]
 
 
+@dataclass
+class SectionHeader:
+    section: str
+    line: int
+    offset: int
+
+
+@dataclass
+class OCRWord:
+    text: str
+    confidence: float
+
+
+@dataclass
+class OCRLine:
+    text: str
+    confidence: float
+    bbox: List[int] = field(default_factory=list)
+    words: List[OCRWord] = field(default_factory=list)
+    reocr: bool = False
+
+
+@dataclass
+class PageText:
+    page_number: int
+    text: str
+    source: str
+    duplicate_of: Optional[int] = None
+    confidence: Optional[float] = None
+    lines: List[OCRLine] = field(default_factory=list)
+
+
+@dataclass
+class OCRResult:
+    text: str
+    pages: List[PageText] = field(default_factory=list)
+    skipped_pages: List[int] = field(default_factory=list)
+    confidence: Optional[float] = None
+
+
+@dataclass
+class ProgressiveSnapshot:
+    raw_text: str
+    extracted: ExtractedData
+    health: Optional[HealthScore]
+    fraud: Optional[FraudReport]
+    pages_done: int
+    done: bool
+    error: str = ""
+
+
+@dataclass
+class IncrementalUpdate:
+    extracted: ExtractedData
+    health: HealthScore
+    fraud: FraudReport
+    changed_sections: List[str] = field(default_factory=list)
+    recomputed_fields: List[str] = field(default_factory=list)
+    health_recomputed: bool = False
+    fraud_recomputed: bool = False
+
+
+@dataclass
+class BatchItem:
+    index: int
+    data: Optional[ExtractedData]
+    error: str = ""
+
+
+@dataclass
+class BatchReport:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    workers: int = 1
+    elapsed_seconds: float = 0.0
+    resumes_per_second: float = 0.0
+    skipped: int = 0
+
+
+@dataclass
+class BatchResult:
+    items: List[BatchItem]
+    report: BatchReport
+
+
 @dataclass
 class EvaluationResult:
     resume_name: str
@@ -82,3 +215,25 @@ class AccuracyReport:
     accuracy_percentage: float
     field_wise_accuracy: Dict[str, float]
     results: List[EvaluationResult]
+
+
+@dataclass
+class StageStats:
+    stage: str
+    count: int
+    total_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+
+
+@dataclass
+class PipelineResult:
+    raw_text: str
+    extracted: ExtractedData
+    health: HealthScore
+    fraud: FraudReport
+    timings: Dict[str, float] = field(default_factory=dict)
+    ocr: Optional[OCRResult] = None
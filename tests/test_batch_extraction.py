@@ -0,0 +1,32 @@
+import os
+import multiprocessing
+import pytest
+from backend import nlp_extractor
+from backend.nlp_extractor import BatchExtractor
+from modules.schemas import ExtractedData
+
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork', reason="workers must inherit the patched extractor"
+)
+
+
+class CrashingExtractor:
+    ner = None
+    
+    def extract_all(self, text):
+        if text == "CRASH":
+            os._exit(1)
+        return ExtractedData(raw_text=text)
+
+
+def test_worker_crash_fails_only_the_crashing_item(monkeypatch):
+    monkeypatch.setattr(nlp_extractor, 'get_extractor', lambda: CrashingExtractor())
+    texts = ["a", "b", "CRASH", "c", "d", "e", "f", "g"]
+    
+    result = BatchExtractor(workers=2, chunk_size=3, min_pool_items=1).run(texts)
+    
+    assert [item.index for item in result.items] == list(range(len(texts)))
+    assert [item.data.raw_text for item in result.items if item.data] == [t for t in texts if t != "CRASH"]
+    assert result.items[2].data is None
+    assert result.items[2].error.startswith("BrokenProcessPool")
+    assert (result.report.succeeded, result.report.failed) == (7, 1)
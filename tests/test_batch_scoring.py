@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+from backend.batch_scoring import BatchScorer, fraud_report_at, health_score_at
+from backend.fraud_detector import FraudDetector
+from backend.health_scorer import HealthScorer
+
+ROWS = [
+    ("9876543210", "rahul@example.com", ["python", "sql"], 1, 2, "Hyderabad", 24, ""),
+    ("+91 98765 43210", "priya.k@gmail.com", ["java"] * 12, 2, 0, "", 0, "Guarantee job without interview, pay fee now"),
+    ("5123456789", "bad-email@", [], 0, 9, None, 20, "Registration fee Rs 500 required"),
+    ("98765-4321", None, ["x"] * 60, 0, 0, "Warangal", 35, None),
+    ("౯౮౭౬౫౪౩౨౧౦", "", ["go"], 1, 1, "", 0, "Processing fee of INR 2000 and direct placement"),
+    (None, "x@y.co.in", ["c"] * 5, 3, 11, "Warangal", 24, "zero interview, immediate joining"),
+]
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame(
+        ROWS, columns=["phone", "email", "skills", "education_count", "experience_count", "location", "age", "text"]
+    )
+
+
+def _text(value) -> str:
+    return "" if value is None or (isinstance(value, float) and np.isnan(value)) else str(value)
+
+
+def test_scores_match_the_per_row_classes():
+    scored = BatchScorer().score(_frame())
+    detector = FraudDetector(duplicate_index=None)
+    scorer = HealthScorer()
+    
+    for i, (phone, email, skills, education, experience, location, age, text) in enumerate(ROWS):
+        assert fraud_report_at(scored, i) == detector.analyze(
+            _text(phone), _text(email), skills, experience, _text(text), age
+        ), i
+        assert health_score_at(scored, i) == scorer.calculate(
+            _text(email), _text(phone), education, experience, skills, _text(location)
+        ), i
+
+
+def test_parity_check_finds_no_mismatches():
+    assert BatchScorer().parity_mismatches(_frame()) == []
+
+
+def test_scores_without_details_keep_the_totals():
+    scorer = BatchScorer()
+    full = scorer.score(_frame())
+    summary = scorer.score(_frame(), with_details=False)
+    
+    assert summary['fraud_risk_score'].tolist() == full['fraud_risk_score'].tolist()
+    assert summary['health_score'].tolist() == full['health_score'].tolist()
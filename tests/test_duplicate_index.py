@@ -0,0 +1,48 @@
+import os
+import random
+from backend.duplicate_index import DuplicateIndex
+from backend.fraud_detector import FraudDetector
+
+
+def _text(rng: random.Random, words: int = 120) -> str:
+    return " ".join(f"w{rng.randrange(3000)}" for _ in range(words))
+
+
+def _perturb(rng: random.Random, text: str, ratio: float) -> str:
+    words = text.split()
+    for i in rng.sample(range(len(words)), int(len(words) * ratio)):
+        words[i] = f"x{rng.randrange(10 ** 6)}"
+    return " ".join(words)
+
+
+def test_lookup_does_not_create_the_index(tmp_path):
+    path = tmp_path / "duplicates.sqlite3"
+    index = DuplicateIndex(path=str(path))
+    
+    assert not index.lookup("9876543210", "a@example.com", "some text").phone_matches
+    assert not os.path.exists(path)
+
+
+def test_param_mismatch_skips_the_duplicate_check(tmp_path):
+    path = str(tmp_path / "duplicates.sqlite3")
+    DuplicateIndex(path=path).add("REG-1", "9876543210", "a@example.com")
+    detector = FraudDetector(duplicate_index=DuplicateIndex(path=path, bands=16))
+    
+    report = detector.analyze("9876543210", "a@example.com", [], 0, "")
+    
+    assert report.flags == []
+    assert "bands=32" in detector.duplicate_error
+    assert detector.duplicate_index is None
+
+
+def test_crowded_buckets_still_return_the_closest_registration(tmp_path):
+    rng = random.Random(3)
+    index = DuplicateIndex(path=str(tmp_path / "duplicates.sqlite3"), max_candidates=5)
+    original = _text(rng)
+    
+    index.add_many([(f"FILLER-{i}", "", "", _perturb(rng, original, 0.08)) for i in range(40)])
+    index.add("REG-COPY", raw_text=original)
+    
+    match = index.lookup(raw_text=_perturb(rng, original, 0.02))
+    
+    assert match.near_duplicates[0][0] == "REG-COPY"
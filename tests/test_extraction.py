@@ -0,0 +1,31 @@
+from modules.schemas import PageText
+from backend.ocr_engine import OCREngine
+from backend.nlp_extractor import NLPExtractor
+from backend.sections import SectionIndex
+
+
+def _ocr_text(*pages: str) -> str:
+    return OCREngine().join_pages([PageText(i, text, 'ocr') for i, text in enumerate(pages, 1)])
+
+
+def test_page_markers_do_not_become_the_name():
+    text = _ocr_text(
+        "Rahul Kumar\nrahul@example.com | 9876543210\nHyderabad\n\nSKILLS\nPython, Java",
+        "EXPERIENCE\nSoftware Engineer at Infosys 2019 - 2022"
+    )
+    assert text.startswith("--- Page 1 ---")
+    
+    data = NLPExtractor(ner_backend='regex').extract_all(text)
+    
+    assert data.full_name == "Rahul Kumar"
+    assert data.location == "Hyderabad"
+    assert data.raw_text == text
+
+
+def test_page_markers_keep_line_offsets():
+    text = _ocr_text("Rahul Kumar", "EXPERIENCE\nAnalyst at TCS")
+    index = SectionIndex(text)
+    
+    assert len(index.text) == len(text)
+    assert index.first_line() == "Rahul Kumar"
+    assert "page" not in index.text_lower
@@ -0,0 +1,73 @@
+from backend.extraction_cache import ExtractionCache, copy_extracted
+from backend.nlp_extractor import NLPExtractor
+from modules.schemas import Education, ExtractedData, Experience
+
+RESUME = "Ravi Kumar\nravi@example.com\n9876543210\n\nEDUCATION\nB.Tech, JNTU Hyderabad 2018\n\nSkills: Python, SQL"
+
+
+def _data() -> ExtractedData:
+    return ExtractedData(
+        full_name="Ravi Kumar",
+        education=[Education(institution="JNTU", degree="B.Tech", year="2018")],
+        experience=[Experience(company="Acme", role="Analyst", duration="2019 - 2021")],
+        skills=["python"],
+        raw_skills=["Python"]
+    )
+
+
+def test_copy_extracted_does_not_share_nested_values():
+    data = _data()
+    copied = copy_extracted(data)
+    
+    copied.education[0].institution = "OU"
+    copied.experience.append(Experience(company="Zenith", role="", duration=""))
+    copied.skills.append("sql")
+    copied.raw_skills.clear()
+    
+    assert data == _data()
+
+
+def test_cached_results_are_isolated_from_callers():
+    cache = ExtractionCache()
+    extractor = NLPExtractor(ner_backend='regex')
+    
+    first = cache.extract(extractor, RESUME)
+    first.skills.append("cobol")
+    first.education[0].institution = "edited"
+    second = cache.extract(extractor, RESUME)
+    
+    assert cache.stats()["hits"] == 1
+    assert second == extractor.extract_all(RESUME)
+
+
+def test_whitespace_variants_share_an_entry_but_keep_their_raw_text():
+    cache = ExtractionCache()
+    extractor = NLPExtractor(ner_backend='regex')
+    spaced = RESUME.replace("\n", "  \n")
+    
+    cache.extract(extractor, RESUME)
+    data = cache.extract(extractor, spaced)
+    
+    assert cache.stats()["hits"] == 1
+    assert data.raw_text == spaced
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ExtractionCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.put(key, _data())
+    
+    cache.get("a")
+    cache.put("c", _data())
+    
+    assert cache.get("b") is None
+    assert cache.get("a") == _data()
+    assert cache.stats()["evictions"] == 1
+
+
+def test_expired_entries_are_misses():
+    cache = ExtractionCache(ttl_seconds=-1)
+    cache.put("a", _data())
+    
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
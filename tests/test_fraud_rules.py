@@ -0,0 +1,74 @@
+from backend.fraud_detector import FraudDetector
+from modules.schemas import FraudFlag, FraudRule
+
+HIGH_RISK = ('123', 'bad', [f'skill{i}' for i in range(60)], 0, 'guarantee job and pay fee no interview')
+
+
+def _flag_rule(name, cost, weight, score, ran):
+    def check(data):
+        ran.append(name)
+        return score, [FraudFlag(check=name, severity="high", message=name)]
+    return FraudRule(name, check, cost, weight)
+
+
+def test_default_analysis_keeps_the_full_score_and_flags():
+    report = FraudDetector(duplicate_index=None).analyze(*HIGH_RISK)
+    
+    assert report.fraud_risk_score == 100
+    assert report.risk_label == "High"
+    assert [flag.check for flag in report.flags] == [
+        "phone_invalid", "email_invalid", "excessive_skills",
+        "suspicious_keyword", "suspicious_keyword", "suspicious_keyword"
+    ]
+    assert report.skipped_rules == []
+
+
+def test_rules_run_by_cost_per_weight():
+    detector = FraudDetector(duplicate_index=None)
+    ran = []
+    detector.rules = []
+    detector.register_rule(_flag_rule('slow_heavy', 10.0, 100, 0, ran))
+    detector.register_rule(_flag_rule('cheap_light', 1.0, 5, 0, ran))
+    detector.register_rule(_flag_rule('weightless', 0.1, 0, 0, ran))
+    detector.register_rule(_flag_rule('cheap_heavy', 1.0, 50, 0, ran))
+    
+    detector.analyze('', '', [], 0, '')
+    
+    assert ran == ['cheap_heavy', 'slow_heavy', 'cheap_light', 'weightless']
+
+
+def test_flags_keep_registration_order():
+    detector = FraudDetector(duplicate_index=None)
+    ran = []
+    detector.rules = []
+    detector.register_rule(_flag_rule('first', 5.0, 10, 1, ran))
+    detector.register_rule(_flag_rule('second', 1.0, 10, 1, ran))
+    
+    report = detector.analyze('', '', [], 0, '')
+    
+    assert ran == ['second', 'first']
+    assert [flag.check for flag in report.flags] == ['first', 'second']
+
+
+def test_short_circuit_skips_only_after_reaching_high():
+    detector = FraudDetector(duplicate_index=None, short_circuit=True)
+    ran = []
+    detector.rules = []
+    detector.register_rule(_flag_rule('moderate', 1.0, 50, 25, ran))
+    detector.register_rule(_flag_rule('high', 2.0, 50, 25, ran))
+    detector.register_rule(_flag_rule('late', 3.0, 50, 25, ran))
+    
+    report = detector.analyze('', '', [], 0, '')
+    
+    assert ran == ['moderate', 'high']
+    assert report.skipped_rules == ['late']
+    assert report.fraud_risk_score == 50
+    assert report.risk_label == "High"
+
+
+def test_short_circuit_keeps_the_label():
+    full = FraudDetector(duplicate_index=None, short_circuit=False).analyze(*HIGH_RISK)
+    short = FraudDetector(duplicate_index=None, short_circuit=True).analyze(*HIGH_RISK)
+    
+    assert short.risk_label == full.risk_label
+    assert short.skipped_rules == ['keywords']
@@ -0,0 +1,47 @@
+import pytest
+from backend.gazetteer import get_gazetteer
+from backend.nlp_extractor import NLPExtractor
+
+
+@pytest.mark.parametrize("line", [
+    "Built a persistent cache layer with less reliance on the release cadence",
+    "Handled infor desk tickets and hetero datasets",
+    "Worked on sap extraction, hal mounting and bel fittings for ey tooling",
+    "Helped citi planning team as a hp service volunteer",
+])
+def test_ordinary_words_are_not_companies(line):
+    assert get_gazetteer('companies').first(line.lower(), line) == ""
+
+
+@pytest.mark.parametrize("line, company", [
+    ("Consultant at SAP Labs, Bangalore 2019 - 2021", "SAP"),
+    ("Audit Associate, EY 2020 - 2022", "EY"),
+    ("Design Engineer at HAL Hyderabad", "HAL"),
+    ("Analyst - Persistent Systems 2018 - 2020", "Persistent Systems"),
+    ("Engineer, Reliance Jio 2017 - 2019", "Reliance Industries"),
+])
+def test_company_aliases_still_match(line, company):
+    assert get_gazetteer('companies').first(line.lower(), line) == company
+
+
+def test_experience_line_with_common_words_has_no_gazetteer_company():
+    extractor = NLPExtractor(ner_backend='regex')
+    line = "Software Engineer - improved persistent storage reliance 2019 - 2021"
+    
+    entry = extractor.experience_entry(line, line.lower())
+    
+    assert entry.company == ""
+
+
+def test_institution_acronym_matches_only_in_capitals():
+    institutions = get_gazetteer('institutions')
+    
+    assert institutions.first("b.sc from ou, hyderabad", "B.Sc from OU, Hyderabad") == "OU"
+    assert not institutions.search("b.sc, then a year in toulouse ou paris", "B.Sc, then a year in Toulouse ou Paris")
+
+
+def test_education_uses_exact_case_institution_aliases():
+    extractor = NLPExtractor(ner_backend='regex')
+    lines = ["B.Sc Computers 2016 - 2019", "OU, Hyderabad"]
+    
+    assert extractor._extract_institution(lines, [line.lower() for line in lines], 0) == "OU, Hyderabad"
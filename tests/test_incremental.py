@@ -0,0 +1,98 @@
+from typing import List
+from backend.fraud_detector import FraudDetector
+from backend.incremental import IncrementalExtractor
+from backend.keyword_scanner import KeywordScanner
+from backend.ner import Entity, SpacyNER
+from backend.nlp_extractor import NLPExtractor
+from modules.config import FRAUD_RULES_DIR
+
+
+class StubNER(SpacyNER):
+    def __init__(self, phrases):
+        super().__init__()
+        self.phrases = phrases
+    
+    def entities(self, text: str) -> List[Entity]:
+        return [
+            (label, phrase, text.find(phrase))
+            for label, phrase in self.phrases
+            if phrase in text
+        ]
+    
+    def pipe(self, texts, n_process=None):
+        for text in texts:
+            yield self.entities(text)
+
+
+RESUME = """curriculum vitae of ravi teja
+ravi.teja@example.com | 9876543210
+Residing near Kukatpally
+
+EXPERIENCE
+Backend work at Zenith Softlabs 2019 - 2022
+Data Analyst at Acme 2022 - present
+
+SKILLS
+Python, SQL
+"""
+
+
+def _entity_extractor() -> NLPExtractor:
+    extractor = NLPExtractor(ner_backend='regex')
+    extractor.ner = StubNER([
+        ('person', 'ravi teja'),
+        ('location', 'Kukatpally'),
+        ('organization', 'Zenith Softlabs'),
+    ])
+    return extractor
+
+
+def test_incremental_matches_full_extraction_with_entities():
+    extractor = _entity_extractor()
+    incremental = IncrementalExtractor(extractor=extractor, fraud_detector=FraudDetector(duplicate_index=None))
+    
+    expected = extractor.extract_all(RESUME)
+    first = incremental.update(RESUME).extracted
+    
+    assert expected.full_name == "ravi teja"
+    assert expected.location == "Kukatpally"
+    assert expected.experience[0].company == "Zenith Softlabs"
+    assert first == expected
+    
+    edited = RESUME.replace("Acme", "Acme Corp")
+    assert incremental.update(edited).extracted == extractor.extract_all(edited)
+
+
+class CountingScanner(KeywordScanner):
+    def __init__(self):
+        super().__init__(FRAUD_RULES_DIR, reload_seconds=0)
+        self.scans = 0
+    
+    def scan(self, text: str):
+        self.scans += 1
+        return super().scan(text)
+
+
+def test_fraud_report_scans_keywords_once_per_change():
+    scanner = CountingScanner()
+    incremental = IncrementalExtractor(
+        extractor=NLPExtractor(ner_backend='regex'),
+        fraud_detector=FraudDetector(duplicate_index=None, keyword_scanner=scanner)
+    )
+    
+    assert incremental.update(RESUME).fraud_recomputed
+    assert scanner.scans == 1
+    
+    assert not incremental.update(RESUME).fraud_recomputed
+    assert scanner.scans == 1
+    
+    edited = RESUME + "\nDirect placement after registration fee\n"
+    update = incremental.update(edited)
+    assert update.fraud_recomputed
+    assert scanner.scans == 2
+    assert [flag.message for flag in update.fraud.flags] == [
+        flag.message for flag in FraudDetector(duplicate_index=None).analyze(
+            update.extracted.phone, update.extracted.email, update.extracted.skills,
+            len(update.extracted.experience), edited
+        ).flags
+    ]
@@ -0,0 +1,129 @@
+import re
+import time
+import pytest
+from backend.fraud_detector import FraudDetector
+from backend.keyword_scanner import KeywordScanner, RuleSet, leading_literals, required_literals
+from modules.config import FRAUD_RULES_DIR
+from modules.schemas import KeywordRule
+
+
+@pytest.fixture(scope="module")
+def scanner():
+    return KeywordScanner(FRAUD_RULES_DIR, reload_seconds=0)
+
+
+@pytest.mark.parametrize("text", [
+    "Current pay Rs 25000 per month, expected pay Rs. 30,000",
+    "Completed security training and placement preparation",
+    "Stipend: pay INR 12000 during internship",
+])
+def test_salary_and_training_lines_are_not_flagged(scanner, text):
+    assert scanner.scan(text) == []
+
+
+@pytest.mark.parametrize("text, matched", [
+    ("Pay Rs. 5,000 security deposit to confirm", "rs. 5,000 security deposit"),
+    ("Training charges of INR 2000 required", "training charges of inr 2000"),
+])
+def test_fee_requests_are_flagged(scanner, text, matched):
+    assert [hit.matched for hit in scanner.scan(text)] == [matched]
+
+
+@pytest.mark.parametrize("text", [
+    "Registration fee Rs 500 required",
+    "Pay Rs. 5,000 registration fee to confirm",
+    "Processing fee of INR 2000 required",
+])
+def test_fee_line_is_counted_once(scanner, text):
+    assert len(scanner.scan(text)) == 1
+    
+    report = FraudDetector(keyword_scanner=scanner).analyze('', '', [], 0, text)
+    assert report.fraud_risk_score == 25
+    assert report.risk_label == "Moderate"
+    assert [flag.check for flag in report.flags] == ["suspicious_keyword"]
+
+
+def test_only_the_original_keywords_are_phrase_rules(scanner):
+    phrases = [rule.name for rule in scanner.ruleset.rules if not rule.is_regex]
+    assert phrases == [
+        'guarantee job', 'pay fee', 'no interview', 'job without',
+        'immediate joining', 'zero interview', 'direct placement',
+        'refund money', 'registration fee', 'processing fee'
+    ]
+
+
+@pytest.mark.parametrize("compile_min", [0, 1000])
+def test_anchored_regexes_match_like_search(compile_min):
+    patterns = [r"\bjob\s+(?:in|within)\s+\d+\s+days?", r"(?<=\s)sql\b", r"(?:data|web)\s+develop\w*", r"\bpython\b"]
+    rules = [KeywordRule(pattern, [pattern], True, "high", 25, "test") for pattern in patterns]
+    text = "Pythonic web developer. SQL, python; job within 30 days and a second job in 5 days. mysql"
+    expected = [re.search(pattern, text.lower()).group(0) for pattern in patterns]
+    assert [hit.matched for hit in RuleSet(rules, compile_min=compile_min).scan(text)] == expected
+
+
+def _write_rules(path, lines):
+    path.write_text("# version: 3\n# severity: medium\n# score: 10\n" + "\n".join(lines) + "\n", encoding='utf-8')
+
+
+def test_rule_files_are_reloaded_when_they_change(tmp_path):
+    rules_file = tmp_path / 'rules.txt'
+    _write_rules(rules_file, ["pay fee"])
+    scanner = KeywordScanner(str(tmp_path), reload_seconds=0.001)
+    
+    assert [hit.rule for hit in scanner.scan("please pay fee and send money")] == ["pay fee"]
+    assert scanner.versions() == {'rules.txt': '3'}
+    
+    _write_rules(rules_file, ["pay fee", "send money|transfer money"])
+    time.sleep(0.01)
+    hits = scanner.scan("please pay fee and send money")
+    
+    assert [(hit.rule, hit.severity, hit.score) for hit in hits] == [("pay fee", "medium", 10), ("send money", "medium", 10)]
+
+
+def test_broken_rule_file_keeps_the_previous_rules(tmp_path):
+    rules_file = tmp_path / 'rules.txt'
+    _write_rules(rules_file, ["pay fee"])
+    scanner = KeywordScanner(str(tmp_path), reload_seconds=0.001)
+    
+    _write_rules(rules_file, ["pay fee", "re:(unclosed"])
+    time.sleep(0.01)
+    
+    assert [hit.rule for hit in scanner.scan("pay fee")] == ["pay fee"]
+    assert "rules.txt:5" in scanner.last_error
+
+
+def test_required_and_leading_literals():
+    pattern = r"\bguarantee[ds]?\s+(?:government|govt\.?)\s+(?:job|post)"
+    
+    assert required_literals(pattern) == [['guarantee'], ['gov'], ['job', 'post']]
+    assert leading_literals(pattern) == ['guarantee']
+    assert leading_literals(r"(?:rs\.?|inr)\s*\d+\s*fee") == []
+    assert required_literals(r"\d+\s*%") == []
+
+
+class CountingRegex:
+    def __init__(self, regex):
+        self.regex = regex
+        self.calls = 0
+    
+    def search(self, *args):
+        self.calls += 1
+        return self.regex.search(*args)
+    
+    def match(self, *args):
+        self.calls += 1
+        return self.regex.match(*args)
+
+
+@pytest.mark.parametrize("compile_min", [0, 1000])
+def test_regex_runs_only_when_every_required_literal_is_present(compile_min):
+    pattern = r"\bguarantee[ds]?\s+(?:government|govt\.?)\s+job"
+    ruleset = RuleSet([KeywordRule(pattern, [pattern], True, "high", 25, "test")], compile_min=compile_min)
+    regex = ruleset.regexes[0] = CountingRegex(ruleset.regexes[0])
+    
+    assert ruleset.scan("guaranteed placement support for a private job") == []
+    assert regex.calls == 0
+    
+    text = "we guarantee results. guaranteed govt job for all"
+    assert [hit.matched for hit in ruleset.scan(text)] == ["guaranteed govt job"]
+    assert regex.calls == 2
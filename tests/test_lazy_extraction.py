@@ -0,0 +1,46 @@
+import copy
+import dataclasses
+from backend.extraction_cache import copy_extracted
+from backend.nlp_extractor import LazyExtractedData, get_extractor
+
+TEXT = "Ravi Kumar\nravi.kumar@example.com\n+91 98765 43210\nHyderabad\n\nSkills\nPython, SQL, Excel"
+
+
+def test_repr_does_not_compute_fields():
+    data = LazyExtractedData(TEXT)
+    assert data.email == "ravi.kumar@example.com"
+    
+    text = repr(data)
+    
+    assert data.computed_fields() == ['email']
+    assert "email='ravi.kumar@example.com'" in text
+    assert "skills=<lazy>" in text
+
+
+def test_replace_keeps_other_fields():
+    data = LazyExtractedData(TEXT)
+    
+    changed = dataclasses.replace(data, phone='1')
+    
+    assert changed.phone == '1'
+    assert changed.raw_text == TEXT
+    assert changed.email == get_extractor().extract_all(TEXT).email
+    assert data.phone != '1'
+
+
+def test_copy_extracted_accepts_lazy_data():
+    data = LazyExtractedData(TEXT)
+    
+    copied = copy_extracted(data)
+    copied.skills.append("Cobol")
+    
+    assert copied == dataclasses.replace(get_extractor().extract_all(TEXT), skills=copied.skills)
+    assert "Cobol" not in data.skills
+
+
+def test_constructor_accepts_dataclass_fields():
+    data = LazyExtractedData(raw_text=TEXT, full_name="Someone Else")
+    
+    assert data.full_name == "Someone Else"
+    assert data.computed_fields() == ['full_name']
+    assert copy.deepcopy(data) == data
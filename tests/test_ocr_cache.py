@@ -0,0 +1,70 @@
+import os
+from backend.ocr_cache import OCRCache
+from backend.ocr_engine import OCREngine
+from modules.schemas import OCRLine, OCRResult, OCRWord, PageText
+
+
+def _result(text: str) -> OCRResult:
+    line = OCRLine(text=text, confidence=91.5, bbox=[1, 2, 3, 4], words=[OCRWord(text=text, confidence=91.5)])
+    return OCRResult(text=text, pages=[PageText(1, text, 'ocr', confidence=91.5, lines=[line])], confidence=91.5)
+
+
+def _age(cache: OCRCache, key: str, seconds_ago: float):
+    path = cache._path(key)
+    stamp = os.path.getmtime(path) - seconds_ago
+    os.utime(path, (stamp, stamp))
+
+
+def test_key_depends_on_content_and_config(tmp_path):
+    cache = OCRCache(str(tmp_path))
+    
+    assert cache.make_key(b'resume', 'png|a') == cache.make_key(b'resume', 'png|a')
+    assert cache.make_key(b'resume', 'png|a') != cache.make_key(b'resume!', 'png|a')
+    assert cache.make_key(b'resume', 'png|a') != cache.make_key(b'resume', 'png|b')
+    assert OCREngine(reocr=True).config_signature('a.png') != OCREngine(reocr=False).config_signature('a.png')
+    assert OCREngine().config_signature('a.png') != OCREngine().config_signature('a.pdf')
+
+
+def test_round_trip_keeps_pages_and_lines(tmp_path):
+    cache = OCRCache(str(tmp_path))
+    key = cache.make_key(b'resume', 'png')
+    
+    assert cache.get(key) is None
+    cache.put(key, _result("Ravi Kumar"))
+    
+    assert cache.get(key) == _result("Ravi Kumar")
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_eviction_removes_least_recently_used_entries(tmp_path):
+    cache = OCRCache(str(tmp_path / 'cache'), max_bytes=10 ** 9)
+    keys = [cache.make_key(name.encode(), 'png') for name in ('a', 'b', 'c')]
+    for age, key in zip((30, 20, 10), keys):
+        cache.put(key, _result("x" * 200))
+        _age(cache, key, age)
+    
+    assert cache.get(keys[0]) is not None
+    entry_size = os.path.getsize(cache._path(keys[0]))
+    cache.max_bytes = entry_size * 3
+    cache.put(cache.make_key(b'd', 'png'), _result("x" * 200))
+    
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_engine_reuses_cached_result(tmp_path, monkeypatch):
+    engine = OCREngine(cache=OCRCache(str(tmp_path)))
+    calls = []
+    
+    def process(file_bytes, filename):
+        calls.append(filename)
+        return _result("Ravi Kumar")
+    
+    monkeypatch.setattr(engine, '_process_document', process)
+    
+    first = engine.process_document(b'image bytes', 'resume.png')
+    second = engine.process_document(b'image bytes', 'resume.png')
+    
+    assert calls == ['resume.png']
+    assert second == first
@@ -0,0 +1,32 @@
+from modules.schemas import ExtractedData, Education
+from backend.progressive import merge_user_edits
+
+
+def test_merge_keeps_user_edits_and_takes_new_fields():
+    baseline = ExtractedData(full_name="Rahul", email="", skills=["python"])
+    current = ExtractedData(full_name="Rahul Kumar", email="", skills=["python"])
+    incoming = ExtractedData(full_name="Rahul K", email="rahul@example.com", skills=["python", "java"])
+    
+    merged = merge_user_edits(incoming, baseline, current)
+    
+    assert merged.full_name == "Rahul Kumar"
+    assert merged.email == "rahul@example.com"
+    assert merged.skills == ["python", "java"]
+
+
+def test_merge_ignores_blank_placeholder_rows():
+    baseline = ExtractedData()
+    current = ExtractedData(education=[Education(institution="", degree="", year="")])
+    incoming = ExtractedData(education=[Education(institution="JNTU", degree="B.Tech", year="2020")])
+    
+    merged = merge_user_edits(incoming, baseline, current)
+    
+    assert merged.education == incoming.education
+
+
+def test_merge_keeps_fields_the_user_cleared():
+    baseline = ExtractedData(location="Hyderabad")
+    current = ExtractedData(location="")
+    incoming = ExtractedData(location="Warangal")
+    
+    assert merge_user_edits(incoming, baseline, current).location == ""
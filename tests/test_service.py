@@ -0,0 +1,111 @@
+import http.client
+import json
+import threading
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from backend.metrics import Metrics, get_metrics
+from backend import service as service_module
+from backend.service import ResumeService, process_text
+
+
+@pytest.fixture(scope="module")
+def server_port():
+    service = ResumeService(workers=1, max_queue=1, timeout=60)
+    server = service.start('127.0.0.1', 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+    service.shutdown()
+
+
+def _post(port: int, path: str, body: bytes, content_length: str):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    conn.putrequest('POST', path)
+    conn.putheader('Content-Length', content_length)
+    conn.endheaders()
+    if body:
+        conn.send(body)
+    response = conn.getresponse()
+    payload = json.loads(response.read())
+    conn.close()
+    return response.status, payload
+
+
+@pytest.mark.parametrize("content_length", ["-1", "abc"])
+def test_invalid_content_length_is_rejected(server_port, content_length):
+    status, payload = _post(server_port, '/v1/extract/text', b'', content_length)
+    
+    assert status == 400
+    assert "Content-Length" in payload["error"]
+
+
+def test_corrupt_image_is_a_client_error(server_port):
+    body = b'this is not a png'
+    status, payload = _post(server_port, '/v1/extract/file?filename=resume.png', body, str(len(body)))
+    
+    assert status == 400
+
+
+def test_worker_stage_timings_reach_the_parent(monkeypatch):
+    metrics = get_metrics()
+    monkeypatch.setattr(metrics, 'enabled', True)
+    metrics.reset()
+    service = ResumeService(workers=1, max_queue=0, timeout=60)
+    try:
+        result = service.run(process_text, "Ravi Kumar\nravi@example.com\n9876543210\nSkills: Python, SQL")
+    finally:
+        service.shutdown()
+    
+    assert result["extracted"]["email"] == "ravi@example.com"
+    assert 'fraud.analyze' in {stats.stage for stats in metrics.stage_stats()}
+    metrics.reset()
+
+
+def test_metrics_merge_adds_drained_state():
+    worker = Metrics(enabled=True, buckets=[0.1, 1.0])
+    worker.observe('ocr', 0.05)
+    worker.observe('ocr', 2.0)
+    worker.inc('ocr.pages', 3)
+    parent = Metrics(enabled=True, buckets=[0.1, 1.0])
+    parent.observe('ocr', 0.5)
+    
+    parent.merge(worker.drain())
+    
+    stats = parent.stage_stats()[0]
+    assert (stats.stage, stats.count, stats.max_ms) == ('ocr', 3, 2000.0)
+    assert parent.counters() == {'ocr.pages': 3}
+    assert worker.stage_stats() == [] and worker.counters() == {}
+
+
+def test_failed_resubmit_releases_the_slot(monkeypatch):
+    class BrokenPool:
+        def submit(self, *args):
+            raise BrokenProcessPool("worker died")
+        
+        def shutdown(self, **kwargs):
+            pass
+    
+    class FailingPool(BrokenPool):
+        def submit(self, *args):
+            raise RuntimeError("cannot start workers")
+    
+    service = ResumeService(workers=1, max_queue=0)
+    service._pool.shutdown()
+    service._pool = BrokenPool()
+    monkeypatch.setattr(service, '_new_pool', FailingPool)
+    
+    with pytest.raises(RuntimeError):
+        service.submit(process_text, "text")
+    
+    assert service.health()["in_flight"] == 0
+    assert service._slots.acquire(blocking=False)
+
+
+def test_worker_pipeline_uses_a_single_ocr_thread(monkeypatch):
+    monkeypatch.setattr(service_module, '_worker_pipeline', None)
+    monkeypatch.delenv('OMP_THREAD_LIMIT', raising=False)
+    
+    service_module._init_worker()
+    
+    assert service_module._worker_pipeline.ocr_engine.max_workers == 1
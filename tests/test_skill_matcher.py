@@ -0,0 +1,57 @@
+import random
+import re
+import pytest
+from backend.automaton import KeywordAutomaton
+from backend.skill_matcher import SkillMatcher
+from modules.config import ALL_SKILLS
+from modules.evaluation import AccuracyEvaluator
+
+
+def _loop_skills(text, skills):
+    text_lower = text.lower()
+    found_skills = set()
+    words = re.findall(r'\b\w+\b', text_lower)
+    for skill in skills:
+        if skill in text_lower:
+            found_skills.add(skill)
+        elif len(skill) > 3:
+            for word in words:
+                if word.startswith(skill[:4]) and len(word) >= len(skill) - 2:
+                    found_skills.add(skill)
+    return found_skills
+
+
+def _random_texts(count: int):
+    rng = random.Random(5)
+    vocabulary = [s for s in ALL_SKILLS if s] + ["managed", "team", "pythonic", "javas", "reacting", "c", "go", "r"]
+    for _ in range(count):
+        words = [rng.choice(vocabulary) for _ in range(rng.randint(5, 40))]
+        yield rng.choice([" ", ", ", "\n"]).join(
+            word[:rng.randint(1, len(word))] if rng.random() < 0.3 else word for word in words
+        )
+
+
+@pytest.mark.parametrize("text", [case["text"] for case in AccuracyEvaluator().test_cases.values()])
+def test_matcher_matches_the_loop_on_sample_resumes(text):
+    assert SkillMatcher().match(text) == _loop_skills(text, [s.lower() for s in ALL_SKILLS if s])
+
+
+def test_matcher_matches_the_loop_on_random_text():
+    matcher = SkillMatcher()
+    skills = [s.lower() for s in ALL_SKILLS if s]
+    for text in _random_texts(200):
+        assert matcher.match(text) == _loop_skills(text, skills), text
+
+
+def test_automaton_reports_overlapping_patterns():
+    automaton = KeywordAutomaton(["he", "she", "hers", "his"])
+    
+    assert automaton.find_all("ushers") == {"he", "she", "hers"}
+    assert sorted(automaton.iter_matches("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+def test_automaton_word_boundary():
+    automaton = KeywordAutomaton(["java", "sql"], word_boundary=True)
+    
+    assert automaton.find_all("javascript, mysql and java; sql") == {"java", "sql"}
+    assert automaton.find_all("javascript, mysql") == set()